@@ -0,0 +1,82 @@
+"""Measure thread-pool batch encoding throughput per thread count.
+
+Encodes the same batch of collect calls with 1, 2, 4... threads and prints the
+throughput and speedup of each run. Threads only run Python code in parallel
+on a free-threaded build, and only with several CPUs, so any scaling has to
+be measured there, e.g.:
+
+    python benchmarks/threaded_encoding.py
+    python3.13t -X gil=0 benchmarks/threaded_encoding.py
+
+Requires the package to be installed (pip install -e .).
+"""
+
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import List
+
+from python_bot_utils.encoding_cache import EncodingCache
+from python_bot_utils.parallel import encode_call_batch_threaded
+
+COLLECT_SIGNATURE = "collect((uint256,address,uint128,uint128))"
+RECIPIENT = "0x9a33c2fe2515b87ee5c36819d82126e1e66273c6"
+MAX_UINT128 = 2**128 - 1
+
+
+def _thread_counts(max_threads: int) -> List[int]:
+    counts = [1]
+    while counts[-1] * 2 <= max_threads:
+        counts.append(counts[-1] * 2)
+    if counts[-1] != max_threads:
+        counts.append(max_threads)
+    return counts
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=20_000)
+    parser.add_argument("--threads", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--chunk-size", type=int, default=256)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument(
+        "--cache", action="store_true", help="Encode through a sharded EncodingCache"
+    )
+    options = parser.parse_args()
+
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", lambda: True)()
+    print(f"Python {sys.version.split()[0]}, GIL {'on' if is_gil_enabled else 'off'}")
+    print(f"{options.rows} rows, {os.cpu_count()} CPUs")
+
+    rows = [
+        [(token_id, RECIPIENT, MAX_UINT128, MAX_UINT128)]
+        for token_id in range(options.rows)
+    ]
+    baseline = None
+    for threads in _thread_counts(options.threads):
+        best = float("inf")
+        with ThreadPoolExecutor(threads) as executor:
+            for _ in range(options.repeat):
+                cache = EncodingCache(shards=threads) if options.cache else None
+                start = time.perf_counter()
+                encode_call_batch_threaded(
+                    COLLECT_SIGNATURE,
+                    "collect",
+                    rows,
+                    chunk_size=options.chunk_size,
+                    cache=cache,
+                    trusted=True,
+                    executor=executor,
+                )
+                best = min(best, time.perf_counter() - start)
+        baseline = baseline or best
+        print(
+            f"{threads:>3} threads: {options.rows / best:>10,.0f} calls/s, "
+            f"speedup {baseline / best:.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -16,6 +16,8 @@ setup(
     ],
     extras_require={
         "dev": [],
-        "test": [],
+        "test": ["numpy", "hypothesis"],
+        # Vectorized checks on NumPy array columns
+        "numpy": ["numpy"],
     },
 )
@@ -1,30 +1,86 @@
 from .call_encoder import encode_call
+from .calldata_cost import choose_encodings, estimate_calldata_costs
+from .encoding_cache import EncodingCache, encode_call_batch
+from .multicall import decode_aggregate3, encode_aggregate3, execute_aggregate3
+from .parallel import encode_call_batch_threaded
+from .registry import Field, FunctionSpec, ProtocolSpec, register_protocol
+from .resubmission import ResubmissionCache
+from .selector_db import compile_selector_db, lookup_selector
+from .transactions import (
+    FeePolicy,
+    NonceManager,
+    build_transactions,
+    sign_transactions,
+)
 from .uniswap_calls import (
+    compute_pool_address,
+    compute_pool_addresses,
     encode_burn,
     encode_collect,
     encode_decreaseLiquidity,
     encode_increaseLiquidity,
     encode_mint,
+    encode_mint_callback_data,
+    encode_multicall,
     pool_encode_burn,
     pool_encode_collect,
     pool_encode_mint,
 )
 from .uniswap_calls.router import encode_exactInputSingle
+from .validation import ArgumentValidationError, validate_batch, validate_columns
+from .warm_cache import load_encoder_cache, save_encoder_cache, warm_start
 
 # Define what gets imported with "from package import *"
 __all__ = [
     "encode_call",
+    # Memoization
+    "EncodingCache",
+    "encode_call_batch",
+    "encode_call_batch_threaded",
+    # Multicall3 read batching
+    "encode_aggregate3",
+    "decode_aggregate3",
+    "execute_aggregate3",
+    # Transaction building and batch signing
+    "FeePolicy",
+    "NonceManager",
+    "build_transactions",
+    "sign_transactions",
+    "ResubmissionCache",
+    # Calldata gas costs
+    "estimate_calldata_costs",
+    "choose_encodings",
+    # Warm-start cache of compiled encoders
+    "warm_start",
+    "load_encoder_cache",
+    "save_encoder_cache",
     # Position manager functions
     "encode_mint",
     "encode_burn",
     "encode_collect",
     "encode_increaseLiquidity",
     "encode_decreaseLiquidity",
+    "encode_multicall",
     # Router functions
     "encode_exactInputSingle",
     # Pool functions (with prefixed names to avoid conflicts)
     "pool_encode_mint",
     "pool_encode_burn",
     "pool_encode_collect",
+    "encode_mint_callback_data",
+    "compute_pool_address",
+    "compute_pool_addresses",
+    # Selector database
+    "compile_selector_db",
+    "lookup_selector",
+    # Protocol registry
+    "Field",
+    "FunctionSpec",
+    "ProtocolSpec",
+    "register_protocol",
+    # Argument validation
+    "ArgumentValidationError",
+    "validate_batch",
+    "validate_columns",
 ]
 __version__ = "0.1.2"
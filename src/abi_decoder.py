@@ -0,0 +1,168 @@
+"""Columnar decoding of static ABI words.
+
+Many blobs with the same static layout (event data, topics, view function
+return data) are decoded field by field into columns instead of one object per
+blob. With NumPy installed, integers that fit in 64 bits are sliced out of one
+2-D byte array with vectorized views; wider integers become object arrays.
+Without NumPy, columns are array.array (small integers) or lists.
+"""
+
+from array import array
+from typing import Any, Dict, Iterator, List, Mapping, Sequence, Tuple, Union
+
+from .abi_types import int_bounds
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy is optional
+    np = None  # type: ignore[assignment]
+
+HexOrBytes = Union[str, bytes, bytearray, memoryview]
+
+
+def to_bytes(value: HexOrBytes) -> bytes:
+    """Convert a 0x-prefixed hex string or bytes-like value to bytes."""
+    if isinstance(value, str):
+        return bytes.fromhex(value[2:] if value.startswith("0x") else value)
+    return bytes(value)
+
+
+def to_python(value: Any) -> Any:
+    """Convert a NumPy scalar to the equivalent Python value."""
+    return value.item() if np is not None and isinstance(value, np.generic) else value
+
+
+def decode_word(type_: str, word: bytes) -> Any:
+    """
+    Decode a single 32 byte word.
+
+    Args:
+        type_: Static Solidity type (uintN, intN, address, bool, bytesN)
+        word: The 32 byte word
+
+    Returns:
+        int, bool, bytes or a lowercase 0x-prefixed address
+    """
+    bounds = int_bounds(type_)
+    if bounds is not None:
+        return int.from_bytes(word, "big", signed=bounds[0] < 0)
+    if type_ == "address":
+        return "0x" + word[12:32].hex()
+    if type_ == "bool":
+        return word[31] != 0
+    if type_.startswith("bytes") and type_ != "bytes":
+        return word[: int(type_[5:])]
+    raise ValueError(f"Unsupported static type: {type_}")
+
+
+def _fits_int64(type_: str) -> bool:
+    bounds = int_bounds(type_)
+    return bounds is not None and -(2**63) <= bounds[0] and bounds[1] < 2**63
+
+
+def decode_word_columns(
+    fields: Sequence[Tuple[str, str]], blobs: Sequence[bytes]
+) -> Dict[str, Any]:
+    """
+    Decode blobs made of static 32 byte words into one column per field.
+
+    Args:
+        fields: (name, type) of each word, in order
+        blobs: Blobs of exactly 32 * len(fields) bytes
+
+    Returns:
+        dict: Column per field name. Integers of 64 bits or less are int64
+        arrays, wider integers object arrays (or lists without NumPy), bools
+        bool arrays and addresses lists of lowercase hex strings
+    """
+    size = 32 * len(fields)
+    for blob in blobs:
+        if len(blob) != size:
+            raise ValueError(f"Expected {size} bytes per blob, got {len(blob)}")
+
+    joined = b"".join(blobs)
+    count = len(blobs)
+    columns: Dict[str, Any] = {}
+
+    if np is not None:
+        rows = np.frombuffer(joined, dtype=np.uint8).reshape(count, size)
+
+    for position, (name, type_) in enumerate(fields):
+        start = 32 * position
+        end = start + 32
+        if np is not None and _fits_int64(type_):
+            # The low 8 bytes of a word hold any int64, two's complement
+            low_start = end - 8
+            low = np.ascontiguousarray(rows[:, low_start:end])
+            columns[name] = low.view(">i8").reshape(count).astype(np.int64)
+        elif np is not None and type_ == "bool":
+            columns[name] = rows[:, end - 1] != 0
+        else:
+            values: List[Any] = [
+                decode_word(type_, word) for word in _words(joined, start, size)
+            ]
+            columns[name] = _column(type_, values)
+    return columns
+
+
+def _words(joined: bytes, start: int, stride: int) -> Iterator[bytes]:
+    """Yield the word at start of every blob of a joined buffer."""
+    for offset in range(start, len(joined), stride):
+        end = offset + 32
+        yield joined[offset:end]
+
+
+def _column(type_: str, values: List[Any]) -> Any:
+    """Pack decoded values into the column type used for type_."""
+    if _fits_int64(type_):
+        return array("q", values)
+    if np is not None and int_bounds(type_) is not None:
+        column = np.empty(len(values), dtype=object)
+        column[:] = values
+        return column
+    return values
+
+
+def index_column(indexes: List[int]) -> Any:
+    """Return positions as an int64 column."""
+    if np is not None:
+        return np.asarray(indexes, dtype=np.int64)
+    return array("q", indexes)
+
+
+def rows_from_columns(
+    columns: Mapping[str, Any], fields: Sequence[str], **constants: Any
+) -> Iterator[Dict[str, Any]]:
+    """
+    Turn decoded columns back into one keyword-argument dict per row.
+
+    Column names follow the encoders' parameter names, so rows can be passed
+    straight to them. NumPy scalars are converted to Python values. Rows
+    whose "success" column is False (failed calls of a batch, decoded as
+    zeros) are skipped.
+
+    Args:
+        columns: Decoded columns
+        fields: Columns to include in each row
+        **constants: Extra keyword arguments repeated in every row
+
+    Yields:
+        dict: Keyword arguments for one successful row
+
+    Example:
+        >>> for kwargs in rows_from_columns(
+        ...     positions, ["token_id", "liquidity"], amount0_min=0, amount1_min=0,
+        ...     deadline=1640995200,
+        ... ):
+        ...     encode_decreaseLiquidity(**kwargs)
+    """
+    selected = [(field, columns[field]) for field in fields]
+    count = len(selected[0][1]) if selected else 0
+    success = columns.get("success")
+    for index in range(count):
+        if success is not None and not success[index]:
+            continue
+        row = dict(constants)
+        for field, column in selected:
+            row[field] = to_python(column[index])
+        yield row
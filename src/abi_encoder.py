@@ -0,0 +1,336 @@
+"""Native head/tail ABI encoder.
+
+Types are compiled once into a tree of encoders whose static head sizes are
+known up front. Encoding a value first measures the dynamic tails, then writes
+heads and tails in a single pass into a presized, zero-filled buffer.
+
+Supports uintN/intN, address, bool, bytesN, bytes, string, T[], T[k] and
+tuples (nested arbitrarily), producing the same bytes as eth_abi.encode.
+Other static types eth_abi accepts (fixedMxN, ufixedMxN, function) are
+encoded by eth_abi, one word at a time.
+"""
+
+import operator
+import re
+from typing import Any, Dict, List, Sequence, Tuple
+
+import eth_abi
+from eth_abi.grammar import parse as parse_abi_type
+
+from .abi_types import int_bounds, is_tuple_type, parse_array_type, parse_tuple_type
+
+_BYTES_N_RE = re.compile(r"^bytes(\d+)$")
+
+# Lock-free reads; misses are published with setdefault (see compile_types)
+_compiled_types: Dict[Tuple[str, ...], "TupleEncoder"] = {}
+
+
+def _ceil32(size: int) -> int:
+    return (size + 31) & ~31
+
+
+def _write_offset(buf: bytearray, pos: int, offset: int) -> None:
+    """Write an offset or length word."""
+    end = pos + 32
+    buf[pos:end] = offset.to_bytes(32, "big")
+
+
+def _to_bytes(value: Any) -> bytes:
+    """Accept raw bytes or a 0x-prefixed hex string."""
+    if isinstance(value, str):
+        return bytes.fromhex(value[2:] if value.startswith("0x") else value)
+    return bytes(value)
+
+
+class BaseEncoder:
+    """Encoder for one ABI type.
+
+    Attributes:
+        type_str: The canonical type string
+        dynamic: Whether the type is encoded in the tail
+        static_size: Encoded size of a static type (32 for dynamic types,
+            which only occupy an offset word in the head)
+    """
+
+    type_str: str = ""
+    dynamic: bool = False
+    static_size: int = 32
+
+    def size(self, value: Any) -> int:
+        """Return the full encoded size of a value."""
+        return self.static_size
+
+    def write(self, buf: bytearray, pos: int, value: Any) -> int:
+        """Write a value at pos and return the position after it."""
+        raise NotImplementedError
+
+
+class IntEncoder(BaseEncoder):
+    def __init__(self, type_str: str, low: int, high: int) -> None:
+        self.type_str = type_str
+        self.low = low
+        self.high = high
+        self.signed = low < 0
+
+    def write(self, buf: bytearray, pos: int, value: Any) -> int:
+        # Like eth_abi, reject bools and floats rather than truncating them;
+        # operator.index still accepts NumPy integers
+        if isinstance(value, bool):
+            raise TypeError(f"Expected int for {self.type_str}, got bool")
+        try:
+            value = operator.index(value)
+        except TypeError:
+            raise TypeError(
+                f"Expected int for {self.type_str}, got {type(value).__name__}"
+            ) from None
+        if not self.low <= value <= self.high:
+            raise ValueError(f"Value {value} out of range for {self.type_str}")
+        end = pos + 32
+        buf[pos:end] = value.to_bytes(32, "big", signed=self.signed)
+        return end
+
+
+class AddressEncoder(BaseEncoder):
+    type_str = "address"
+
+    def write(self, buf: bytearray, pos: int, value: Any) -> int:
+        raw = _to_bytes(value)
+        if len(raw) != 20:
+            raise ValueError(f"Invalid address: {value!r}")
+        start = pos + 12
+        end = pos + 32
+        buf[start:end] = raw
+        return end
+
+
+class BoolEncoder(BaseEncoder):
+    type_str = "bool"
+
+    def write(self, buf: bytearray, pos: int, value: Any) -> int:
+        if not isinstance(value, bool):
+            raise TypeError(f"Expected bool, got {type(value)}")
+        buf[pos + 31] = value
+        return pos + 32
+
+
+class FixedBytesEncoder(BaseEncoder):
+    def __init__(self, type_str: str, length: int) -> None:
+        self.type_str = type_str
+        self.length = length
+
+    def write(self, buf: bytearray, pos: int, value: Any) -> int:
+        raw = _to_bytes(value)
+        if len(raw) > self.length:
+            raise ValueError(f"Value too long for {self.type_str}: {value!r}")
+        end = pos + len(raw)
+        buf[pos:end] = raw
+        return pos + 32
+
+
+class BytesEncoder(BaseEncoder):
+    """Encoder for bytes and string: a length word followed by padded data."""
+
+    dynamic = True
+
+    def __init__(self, type_str: str) -> None:
+        self.type_str = type_str
+
+    def _raw(self, value: Any) -> bytes:
+        if self.type_str == "string":
+            if not isinstance(value, str):
+                raise TypeError(f"Expected str, got {type(value)}")
+            return value.encode("utf-8")
+        return _to_bytes(value)
+
+    def size(self, value: Any) -> int:
+        return 32 + _ceil32(len(self._raw(value)))
+
+    def write(self, buf: bytearray, pos: int, value: Any) -> int:
+        raw = self._raw(value)
+        start = pos + 32
+        end = start + len(raw)
+        buf[pos:start] = len(raw).to_bytes(32, "big")
+        buf[start:end] = raw
+        return start + _ceil32(len(raw))
+
+
+class TupleEncoder(BaseEncoder):
+    """Encoder for tuples: the heads of every component, then the tails."""
+
+    def __init__(self, type_str: str, components: Sequence[BaseEncoder]) -> None:
+        self.type_str = type_str
+        self.components = list(components)
+        self.dynamic = any(component.dynamic for component in self.components)
+        # Head size of the tuple, computed once at compile time
+        self.head_size = sum(
+            32 if component.dynamic else component.static_size
+            for component in self.components
+        )
+        self.static_size = 32 if self.dynamic else self.head_size
+
+    def size(self, value: Any) -> int:
+        if not self.dynamic:
+            return self.head_size
+        size = self.head_size
+        for component, item in zip(self.components, value):
+            if component.dynamic:
+                size += component.size(item)
+        return size
+
+    def write(self, buf: bytearray, pos: int, value: Any) -> int:
+        if len(value) != len(self.components):
+            raise ValueError(
+                f"Expected {len(self.components)} values for {self.type_str}, "
+                f"got {len(value)}"
+            )
+        head = pos
+        tail = pos + self.head_size
+        for component, item in zip(self.components, value):
+            if component.dynamic:
+                _write_offset(buf, head, tail - pos)
+                tail = component.write(buf, tail, item)
+                head += 32
+            else:
+                head = component.write(buf, head, item)
+        return tail
+
+    def encode(self, values: Sequence[Any]) -> bytes:
+        """Encode a sequence of values into a new buffer."""
+        buf = bytearray(self.size(values))
+        self.write(buf, 0, values)
+        return bytes(buf)
+
+
+class ArrayEncoder(BaseEncoder):
+    """Encoder for T[] (length-prefixed) and T[k] arrays."""
+
+    def __init__(self, type_str: str, element: BaseEncoder, length: Any) -> None:
+        self.type_str = type_str
+        self.element = element
+        self.length = length
+        self.dynamic = length is None or element.dynamic
+        self.static_size = 32 if self.dynamic else element.static_size * length
+
+    def _items_size(self, value: Sequence[Any]) -> int:
+        if not self.element.dynamic:
+            return self.element.static_size * len(value)
+        return 32 * len(value) + sum(self.element.size(item) for item in value)
+
+    def size(self, value: Any) -> int:
+        if not self.dynamic:
+            return self.static_size
+        size = self._items_size(value)
+        return size + 32 if self.length is None else size
+
+    def write(self, buf: bytearray, pos: int, value: Any) -> int:
+        if self.length is None:
+            _write_offset(buf, pos, len(value))
+            pos += 32
+        elif len(value) != self.length:
+            raise ValueError(
+                f"Expected {self.length} values for {self.type_str}, got {len(value)}"
+            )
+
+        element = self.element
+        if not element.dynamic:
+            for item in value:
+                pos = element.write(buf, pos, item)
+            return pos
+
+        head = pos
+        tail = pos + 32 * len(value)
+        for item in value:
+            _write_offset(buf, head, tail - pos)
+            tail = element.write(buf, tail, item)
+            head += 32
+        return tail
+
+
+class EthAbiEncoder(BaseEncoder):
+    """Encoder delegating a static basic type (e.g. fixed128x18) to eth_abi."""
+
+    def __init__(self, type_str: str) -> None:
+        self.type_str = type_str
+
+    def write(self, buf: bytearray, pos: int, value: Any) -> int:
+        end = pos + 32
+        buf[pos:end] = eth_abi.encode([self.type_str], [value])
+        return end
+
+
+def compile_type(type_str: str) -> BaseEncoder:
+    """
+    Compile a single ABI type into an encoder.
+
+    Args:
+        type_str: Solidity type, e.g. "uint256", "bytes", "(address,uint24)[]"
+
+    Returns:
+        BaseEncoder: Encoder for the type
+    """
+    array = parse_array_type(type_str)
+    if array is not None:
+        element_type, length = array
+        return ArrayEncoder(type_str, compile_type(element_type), length)
+
+    if is_tuple_type(type_str):
+        components = [compile_type(field) for field in parse_tuple_type(type_str)]
+        return TupleEncoder(type_str, components)
+
+    bounds = int_bounds(type_str)
+    if bounds is not None:
+        return IntEncoder(type_str, *bounds)
+
+    if type_str == "address":
+        return AddressEncoder()
+    if type_str == "bool":
+        return BoolEncoder()
+    if type_str in ("bytes", "string"):
+        return BytesEncoder(type_str)
+
+    bytes_match = _BYTES_N_RE.match(type_str)
+    if bytes_match and 1 <= int(bytes_match.group(1)) <= 32:
+        return FixedBytesEncoder(type_str, int(bytes_match.group(1)))
+
+    # Static basic types without a native encoder are left to eth_abi
+    if eth_abi.is_encodable_type(type_str) and not parse_abi_type(type_str).is_dynamic:
+        return EthAbiEncoder(type_str)
+
+    raise ValueError(f"Unsupported ABI type: {type_str}")
+
+
+def compile_types(types: Sequence[str]) -> TupleEncoder:
+    """
+    Compile a list of parameter types into a (cached) tuple encoder.
+
+    Args:
+        types: Parameter types, e.g. ["address", "int24", "bytes"]
+
+    Returns:
+        TupleEncoder: Encoder taking one value per parameter
+    """
+    key = tuple(types)
+    encoder = _compiled_types.get(key)
+    if encoder is None:
+        components: List[BaseEncoder] = [compile_type(type_) for type_ in key]
+        encoder = TupleEncoder(f"({','.join(key)})", components)
+        encoder = _compiled_types.setdefault(key, encoder)
+    return encoder
+
+
+def encode_abi(types: Sequence[str], values: Sequence[Any]) -> bytes:
+    """
+    ABI-encode values, equivalent to eth_abi.encode(types, values).
+
+    Args:
+        types: Parameter types
+        values: One value per parameter
+
+    Returns:
+        bytes: The encoded parameters
+
+    Example:
+        >>> encode_abi(["int24", "bytes"], [-1, "0x1234"]).hex()
+        'ffff...ffff0000...00400000...00021234...'
+    """
+    return compile_types(types).encode(values)
@@ -0,0 +1,125 @@
+"""Solidity type-string parsing helpers shared by the encoders and validators."""
+
+import re
+from typing import List, Optional, Tuple
+
+_SIGNATURE_RE = re.compile(r"^(\w+)\((.*)\)$")
+_ARRAY_RE = re.compile(r"^(.*)\[(\d*)\]$")
+_INT_RE = re.compile(r"^(u?)int(\d*)$")
+
+
+def split_types(types_str: str) -> List[str]:
+    """
+    Split a comma separated list of types, handling nested parentheses.
+
+    Args:
+        types_str: Types without the outer parentheses, e.g. "address,(uint256,bool)"
+
+    Returns:
+        list: Top-level types, e.g. ["address", "(uint256,bool)"]
+    """
+    types: List[str] = []
+    current_type = ""
+    paren_depth = 0
+
+    for char in types_str:
+        if char == "(":
+            paren_depth += 1
+            current_type += char
+        elif char == ")":
+            paren_depth -= 1
+            current_type += char
+        elif char == "," and paren_depth == 0:
+            # We're at the top level and found a comma
+            # - end of current type
+            types.append(current_type.strip())
+            current_type = ""
+        else:
+            current_type += char
+
+    # Add the last type
+    if current_type.strip():
+        types.append(current_type.strip())
+
+    return types
+
+
+def parse_function_signature(signature: str) -> Tuple[str, List[str]]:
+    """
+    Parse a function signature to extract function name and parameter types.
+
+    Handles nested parentheses for tuple/struct types.
+
+    Args:
+        signature: Function signature like "mint((address,uint256),uint256)"
+
+    Returns:
+        tuple: (function_name, parameter_types_list)
+    """
+    match = _SIGNATURE_RE.match(signature)
+    if not match:
+        raise ValueError(f"Invalid function signature: {signature}")
+
+    return match.group(1), split_types(match.group(2))
+
+
+def is_tuple_type(type_: str) -> bool:
+    """Return True for tuple (struct) types such as "(address,uint256)"."""
+    return type_.startswith("(") and type_.endswith(")")
+
+
+def parse_tuple_type(type_: str) -> List[str]:
+    """
+    Return the field types of a tuple type.
+
+    Args:
+        type_: Tuple type like "(address,(uint256,bool))"
+
+    Returns:
+        list: Field types, e.g. ["address", "(uint256,bool)"]
+    """
+    return split_types(type_[1:-1])
+
+
+def parse_array_type(type_: str) -> Optional[Tuple[str, Optional[int]]]:
+    """
+    Split an array type into its element type and length.
+
+    Args:
+        type_: Array type like "uint256[]" or "(address,bool)[3]"
+
+    Returns:
+        tuple: (element_type, length) where length is None for dynamic arrays,
+        or None if type_ is not an array type
+    """
+    if not type_.endswith("]"):
+        return None
+    match = _ARRAY_RE.match(type_)
+    if not match:
+        raise ValueError(f"Invalid array type: {type_}")
+    length = match.group(2)
+    return match.group(1), int(length) if length else None
+
+
+def int_bounds(type_: str) -> Optional[Tuple[int, int]]:
+    """
+    Return the inclusive (min, max) range of an integer type.
+
+    Args:
+        type_: Integer type like "uint128" or "int24" ("uint"/"int" mean 256 bits)
+
+    Returns:
+        tuple: (min, max), or None if type_ is not an integer type
+
+    Raises:
+        ValueError: If the width isn't a multiple of 8 in [8, 256]
+    """
+    match = _INT_RE.match(type_)
+    if not match:
+        return None
+    bits = int(match.group(2) or 256)
+    if bits % 8 or not 8 <= bits <= 256:
+        raise ValueError(f"Invalid integer type: {type_}")
+    if match.group(1):
+        return 0, 2**bits - 1
+    return -(2 ** (bits - 1)), 2 ** (bits - 1) - 1
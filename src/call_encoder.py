@@ -1,11 +1,13 @@
 """EVM call data encoder module for python-bot-utils - Fixed version."""
 
-import re
-from typing import Any, List, Sequence, TypedDict, Union, cast
+from typing import Any, Dict, List, NamedTuple, Sequence, TypedDict, Union, cast
 
-import eth_abi
 from web3 import Web3
 
+from .abi_encoder import TupleEncoder, compile_types
+from .abi_types import parse_array_type, parse_function_signature, parse_tuple_type
+from .validation import validate_arguments
+
 
 class ABIInput(TypedDict):
     type: str
@@ -18,60 +20,63 @@ class ABIFunction(TypedDict, total=False):
     inputs: List[ABIInput]
 
 
-def parse_function_signature(signature: str) -> tuple[str, List[str]]:
-    """
-    Parse a function signature to extract function name and parameter types.
+class CompiledFunction(NamedTuple):
+    """Per-signature state derived once and reused by encode_call."""
+
+    signature: str
+    name: str
+    selector: bytes
+    param_types: List[str]
+    encoder: TupleEncoder
+
+
+# Read without a lock (single dict lookups are thread-safe, with or without
+# the GIL); a miss compiles outside any lock and publishes with setdefault
+_compiled_functions: Dict[str, CompiledFunction] = {}
 
-    Handles nested parentheses for tuple/struct types.
+
+def compile_function(function_signature: str) -> CompiledFunction:
+    """
+    Parse a function signature and build its selector and encoder (cached).
 
     Args:
-        signature: Function signature like "mint((address,uint256),uint256)"
+        function_signature: Function signature like "burn(int24,int24,uint128)"
 
     Returns:
-        tuple: (function_name, parameter_types_list)
+        CompiledFunction: The selector, parameter types and compiled encoder
     """
-    # Extract function name
-    match = re.match(r"^(\w+)\((.*)\)$", signature)
-    if not match:
-        raise ValueError(f"Invalid function signature: {signature}")
-
-    function_name = match.group(1)
-    params_str = match.group(2)
-
-    if not params_str:
-        return function_name, []
-
-    # Parse parameter types, handling nested parentheses
-    param_types = []
-    current_param = ""
-    paren_depth = 0
-
-    for char in params_str:
-        if char == "(":
-            paren_depth += 1
-            current_param += char
-        elif char == ")":
-            paren_depth -= 1
-            current_param += char
-        elif char == "," and paren_depth == 0:
-            # We're at the top level and found a comma
-            # - end of current parameter
-            param_types.append(current_param.strip())
-            current_param = ""
-        else:
-            current_param += char
+    compiled = _compiled_functions.get(function_signature)
+    if compiled is None:
+        name, param_types = parse_function_signature(function_signature)
+        compiled = CompiledFunction(
+            signature=function_signature,
+            name=name,
+            # First 4 bytes of the keccak hash
+            selector=bytes(Web3.keccak(text=function_signature)[:4]),
+            param_types=param_types,
+            encoder=compile_types(param_types),
+        )
+        # First writer wins, so racing threads all share one compiled state
+        compiled = _compiled_functions.setdefault(function_signature, compiled)
+    return compiled
 
-    # Add the last parameter
-    if current_param.strip():
-        param_types.append(current_param.strip())
 
-    return function_name, param_types
+def get_compiled_functions() -> List[CompiledFunction]:
+    """Return the state of every signature compiled so far."""
+    return list(_compiled_functions.values())
+
+
+def add_compiled_functions(compiled_functions: Sequence[CompiledFunction]) -> None:
+    """Register precompiled signatures (e.g. loaded from a warm-start cache)."""
+    for compiled in compiled_functions:
+        _compiled_functions.setdefault(compiled.signature, compiled)
 
 
 def encode_call(
     abi_or_signature: Union[List[ABIFunction], Sequence[ABIFunction], str],
     function_name: str,
     args: List[Any],
+    trusted: bool = False,
 ) -> str:
     """
     Encode an Ethereum contract function call.
@@ -82,10 +87,15 @@ def encode_call(
         (e.g., "transfer(address,uint256)" or "mint((address,uint256),uint256)")
         function_name: Name of the function to call
         args: List of arguments to pass to the function
+        trusted: Skip argument validation (for hot paths whose inputs were
+        already checked, e.g. with validation.validate_batch)
 
     Returns:
         str: Encoded call data with 0x prefix
 
+    Raises:
+        ArgumentValidationError: If an argument is out of range for its type
+
     Examples:
         >>> # Using function signature
         >>> encode_call(
@@ -122,7 +132,6 @@ def encode_call(
         '0xa9059cbb0000...'
     """
     # Case 1: ABI was provided
-    param_types: List[str] = []
     function_signature: str = ""
 
     if isinstance(abi_or_signature, (list, dict)):
@@ -157,35 +166,57 @@ def encode_call(
     # Case 2: Function signature was provided
     else:
         function_signature = str(abi_or_signature)
-        # FIXED: Use the new parser that handles nested parentheses
-        parsed_name, param_types = parse_function_signature(function_signature)
 
-        # Verify the function name matches
-        if parsed_name != function_name:
-            raise ValueError(
-                f"Function name mismatch: signature has '{parsed_name}' but expected '{function_name}'"
-            )
+    # Selector, parameter types and encoder are derived once per signature
+    compiled = compile_function(function_signature)
+
+    # Verify the function name matches
+    if compiled.name != function_name:
+        raise ValueError(
+            f"Function name mismatch: signature has '{compiled.name}' but expected '{function_name}'"
+        )
 
-    # Get function selector (first 4 bytes of keccak hash)
-    function_selector = Web3.keccak(text=function_signature)[:4].hex()
+    return encode_compiled(compiled, args, trusted=trusted)
+
+
+def encode_compiled(
+    compiled: CompiledFunction, args: Sequence[Any], trusted: bool = False
+) -> str:
+    """
+    Encode a call with an already compiled function (see compile_function).
+
+    Args:
+        compiled: Compiled function signature
+        args: List of arguments to pass to the function
+        trusted: Skip argument validation
+
+    Returns:
+        str: Encoded call data with 0x prefix
+
+    Raises:
+        ArgumentValidationError: If any argument (or their count) is invalid
+    """
+    # Report every invalid argument (and a wrong argument count) at once,
+    # on the arguments as given, before any conversion can fail on them
+    if not trusted:
+        validate_arguments(compiled.param_types, args)
+    elif len(args) != len(compiled.param_types):
+        raise ValueError(
+            f"{compiled.signature} takes {len(compiled.param_types)} "
+            f"argument(s), got {len(args)}"
+        )
 
     # Process arguments - Enhanced to handle tuple types
     processed_args: List[Any] = []
-    for i, (type_, value) in enumerate(zip(param_types, args)):
+    for type_, value in zip(compiled.param_types, args):
         processed_arg = process_argument(type_, value)
         processed_args.append(processed_arg)
 
     # Encode parameters
-    try:
-        encoded_params = eth_abi.encode(param_types, processed_args).hex()
-    except Exception as e:
-        print(f"Error encoding parameters: {e}")
-        print(f"Parameter types: {param_types}")
-        print(f"Processed arguments: {processed_args}")
-        raise
+    encoded_params = compiled.encoder.encode(processed_args)
 
     # Combine selector with encoded parameters
-    encoded_data = f"0x{function_selector}{encoded_params}"
+    encoded_data = f"0x{compiled.selector.hex()}{encoded_params.hex()}"
     return encoded_data
 
 
@@ -198,9 +229,20 @@ def process_argument(type_: str, value: Any) -> Any:
         value: The value to process
 
     Returns:
-        Processed value suitable for eth_abi.encode
+        Processed value suitable for the ABI encoder
     """
-    if type_ == "address":
+    # Handle array types (checked first: "uint256[]" also starts with "uint")
+    array = parse_array_type(type_)
+    if array is not None:
+        if not isinstance(value, (list, tuple)):
+            raise ValueError(
+                f"Expected list/tuple for array type {type_}, got {type(value)}"
+            )
+
+        element_type = array[0]
+        return [process_argument(element_type, item) for item in value]
+
+    elif type_ == "address":
         return Web3.to_checksum_address(value)
 
     # Handle uint/int types
@@ -211,32 +253,24 @@ def process_argument(type_: str, value: Any) -> Any:
         else:
             return value
 
+    # Handle bytes/bytesN given as 0x-prefixed hex strings
+    elif type_.startswith("bytes"):
+        if isinstance(value, str):
+            digits = value[2:] if value.startswith("0x") else value
+            # Unlike HexBytes, don't silently left-pad odd-length hex
+            if len(digits) % 2:
+                raise ValueError(f"Odd-length hex string for {type_}: {value!r}")
+            return bytes.fromhex(digits)
+        else:
+            return value
+
     # Handle tuple types (structs)
     elif type_.startswith("(") and type_.endswith(")"):
         if not isinstance(value, (tuple, list)):
             raise ValueError(f"Expected tuple/list for type {type_}, got {type(value)}")
 
         # Parse the tuple type to get individual field types
-        inner_types_str = type_[1:-1]  # Remove outer parentheses
-        inner_types = []
-        current_type = ""
-        paren_depth = 0
-
-        for char in inner_types_str:
-            if char == "(":
-                paren_depth += 1
-                current_type += char
-            elif char == ")":
-                paren_depth -= 1
-                current_type += char
-            elif char == "," and paren_depth == 0:
-                inner_types.append(current_type.strip())
-                current_type = ""
-            else:
-                current_type += char
-
-        if current_type.strip():
-            inner_types.append(current_type.strip())
+        inner_types = parse_tuple_type(type_)
 
         # Process each field in the tuple
         processed_tuple = []
@@ -246,16 +280,6 @@ def process_argument(type_: str, value: Any) -> Any:
 
         return tuple(processed_tuple)
 
-    # Handle array types
-    elif type_.endswith("[]"):
-        if not isinstance(value, (list, tuple)):
-            raise ValueError(
-                f"Expected list/tuple for array type {type_}, got {type(value)}"
-            )
-
-        element_type = type_[:-2]  # Remove "[]"
-        return [process_argument(element_type, item) for item in value]
-
     # Default: return as-is
     else:
         return value
@@ -0,0 +1,278 @@
+"""Calldata gas cost estimation and cheapest encoding variant selection.
+
+Calldata bytes are paid for on their own: 4 gas per zero byte and 16 per
+nonzero byte on L1 (EIP-2028), and roughly by compressed size on rollups.
+Costs of a whole batch are derived from three per-call counts (size, zero
+bytes, zero runs) computed over one joined buffer, with NumPy when available.
+"""
+
+import re
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+from .abi_decoder import HexOrBytes, to_bytes
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy is optional
+    np = None  # type: ignore[assignment]
+
+ZERO_BYTE_GAS = 4
+NONZERO_BYTE_GAS = 16
+# Intrinsic gas of a transaction, paid once per transaction of a variant
+TRANSACTION_BASE_GAS = 21_000
+
+_ZERO_RUN = re.compile(b"\x00+")
+
+
+class L2CostModel(NamedTuple):
+    """Zero-run aware approximation of rollup batch compression.
+
+    Nonzero bytes are assumed incompressible, and each run of zero bytes
+    (ABI padding, small integers, empty words) compresses to zero_run_bytes
+    bytes. The estimated size is charged gas_per_byte.
+
+    Args:
+        gas_per_byte: Gas per compressed byte
+        zero_run_bytes: Compressed size of one run of zero bytes
+        overhead_bytes: Fixed compressed size added per call
+    """
+
+    gas_per_byte: int = NONZERO_BYTE_GAS
+    zero_run_bytes: int = 2
+    overhead_bytes: int = 0
+
+
+def l1_calldata_gas(data: HexOrBytes) -> int:
+    """L1 calldata gas of one call: 4 per zero byte, 16 per nonzero byte."""
+    raw = to_bytes(data)
+    zeros = raw.count(0)
+    return ZERO_BYTE_GAS * zeros + NONZERO_BYTE_GAS * (len(raw) - zeros)
+
+
+def _join(calls: Sequence[HexOrBytes]) -> Tuple[bytes, List[int]]:
+    blobs = [to_bytes(call) for call in calls]
+    offsets = [0]
+    for blob in blobs:
+        offsets.append(offsets[-1] + len(blob))
+    return b"".join(blobs), offsets
+
+
+def calldata_counts(buffer: bytes, offsets: Sequence[int]) -> Tuple[Any, Any, Any]:
+    """
+    Count size, zero bytes and zero runs of every call of a joined buffer.
+
+    Call i is buffer[offsets[i]:offsets[i + 1]], as in the buffers built by
+    the batch encoders and transactions.SignedBatch.
+
+    Args:
+        buffer: Calls packed back to back
+        offsets: len(calls) + 1 boundaries into buffer
+
+    Returns:
+        tuple: (sizes, zero_bytes, zero_runs), as int64 NumPy arrays when
+        NumPy is installed, lists otherwise
+    """
+    if np is None:
+        view = memoryview(buffer)
+        sizes, zeros, runs = [], [], []
+        for index in range(len(offsets) - 1):
+            start = offsets[index]
+            end = offsets[index + 1]
+            blob = bytes(view[start:end])
+            sizes.append(len(blob))
+            zeros.append(blob.count(0))
+            runs.append(len(_ZERO_RUN.findall(blob)))
+        return sizes, zeros, runs
+
+    bounds = np.asarray(offsets, dtype=np.int64)
+    is_zero = np.frombuffer(buffer, dtype=np.uint8) == 0
+    # A run starts at a zero byte that follows a nonzero byte or a call boundary
+    run_start = is_zero.copy()
+    run_start[1:] &= ~is_zero[:-1]
+    starts = bounds[:-1]
+    starts = starts[starts < len(buffer)]
+    run_start[starts] = is_zero[starts]
+
+    zero_sums = np.concatenate(([0], np.cumsum(is_zero, dtype=np.int64)))
+    run_sums = np.concatenate(([0], np.cumsum(run_start, dtype=np.int64)))
+    sizes = np.diff(bounds)
+    zeros = zero_sums[bounds[1:]] - zero_sums[bounds[:-1]]
+    runs = run_sums[bounds[1:]] - run_sums[bounds[:-1]]
+    return sizes, zeros, runs
+
+
+def estimate_calldata_costs(
+    calls: Sequence[HexOrBytes], l2_model: Optional[L2CostModel] = None
+) -> Dict[str, Any]:
+    """
+    Estimate L1 and L2 calldata costs of many calls at once.
+
+    Args:
+        calls: Encoded calls (hex strings or bytes)
+        l2_model: L2 compression model (defaults to L2CostModel())
+
+    Returns:
+        dict: Columns "size", "zero_bytes", "zero_runs", "l1_gas", "l2_bytes"
+        and "l2_gas" (NumPy arrays when NumPy is installed, lists otherwise)
+    """
+    model = l2_model or L2CostModel()
+    buffer, offsets = _join(calls)
+    sizes, zeros, runs = calldata_counts(buffer, offsets)
+
+    if np is not None:
+        l1_gas = ZERO_BYTE_GAS * zeros + NONZERO_BYTE_GAS * (sizes - zeros)
+        l2_bytes = sizes - zeros + model.zero_run_bytes * runs + model.overhead_bytes
+        l2_gas = model.gas_per_byte * l2_bytes
+    else:
+        l1_gas = [
+            ZERO_BYTE_GAS * zero + NONZERO_BYTE_GAS * (size - zero)
+            for size, zero in zip(sizes, zeros)
+        ]
+        l2_bytes = [
+            size - zero + model.zero_run_bytes * run + model.overhead_bytes
+            for size, zero, run in zip(sizes, zeros, runs)
+        ]
+        l2_gas = [model.gas_per_byte * size for size in l2_bytes]
+    return {
+        "size": sizes,
+        "zero_bytes": zeros,
+        "zero_runs": runs,
+        "l1_gas": l1_gas,
+        "l2_bytes": l2_bytes,
+        "l2_gas": l2_gas,
+    }
+
+
+class VariantChoice(NamedTuple):
+    """Cheapest encoding variant of one intent.
+
+    Calldata gas and per transaction gas are kept apart: with an L2 model
+    the former is L2 data gas, which isn't comparable with execution gas.
+
+    Args:
+        name: Name of the cheapest variant
+        calls: Its encoded calls, one per transaction
+        calldata_gas: Its calldata gas (L1, or L2 data gas with an L2 model)
+        transaction_gas: Its per transaction gas (transaction_gas per call)
+        size: Its total calldata size, in bytes
+        calldata_gas_saved: Calldata gas saved compared to the baseline variant
+        transaction_gas_saved: Per transaction gas saved compared to the
+            baseline variant
+        bytes_saved: Calldata bytes saved compared to the baseline variant
+    """
+
+    name: str
+    calls: List[bytes]
+    calldata_gas: int
+    transaction_gas: int
+    size: int
+    calldata_gas_saved: int
+    transaction_gas_saved: int
+    bytes_saved: int
+
+
+class BatchChoice(NamedTuple):
+    choices: List[VariantChoice]
+    calldata_gas_saved: int
+    transaction_gas_saved: int
+    bytes_saved: int
+
+
+def choose_encodings(
+    intents: Sequence[Dict[str, Sequence[HexOrBytes]]],
+    baseline: Optional[str] = None,
+    l2_model: Optional[L2CostModel] = None,
+    transaction_gas: int = TRANSACTION_BASE_GAS,
+) -> BatchChoice:
+    """
+    Pick the cheapest encoding variant of every intent of a batch.
+
+    Each intent maps variant names to the calls (one per transaction) that
+    carry it out, e.g. {"separate": [decrease, collect], "multicall":
+    [encode_multicall([decrease, collect])]}. The calldata of all variants
+    of the batch is costed in one vectorized pass.
+
+    On L1, variants are ranked by calldata gas plus per transaction gas, both
+    paid in L1 gas. With an L2 model, the data gas and the execution gas are
+    priced separately, so variants are ranked by data gas, then by
+    transaction gas.
+
+    Args:
+        intents: One {variant name: calls} dict per intent
+        baseline: Variant savings are measured against (defaults to the
+            first variant of each intent)
+        l2_model: Cost calldata with this L2 model instead of L1 gas
+        transaction_gas: Gas paid per transaction of a variant
+
+    Returns:
+        BatchChoice: The choice for each intent, plus the calldata gas,
+        transaction gas and bytes saved over the whole batch
+
+    Example:
+        >>> batch = choose_encodings(
+        ...     [
+        ...         {
+        ...             "pool": [pool_encode_mint(...)],
+        ...             "position_manager": [encode_mint(...)],
+        ...         }
+        ...     ]
+        ... )
+        >>> batch.choices[0].name, batch.calldata_gas_saved
+        ('pool', 2012)
+    """
+    flat: List[bytes] = []
+    for intent in intents:
+        for calls in intent.values():
+            flat.extend(to_bytes(call) for call in calls)
+    costs = estimate_calldata_costs(flat, l2_model)
+    gas_column = costs["l1_gas" if l2_model is None else "l2_gas"]
+    sizes = costs["size"]
+
+    def rank(total: Tuple[int, int, int, List[bytes]]) -> Tuple[int, int]:
+        calldata_gas, execution_gas = total[0], total[1]
+        if l2_model is None:
+            return calldata_gas + execution_gas, 0
+        return calldata_gas, execution_gas
+
+    choices = []
+    position = 0
+    for intent in intents:
+        if not intent:
+            raise ValueError("Intent without encoding variants")
+        totals: Dict[str, Tuple[int, int, int, List[bytes]]] = {}
+        for name, calls in intent.items():
+            end = position + len(calls)
+            calldata_gas = int(sum(gas_column[position:end]))
+            size = int(sum(sizes[position:end]))
+            totals[name] = (
+                calldata_gas,
+                transaction_gas * len(calls),
+                size,
+                flat[position:end],
+            )
+            position = end
+
+        reference = baseline if baseline is not None else next(iter(intent))
+        if reference not in totals:
+            raise ValueError(f"Baseline variant {reference!r} missing from intent")
+        best = min(totals, key=lambda name: rank(totals[name]))
+        calldata_gas, execution_gas, size, best_calls = totals[best]
+        reference_total = totals[reference]
+        choices.append(
+            VariantChoice(
+                best,
+                best_calls,
+                calldata_gas,
+                execution_gas,
+                size,
+                reference_total[0] - calldata_gas,
+                reference_total[1] - execution_gas,
+                reference_total[2] - size,
+            )
+        )
+    return BatchChoice(
+        choices,
+        sum(choice.calldata_gas_saved for choice in choices),
+        sum(choice.transaction_gas_saved for choice in choices),
+        sum(choice.bytes_saved for choice in choices),
+    )
@@ -0,0 +1,351 @@
+"""Opt-in memoization of encoded calls, for backtests and dry-runs.
+
+Identical (signature, args) combinations are encoded once and served from a
+size-bounded LRU afterwards. Arguments are normalized before hashing, so a list
+and a tuple share one entry, as do two spellings of the same address when the
+signature is known.
+"""
+
+import functools
+import threading
+from collections import OrderedDict
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Hashable,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+    cast,
+)
+
+from .abi_types import is_tuple_type, parse_array_type, parse_tuple_type
+from .call_encoder import compile_function, encode_call
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy is optional
+    np = None  # type: ignore[assignment]
+
+T = TypeVar("T")
+
+
+class CacheStats(NamedTuple):
+    hits: int
+    misses: int
+    evictions: int
+    entries: int
+    size_bytes: int
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups served from the cache."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+def normalize_argument(value: Any, type_: Optional[str] = None) -> Hashable:
+    """
+    Turn an argument into a hashable key that is equal for equivalent inputs.
+
+    Lists become tuples, NumPy scalars become Python ints and bytes-like
+    values become bytes. Bools and floats are tagged with their type, since
+    True == 1 == 1.0 but only the int is a valid uint. Address arguments are
+    lowercased when the Solidity type is known; without it strings are kept
+    as is, as an address-looking string may as well be a string argument.
+
+    Args:
+        value: The argument
+        type_: Its Solidity type, if known
+
+    Returns:
+        A hashable normalized value
+    """
+    if type_ is not None:
+        array = parse_array_type(type_)
+        if array is not None:
+            return tuple(normalize_argument(item, array[0]) for item in value)
+        if is_tuple_type(type_):
+            return tuple(
+                normalize_argument(item, field_type)
+                for field_type, item in zip(parse_tuple_type(type_), value)
+            )
+        if type_ == "address" and isinstance(value, str):
+            return value.lower()
+        if type_ != "string":
+            return normalize_argument(value)
+        return cast(Hashable, value)
+
+    if isinstance(value, (list, tuple)):
+        return tuple(normalize_argument(item) for item in value)
+    if isinstance(value, dict):
+        return tuple(
+            sorted((key, normalize_argument(item)) for key, item in value.items())
+        )
+    if isinstance(value, (bytearray, memoryview)):
+        return bytes(value)
+    if isinstance(value, (bool, float)):
+        return (type(value), value)
+    if np is not None:
+        if isinstance(value, np.integer):
+            return int(value)
+        if isinstance(value, (np.bool_, np.floating)):
+            return (type(value), value)
+    return cast(Hashable, value)
+
+
+class _CacheShard:
+    """One independently locked LRU of an EncodingCache."""
+
+    def __init__(self, max_entries: int, max_bytes: int) -> None:
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.entries: "OrderedDict[Hashable, str]" = OrderedDict()
+        self.size_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[str]:
+        with self.lock:
+            encoded = self.entries.get(key)
+            if encoded is not None:
+                self.entries.move_to_end(key)
+                self.hits += 1
+            else:
+                self.misses += 1
+            return encoded
+
+    def put(self, key: Hashable, encoded: str) -> None:
+        with self.lock:
+            if key in self.entries:
+                return
+            self.entries[key] = encoded
+            self.size_bytes += len(encoded)
+            while self.entries and (
+                len(self.entries) > self.max_entries or self.size_bytes > self.max_bytes
+            ):
+                _, evicted = self.entries.popitem(last=False)
+                self.size_bytes -= len(evicted)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        with self.lock:
+            self.entries.clear()
+            self.size_bytes = 0
+            self.hits = self.misses = self.evictions = 0
+
+
+class EncodingCache:
+    """Size-bounded LRU of encoded calls.
+
+    Entries are evicted least recently used first once either the number of
+    entries or the total size of the cached calldata exceeds its budget.
+    With shards > 1, keys are spread by hash over independently locked LRUs,
+    each with an equal share of the budgets, so threads encoding in parallel
+    rarely wait on the same lock (see parallel.encode_call_batch_threaded).
+
+    Args:
+        max_entries: Maximum number of cached calls
+        max_bytes: Maximum total size of the cached calldata strings
+        shards: Number of independently locked LRUs
+
+    Example:
+        >>> cache = EncodingCache(max_entries=10_000, max_bytes=8 * 2**20)
+        >>> cache.encode_call("burn(uint256)", "burn", [12345])
+        '0x42966c68...'
+        >>> collect = cache.wrap(position_manager.encode_collect)
+        >>> collect(token_id=1, recipient=..., amount0_max=MAX, amount1_max=MAX)
+        '0xfc6f7865...'
+        >>> cache.stats().hit_rate
+        0.0
+    """
+
+    def __init__(
+        self, max_entries: int = 65536, max_bytes: int = 64 * 2**20, shards: int = 1
+    ) -> None:
+        if shards < 1:
+            raise ValueError(f"Invalid shard count: {shards}")
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._shards = [
+            _CacheShard(-(-max_entries // shards), -(-max_bytes // shards))
+            for _ in range(shards)
+        ]
+
+    def _shard(self, key: Hashable) -> _CacheShard:
+        shards = self._shards
+        return shards[hash(key) % len(shards)] if len(shards) > 1 else shards[0]
+
+    def get_or_encode(self, key: Hashable, encode: Callable[[], str]) -> str:
+        """Return the cached value for key, encoding (and caching) it on a miss."""
+        shard = self._shard(key)
+        encoded = shard.get(key)
+        if encoded is None:
+            encoded = encode()
+            shard.put(key, encoded)
+        return encoded
+
+    def encode_call(
+        self,
+        abi_or_signature: Any,
+        function_name: str,
+        args: List[Any],
+        trusted: bool = False,
+    ) -> str:
+        """Memoized version of call_encoder.encode_call, with the same arguments."""
+        if isinstance(abi_or_signature, str):
+            # Type-aware normalization: only address arguments are lowercased
+            param_types = compile_function(abi_or_signature).param_types
+            normalized = tuple(
+                normalize_argument(value, type_)
+                for type_, value in zip(param_types, args)
+            )
+            key: Hashable = (abi_or_signature, function_name, normalized, trusted)
+        else:
+            key = (
+                normalize_argument(abi_or_signature),
+                function_name,
+                normalize_argument(args),
+                trusted,
+            )
+        return self.get_or_encode(
+            key,
+            lambda: encode_call(abi_or_signature, function_name, args, trusted=trusted),
+        )
+
+    def wrap(self, encoder: Callable[..., str]) -> Callable[..., str]:
+        """
+        Memoize an encoder such as uniswap_calls.position_manager.encode_collect.
+
+        Entries are keyed by the encoder itself, so encoders sharing a name
+        (e.g. the encode_exactInputSingle of two registered forks) never share
+        entries. Arguments are normalized without types: strings aren't
+        case-folded.
+
+        Args:
+            encoder: Function returning calldata
+
+        Returns:
+            A function with the same signature, served from this cache
+        """
+
+        @functools.wraps(encoder)
+        def cached(*args: Any, **kwargs: Any) -> str:
+            key = (encoder, normalize_argument(args), normalize_argument(kwargs))
+            return self.get_or_encode(key, lambda: encoder(*args, **kwargs))
+
+        return cached
+
+    def stats(self) -> CacheStats:
+        """Return hit/miss counters and the current cache size."""
+        totals = [0, 0, 0, 0, 0]
+        for shard in self._shards:
+            with shard.lock:
+                counts = (
+                    shard.hits,
+                    shard.misses,
+                    shard.evictions,
+                    len(shard.entries),
+                    shard.size_bytes,
+                )
+            totals = [total + count for total, count in zip(totals, counts)]
+        return CacheStats(*totals)
+
+    def clear(self) -> None:
+        """Drop every entry and reset the counters."""
+        for shard in self._shards:
+            shard.clear()
+
+
+def _row_key(row: Any, types: Optional[Sequence[str]]) -> Hashable:
+    if types is None:
+        return normalize_argument(row)
+    return tuple(normalize_argument(value, type_) for type_, value in zip(types, row))
+
+
+def dedupe_rows(
+    rows: Sequence[Any], types: Optional[Sequence[str]] = None
+) -> Tuple[List[Any], List[int]]:
+    """
+    Find the unique rows of a batch.
+
+    Args:
+        rows: Argument rows (lists, tuples, dicts...)
+        types: Solidity types of the row values, if known (only then are
+            addresses compared case-insensitively)
+
+    Returns:
+        tuple: (unique_rows, inverse) such that rows[i] is equivalent to
+        unique_rows[inverse[i]]
+    """
+    positions: Dict[Hashable, int] = {}
+    unique_rows: List[Any] = []
+    inverse: List[int] = []
+    for row in rows:
+        key = _row_key(row, types)
+        position = positions.get(key)
+        if position is None:
+            position = positions[key] = len(unique_rows)
+            unique_rows.append(row)
+        inverse.append(position)
+    return unique_rows, inverse
+
+
+def map_dedup(
+    encode: Callable[[Any], T],
+    rows: Sequence[Any],
+    types: Optional[Sequence[str]] = None,
+) -> List[T]:
+    """
+    Apply encode once per unique row and scatter the results back.
+
+    Args:
+        encode: Function of one row, e.g. lambda kwargs: encode_collect(**kwargs)
+        rows: Argument rows
+        types: Solidity types of the row values, if known (see dedupe_rows)
+
+    Returns:
+        list: encode(row) for every row, in the original order
+    """
+    unique_rows, inverse = dedupe_rows(rows, types)
+    results = [encode(row) for row in unique_rows]
+    return [results[position] for position in inverse]
+
+
+def encode_call_batch(
+    abi_or_signature: Any,
+    function_name: str,
+    rows: Sequence[List[Any]],
+    cache: Optional[EncodingCache] = None,
+    trusted: bool = False,
+) -> List[str]:
+    """
+    Encode many calls to one function, encoding each unique row only once.
+
+    Args:
+        abi_or_signature: Contract ABI or function signature (as for encode_call)
+        function_name: Name of the function to call
+        rows: One argument list per call
+        cache: Optional cache to also reuse results across batches
+        trusted: Skip argument validation
+
+    Returns:
+        list: Encoded call data for every row, in the original order
+    """
+    encoder: Callable[..., str] = (
+        cache.encode_call if cache is not None else encode_call
+    )
+    types = None
+    if isinstance(abi_or_signature, str):
+        types = compile_function(abi_or_signature).param_types
+    return map_dedup(
+        lambda args: encoder(abi_or_signature, function_name, args, trusted=trusted),
+        rows,
+        types,
+    )
@@ -0,0 +1,192 @@
+"""Multicall3 read batching: aggregate3 / tryAggregate encoders and decoders.
+
+N state reads become ceil(N / batch_size) eth_calls. Calldata built with
+encode_call (or any encoder of this package) is packed into Multicall3 calls,
+and the aggregated return data is split back into one result per call, with
+its success flag.
+"""
+
+from typing import Any, List, NamedTuple, Optional, Sequence, Tuple, TypeVar, Union
+
+from .abi_decoder import HexOrBytes, to_bytes
+from .call_encoder import encode_call
+
+# Multicall3, deployed at the same address on most EVM chains
+MULTICALL3_ADDRESS = "0xcA11bde05977b3631167028862bE2a173976CA11"
+
+AGGREGATE3_SIGNATURE = "aggregate3((address,bool,bytes)[])"
+TRY_AGGREGATE_SIGNATURE = "tryAggregate(bool,(address,bytes)[])"
+
+DEFAULT_BATCH_SIZE = 500
+
+# (target, calldata) or (target, calldata, allow_failure)
+Call = Union[Tuple[str, HexOrBytes], Tuple[str, HexOrBytes, bool]]
+
+T = TypeVar("T")
+
+
+class CallResult(NamedTuple):
+    success: bool
+    return_data: bytes
+
+
+def split_batches(items: Sequence[T], batch_size: int) -> List[Sequence[T]]:
+    """Split items into consecutive batches of at most batch_size."""
+    if batch_size < 1:
+        raise ValueError(f"Invalid batch size: {batch_size}")
+    batches = []
+    for start in range(0, len(items), batch_size):
+        end = start + batch_size
+        batches.append(items[start:end])
+    return batches
+
+
+def encode_aggregate3(calls: Sequence[Call], allow_failure: bool = True) -> str:
+    """Encode a call to the Multicall3 aggregate3 function.
+
+    Args:
+        calls: (target, calldata) pairs, or (target, calldata, allow_failure)
+            triples to override allow_failure per call. Calldata can be a hex
+            string (as returned by encode_call) or bytes
+        allow_failure: Whether a reverting call is reported as a failed result
+            instead of reverting the whole batch
+
+    Returns:
+        str: Encoded call data with 0x prefix
+
+    Example:
+        >>> encode_aggregate3(
+        ...     [(position_manager, encode_positions(token_id)) for token_id in ids]
+        ... )
+        '0x82ad56cb...'
+    """
+    call3s = [
+        (call[0], call[2] if len(call) > 2 else allow_failure, to_bytes(call[1]))
+        for call in calls
+    ]
+    return encode_call(
+        abi_or_signature=AGGREGATE3_SIGNATURE,
+        function_name="aggregate3",
+        args=[call3s],
+    )
+
+
+def encode_try_aggregate(calls: Sequence[Call], require_success: bool = False) -> str:
+    """Encode a call to the Multicall3 tryAggregate function.
+
+    Args:
+        calls: (target, calldata) pairs
+        require_success: Revert the whole batch if any call fails
+
+    Returns:
+        str: Encoded call data with 0x prefix
+    """
+    pairs = [(call[0], to_bytes(call[1])) for call in calls]
+    return encode_call(
+        abi_or_signature=TRY_AGGREGATE_SIGNATURE,
+        function_name="tryAggregate",
+        args=[require_success, pairs],
+    )
+
+
+def encode_aggregate3_batches(
+    calls: Sequence[Call],
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    allow_failure: bool = True,
+) -> List[str]:
+    """
+    Encode calls as several aggregate3 calls of at most batch_size calls each.
+
+    Args:
+        calls: (target, calldata) pairs
+        batch_size: Maximum number of calls per aggregate3 call
+        allow_failure: Whether a reverting call is reported instead of
+            reverting its batch
+
+    Returns:
+        list: Encoded aggregate3 call data, one per batch
+    """
+    return [
+        encode_aggregate3(batch, allow_failure=allow_failure)
+        for batch in split_batches(calls, batch_size)
+    ]
+
+
+def _read_word(data: bytes, offset: int) -> int:
+    end = offset + 32
+    if end > len(data):
+        raise ValueError(f"Return data too short: need {end} bytes, got {len(data)}")
+    return int.from_bytes(data[offset:end], "big")
+
+
+def decode_aggregate3(return_data: HexOrBytes) -> List[CallResult]:
+    """
+    Split aggregate3 (or tryAggregate) return data into per-call results.
+
+    Both functions return Result[] = (bool success, bytes returnData)[].
+
+    Args:
+        return_data: Raw return data of the eth_call
+
+    Returns:
+        list: One CallResult per call, in call order
+    """
+    data = to_bytes(return_data)
+    array_start = _read_word(data, 0)
+    count = _read_word(data, array_start)
+    heads = array_start + 32
+
+    results: List[CallResult] = []
+    for index in range(count):
+        result_start = heads + _read_word(data, heads + 32 * index)
+        success = _read_word(data, result_start) != 0
+        bytes_start = result_start + _read_word(data, result_start + 32)
+        size = _read_word(data, bytes_start)
+        start = bytes_start + 32
+        end = start + size
+        if end > len(data):
+            raise ValueError(f"Return data too short for result {index}")
+        results.append(CallResult(success, data[start:end]))
+    return results
+
+
+def execute_aggregate3(
+    web3: Any,
+    calls: Sequence[Call],
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    allow_failure: bool = True,
+    block_identifier: Any = "latest",
+    multicall_address: Optional[str] = None,
+) -> List[CallResult]:
+    """
+    Run calls through Multicall3 with one eth_call per batch.
+
+    Args:
+        web3: A connected web3.Web3 instance (e.g. to a local anvil node)
+        calls: (target, calldata) pairs
+        batch_size: Maximum number of calls per eth_call
+        allow_failure: Whether a reverting call is reported instead of
+            reverting its batch
+        block_identifier: Block to read state at
+        multicall_address: Multicall3 address, if not the canonical one
+
+    Returns:
+        list: One CallResult per call, in call order
+
+    Example:
+        >>> results = execute_aggregate3(
+        ...     web3, [(pool, encode_slot0()) for pool in pools], batch_size=200
+        ... )
+        >>> slot0 = decode_slot0_batch(
+        ...     [result.return_data for result in results],
+        ...     success=[result.success for result in results],
+        ... )
+    """
+    results: List[CallResult] = []
+    for calldata in encode_aggregate3_batches(calls, batch_size, allow_failure):
+        return_data = web3.eth.call(
+            {"to": multicall_address or MULTICALL3_ADDRESS, "data": calldata},
+            block_identifier,
+        )
+        results.extend(decode_aggregate3(return_data))
+    return results
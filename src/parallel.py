@@ -0,0 +1,114 @@
+"""Thread-pool batch encoding.
+
+Encoding is pure Python, so threads can only run it in parallel on a
+free-threaded (no-GIL) build; with the GIL the pool adds nothing but
+overhead. The shared caches it touches don't serialize threads on a lock:
+compiled encoders are read without a lock, EncodingCache can be sharded and
+the small helper caches are per thread (see thread_cache). No speedup is
+assumed: measure it on the target interpreter and core count with
+benchmarks/threaded_encoding.py before relying on it.
+"""
+
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import Any, Callable, List, Optional, Sequence, TypeVar
+
+from .call_encoder import compile_function, encode_call
+from .encoding_cache import EncodingCache
+
+DEFAULT_CHUNK_SIZE = 256
+
+T = TypeVar("T")
+
+
+def _chunks(rows: Sequence[Any], chunk_size: int) -> List[Sequence[Any]]:
+    if chunk_size < 1:
+        raise ValueError(f"Invalid chunk size: {chunk_size}")
+    chunks = []
+    for start in range(0, len(rows), chunk_size):
+        end = start + chunk_size
+        chunks.append(rows[start:end])
+    return chunks
+
+
+def map_threaded(
+    encode: Callable[[Any], T],
+    rows: Sequence[Any],
+    max_workers: Optional[int] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    executor: Optional[Executor] = None,
+) -> List[T]:
+    """
+    Apply encode to every row on a thread pool, keeping the row order.
+
+    Args:
+        encode: Function of one row, e.g. lambda kwargs: encode_collect(**kwargs)
+        rows: Argument rows
+        max_workers: Number of threads (ThreadPoolExecutor default if None)
+        chunk_size: Number of rows per task
+        executor: Pool to reuse across batches instead of starting one per call
+
+    Returns:
+        list: encode(row) for every row, in the original order
+    """
+
+    def encode_chunk(chunk: Sequence[Any]) -> List[T]:
+        return [encode(row) for row in chunk]
+
+    chunks = _chunks(rows, chunk_size)
+    if executor is not None:
+        results = list(executor.map(encode_chunk, chunks))
+    else:
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            results = list(pool.map(encode_chunk, chunks))
+    return [encoded for chunk in results for encoded in chunk]
+
+
+def encode_call_batch_threaded(
+    abi_or_signature: Any,
+    function_name: str,
+    rows: Sequence[List[Any]],
+    max_workers: Optional[int] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    cache: Optional[EncodingCache] = None,
+    trusted: bool = False,
+    executor: Optional[Executor] = None,
+) -> List[str]:
+    """
+    Encode many calls to one function on a thread pool.
+
+    The signature is compiled on the calling thread first, so workers only
+    hit the lock-free read path of the compiled encoder cache.
+
+    Args:
+        abi_or_signature: Contract ABI or function signature (as for encode_call)
+        function_name: Name of the function to call
+        rows: One argument list per call
+        max_workers: Number of threads (ThreadPoolExecutor default if None)
+        chunk_size: Number of rows per task
+        cache: Optional cache to reuse results, ideally with one shard per
+            thread, e.g. EncodingCache(shards=16)
+        trusted: Skip argument validation
+        executor: Pool to reuse across batches instead of starting one per call
+
+    Returns:
+        list: Encoded call data for every row, in the original order
+
+    Example:
+        >>> encode_call_batch_threaded(
+        ...     "burn(uint256)", "burn", [[token_id] for token_id in token_ids],
+        ...     max_workers=8,
+        ... )
+        ['0x42966c68...', ...]
+    """
+    if isinstance(abi_or_signature, str):
+        compile_function(abi_or_signature)
+    encoder: Callable[..., str] = (
+        cache.encode_call if cache is not None else encode_call
+    )
+    return map_threaded(
+        lambda args: encoder(abi_or_signature, function_name, args, trusted=trusted),
+        rows,
+        max_workers=max_workers,
+        chunk_size=chunk_size,
+        executor=executor,
+    )
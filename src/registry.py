@@ -0,0 +1,306 @@
+"""Declarative registry of protocol function encoders.
+
+A protocol is declared as a ProtocolSpec: its functions, their parameter
+(or struct field) names and types, and optional defaults. Registering it
+compiles every function once (selector, parameter types and native encoder)
+into an encoder function binding positional and keyword arguments, so adding
+a venue or a V3 fork is a matter of declaring its spec:
+
+    >>> FORK_ROUTER = ProtocolSpec(
+    ...     "fork_router",
+    ...     [FunctionSpec("exactInputSingle", [...], struct=True)],
+    ... )
+    >>> encode_exactInputSingle = register_protocol(FORK_ROUTER)[
+    ...     "encode_exactInputSingle"
+    ... ]
+"""
+
+import inspect
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+from .abi_types import parse_array_type
+from .call_encoder import compile_function, encode_compiled
+from .validation import validate_arguments
+
+
+class _Required:
+    def __repr__(self) -> str:
+        return "REQUIRED"
+
+
+# Default of fields without a default value
+REQUIRED: Any = _Required()
+
+
+class Field(NamedTuple):
+    """A function parameter, or a field of a function's struct parameter."""
+
+    name: str
+    type: str
+    default: Any = REQUIRED
+
+
+class FunctionSpec(NamedTuple):
+    """Declaration of one contract function.
+
+    Args:
+        name: Solidity function name
+        fields: Parameters, or struct fields when struct is True
+        struct: Pack the fields into a single struct (tuple) parameter
+        encoder_name: Name of the Python encoder (default "encode_<name>")
+        doc: Docstring of the Python encoder
+        bounds: Extra (min, max) ranges keyed by field name (see validation)
+    """
+
+    name: str
+    fields: List[Field]
+    struct: bool = False
+    encoder_name: Optional[str] = None
+    doc: str = ""
+    bounds: Optional[Mapping[str, Tuple[int, int]]] = None
+
+    @property
+    def signature(self) -> str:
+        types = ",".join(field.type for field in self.fields)
+        return f"{self.name}(({types}))" if self.struct else f"{self.name}({types})"
+
+    @property
+    def python_name(self) -> str:
+        return self.encoder_name or f"encode_{self.name}"
+
+
+class ProtocolSpec(NamedTuple):
+    name: str
+    functions: List[FunctionSpec]
+
+
+class RegisteredFunction(NamedTuple):
+    """A registered FunctionSpec and its encoder."""
+
+    protocol: str
+    spec: FunctionSpec
+    signature: str
+    encode: Callable[..., str]
+
+
+# Registered functions of each protocol, keyed by signature
+_protocols: Dict[str, Dict[str, RegisteredFunction]] = {}
+
+
+def _annotation(type_: str) -> Any:
+    """Python annotation of the values accepted for a Solidity type."""
+    array = parse_array_type(type_)
+    if array is not None:
+        return Sequence[_annotation(array[0])]  # type: ignore[misc]
+    if type_.startswith(("uint", "int")):
+        return int
+    if type_ == "bool":
+        return bool
+    if type_.startswith("bytes"):
+        return Union[str, bytes]
+    if type_ in ("address", "string"):
+        return str
+    return Any
+
+
+def compile_function_spec(
+    spec: FunctionSpec, protocol: str = "", module: Optional[str] = None
+) -> RegisteredFunction:
+    """
+    Compile a function spec into an encoder.
+
+    The signature is compiled right away and bound to the encoder. The
+    encoder takes the fields as positional or keyword arguments (plus a
+    keyword-only trusted flag to skip validation) and returns the encoded
+    call data with 0x prefix, like the hand-written encoders.
+
+    Args:
+        spec: Function declaration
+        protocol: Name of the protocol the function belongs to
+        module: Module to attribute the encoder to (for help() and caches)
+
+    Returns:
+        RegisteredFunction: The function spec, signature and encoder
+    """
+    signature = spec.signature
+    compiled = compile_function(signature)
+    python_name = spec.python_name
+    names = [field.name for field in spec.fields]
+    defaults = [field.default for field in spec.fields]
+    positions = {name: position for position, name in enumerate(names)}
+    count = len(names)
+    struct = spec.struct
+    bounds = spec.bounds
+    # Validation sees the struct as a single parameter, with flattened names
+    param_types = compiled.param_types
+
+    def encode(*args: Any, trusted: bool = False, **kwargs: Any) -> str:
+        if len(args) > count:
+            raise TypeError(
+                f"{python_name}() takes {count} positional arguments "
+                f"but {len(args)} were given"
+            )
+        values = list(args)
+        if len(values) < count or kwargs:
+            given = len(values)
+            values.extend(defaults[given:])
+            for key, value in kwargs.items():
+                position = positions.get(key)
+                if position is None:
+                    raise TypeError(
+                        f"{python_name}() got an unexpected keyword argument {key!r}"
+                    )
+                if position < len(args):
+                    raise TypeError(
+                        f"{python_name}() got multiple values for argument {key!r}"
+                    )
+                values[position] = value
+            missing = [name for name, value in zip(names, values) if value is REQUIRED]
+            if missing:
+                raise TypeError(
+                    f"{python_name}() missing required arguments: {', '.join(missing)}"
+                )
+
+        call_args = [tuple(values)] if struct else values
+        # Check every argument up front, reporting errors by field name
+        if not trusted:
+            validate_arguments(param_types, call_args, names=names, bounds=bounds)
+        return encode_compiled(compiled, call_args, trusted=True)
+
+    parameters = [
+        inspect.Parameter(
+            field.name,
+            inspect.Parameter.POSITIONAL_OR_KEYWORD,
+            default=(
+                inspect.Parameter.empty if field.default is REQUIRED else field.default
+            ),
+            annotation=_annotation(field.type),
+        )
+        for field in spec.fields
+    ]
+    parameters.append(
+        inspect.Parameter(
+            "trusted", inspect.Parameter.KEYWORD_ONLY, default=False, annotation=bool
+        )
+    )
+    encode.__signature__ = inspect.Signature(  # type: ignore[attr-defined]
+        parameters, return_annotation=str
+    )
+    encode.__name__ = encode.__qualname__ = python_name
+    encode.__doc__ = spec.doc or None
+    if module is not None:
+        encode.__module__ = module
+    return RegisteredFunction(protocol, spec, signature, encode)
+
+
+def register_protocol(
+    protocol: ProtocolSpec, module: Optional[str] = None
+) -> Dict[str, Callable[..., str]]:
+    """
+    Compile and register every function of a protocol spec.
+
+    Overloads (same name, different parameters) are registered by signature
+    and need distinct encoder names, e.g. encode_execute and
+    encode_execute_no_deadline for UniversalRouter.execute.
+
+    Args:
+        protocol: Protocol declaration
+        module: Module exposing the encoders (usually __name__ of the caller)
+
+    Returns:
+        dict: Encoder functions keyed by their Python name (encode_<name>)
+    """
+    functions: Dict[str, RegisteredFunction] = {}
+    encoders: Dict[str, Callable[..., str]] = {}
+    for spec in protocol.functions:
+        if spec.signature in functions:
+            raise ValueError(
+                f"Duplicate function {spec.signature!r} in protocol {protocol.name!r}"
+            )
+        if spec.python_name in encoders:
+            raise ValueError(
+                f"Duplicate encoder name {spec.python_name!r} in protocol "
+                f"{protocol.name!r}: give overloads distinct encoder_name values"
+            )
+        function = compile_function_spec(spec, protocol.name, module)
+        functions[spec.signature] = function
+        encoders[spec.python_name] = function.encode
+    _protocols[protocol.name] = functions
+    return encoders
+
+
+def _functions(protocol: str) -> Dict[str, RegisteredFunction]:
+    try:
+        return _protocols[protocol]
+    except KeyError:
+        raise KeyError(f"No protocol {protocol!r} registered") from None
+
+
+def get_overloads(protocol: str, function_name: str) -> List[RegisteredFunction]:
+    """
+    Look up every registered overload of a function.
+
+    Args:
+        protocol: Protocol name, e.g. "uniswap_universal_router"
+        function_name: Solidity function name, e.g. "execute"
+
+    Returns:
+        list: The registered functions of that name, in declaration order
+    """
+    return [
+        function
+        for function in _functions(protocol).values()
+        if function.spec.name == function_name
+    ]
+
+
+def get_registered_function(protocol: str, function: str) -> RegisteredFunction:
+    """
+    Look up a registered function by protocol and name or signature.
+
+    Args:
+        protocol: Protocol name, e.g. "uniswap_v3_position_manager"
+        function: Solidity function name, e.g. "mint", or its signature,
+            e.g. "execute(bytes,bytes[])", which overloaded names require
+
+    Returns:
+        RegisteredFunction: The spec, signature and encoder
+
+    Raises:
+        KeyError: If no such function is registered
+        ValueError: If a bare name matches several overloads
+    """
+    if "(" in function:
+        registered = _functions(protocol).get(function)
+        if registered is None:
+            raise KeyError(
+                f"No function {function!r} registered for protocol {protocol!r}"
+            )
+        return registered
+
+    overloads = get_overloads(protocol, function)
+    if not overloads:
+        raise KeyError(f"No function {function!r} registered for protocol {protocol!r}")
+    if len(overloads) > 1:
+        signatures = ", ".join(overload.signature for overload in overloads)
+        raise ValueError(
+            f"{function!r} is overloaded in protocol {protocol!r}, "
+            f"use one of the signatures: {signatures}"
+        )
+    return overloads[0]
+
+
+def registered_protocols() -> List[str]:
+    """Names of the registered protocols."""
+    return list(_protocols)
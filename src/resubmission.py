@@ -0,0 +1,312 @@
+"""Re-encoding of stuck transactions with a fresh deadline or tighter minimums.
+
+A replacement transaction calls the same function with the same arguments,
+except for a few static fields (deadline, amount_out_minimum,
+amount0_min...). ResubmissionCache keeps the encoded call data of every
+tracked transaction together with the word offset of each static field of
+its registered function, so a replacement is a copy of the original buffer
+with only the changed words rewritten. It also records which transactions
+replaced which, for the monitor, and forgets transactions after max_age.
+
+    >>> resubmissions = ResubmissionCache(max_age=600)
+    >>> data = resubmissions.encode(
+    ...     tx_hash, "uniswap_v3_swap_router", "exactInputSingle", nonce=nonce,
+    ...     token_in=USDC, token_out=WETH, fee=500, recipient=bot,
+    ...     deadline=now + 60, amount_in=amount, amount_out_minimum=minimum,
+    ... )
+    >>> # Stuck: same nonce, new deadline and minimum
+    >>> new_data = resubmissions.resubmit(
+    ...     tx_hash, new_tx_hash, deadline=now + 120, amount_out_minimum=tighter
+    ... )
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple, cast
+
+from .abi_decoder import HexOrBytes, to_bytes
+from .abi_encoder import (
+    AddressEncoder,
+    BaseEncoder,
+    BoolEncoder,
+    FixedBytesEncoder,
+    IntEncoder,
+    TupleEncoder,
+)
+from .call_encoder import compile_function, process_argument
+from .registry import RegisteredFunction, get_registered_function
+from .validation import validate_arguments
+
+DEFAULT_MAX_AGE = 3600.0
+
+# Leaf encoders writing exactly one word in the head
+_WORD_ENCODERS = (IntEncoder, AddressEncoder, BoolEncoder, FixedBytesEncoder)
+
+TxId = Any
+
+
+class FieldSlot(NamedTuple):
+    """Position of a static field in the call data of its function."""
+
+    offset: int
+    type: str
+    encoder: BaseEncoder
+
+
+def field_layout(function: RegisteredFunction) -> Dict[str, FieldSlot]:
+    """
+    Word offsets of the static fields of a registered function.
+
+    Offsets count from the start of the call data (selector included). Static
+    fields keep their position whatever the other arguments are, including
+    the head fields of a dynamic struct; dynamic fields and nested static
+    tuples or arrays are left out.
+
+    Args:
+        function: Registered function (see registry.get_registered_function)
+
+    Returns:
+        dict: FieldSlot keyed by field name
+    """
+    encoder = compile_function(function.signature).encoder
+    if function.spec.struct:
+        struct = cast(TupleEncoder, encoder.components[0])
+        components = struct.components
+        # A dynamic struct is stored in the tail, right after its offset word
+        base = 4 + (32 if struct.dynamic else 0)
+    else:
+        components = encoder.components
+        base = 4
+
+    layout = {}
+    head = base
+    for field, component in zip(function.spec.fields, components):
+        if isinstance(component, _WORD_ENCODERS):
+            layout[field.name] = FieldSlot(head, field.type, component)
+        head += 32 if component.dynamic else component.static_size
+    return layout
+
+
+class _Entry(NamedTuple):
+    function: RegisteredFunction
+    layout: Dict[str, FieldSlot]
+    data: bytes
+    nonce: Optional[int]
+    lineage: Tuple[TxId, ...]
+    created: float
+
+
+class ResubmissionCache:
+    """Encoded call data of in-flight transactions, for cheap replacements.
+
+    Args:
+        max_age: Seconds after which a tracked transaction is forgotten
+        max_entries: Optional bound on the number of tracked transactions
+            (the oldest are dropped first)
+        clock: Time source, time.monotonic by default
+    """
+
+    def __init__(
+        self,
+        max_age: float = DEFAULT_MAX_AGE,
+        max_entries: Optional[int] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if max_age <= 0:
+            raise ValueError(f"Invalid max_age: {max_age}")
+        if max_entries is not None and max_entries < 1:
+            raise ValueError(f"Invalid max_entries: {max_entries}")
+        self.max_age = max_age
+        self.max_entries = max_entries
+        self._clock = clock
+        # Oldest first, as entries are only ever appended
+        self._entries: "OrderedDict[TxId, _Entry]" = OrderedDict()
+        self._layouts: Dict[str, Dict[str, FieldSlot]] = {}
+        self._lock = threading.Lock()
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, tx_id: object) -> bool:
+        return tx_id in self._entries
+
+    def _layout(self, function: RegisteredFunction) -> Dict[str, FieldSlot]:
+        layout = self._layouts.get(function.signature)
+        if layout is None:
+            layout = self._layouts[function.signature] = field_layout(function)
+        return layout
+
+    def _evict(self, now: float) -> None:
+        entries = self._entries
+        while entries:
+            tx_id, entry = next(iter(entries.items()))
+            expired = now - entry.created > self.max_age
+            if not expired and (
+                self.max_entries is None or len(entries) <= self.max_entries
+            ):
+                break
+            del entries[tx_id]
+            self.evictions += 1
+
+    def _add(self, tx_id: TxId, entry: _Entry) -> None:
+        with self._lock:
+            # Re-tracking an ID moves it to the young end
+            self._entries.pop(tx_id, None)
+            self._entries[tx_id] = entry
+            self._evict(entry.created)
+
+    def _get(self, tx_id: TxId) -> _Entry:
+        with self._lock:
+            self._evict(self._clock())
+            entry = self._entries.get(tx_id)
+        if entry is None:
+            raise KeyError(f"Transaction {tx_id!r} is not tracked (or has expired)")
+        return entry
+
+    def track(
+        self,
+        tx_id: TxId,
+        protocol: str,
+        function_name: str,
+        data: HexOrBytes,
+        nonce: Optional[int] = None,
+    ) -> None:
+        """
+        Track the already encoded call data of a sent transaction.
+
+        Args:
+            tx_id: Transaction identifier, e.g. its hash
+            protocol: Protocol of the called function, e.g. "uniswap_v3_swap_router"
+            function_name: Solidity function name, e.g. "exactInputSingle" (the
+                signature for overloaded functions)
+            data: The call data (hex string or bytes)
+            nonce: Nonce of the transaction, which its replacements reuse
+        """
+        function = get_registered_function(protocol, function_name)
+        raw = to_bytes(data)
+        selector = compile_function(function.signature).selector
+        if raw[:4] != selector:
+            raise ValueError(
+                f"Call data of {tx_id!r} doesn't call {function.signature} "
+                f"(selector 0x{raw[:4].hex()}, expected 0x{selector.hex()})"
+            )
+        layout = self._layout(function)
+        if any(slot.offset + 32 > len(raw) for slot in layout.values()):
+            raise ValueError(f"Call data of {tx_id!r} is truncated ({len(raw)} bytes)")
+        self._add(tx_id, _Entry(function, layout, raw, nonce, (tx_id,), self._clock()))
+
+    def encode(
+        self,
+        tx_id: TxId,
+        protocol: str,
+        function_name: str,
+        nonce: Optional[int] = None,
+        trusted: bool = False,
+        **kwargs: Any,
+    ) -> str:
+        """
+        Encode a call with its registered encoder and track it.
+
+        Args:
+            tx_id: Transaction identifier, e.g. its hash
+            protocol: Protocol of the called function
+            function_name: Solidity function name (or signature, if overloaded)
+            nonce: Nonce of the transaction, which its replacements reuse
+            trusted: Skip argument validation
+            **kwargs: Arguments of the registered encoder
+
+        Returns:
+            str: Encoded call data with 0x prefix
+        """
+        function = get_registered_function(protocol, function_name)
+        encoded = function.encode(trusted=trusted, **kwargs)
+        self.track(tx_id, protocol, function_name, encoded, nonce=nonce)
+        return encoded
+
+    def resubmit(
+        self, tx_id: TxId, new_tx_id: TxId, trusted: bool = False, **changes: Any
+    ) -> str:
+        """
+        Encode the replacement of a tracked transaction and track it.
+
+        The original call data is copied and only the words of the changed
+        fields are rewritten. The replacement keeps the nonce of the
+        original and extends its lineage.
+
+        Args:
+            tx_id: Transaction being replaced (the original or a replacement)
+            new_tx_id: Identifier of the replacement transaction
+            trusted: Skip argument validation
+            **changes: New values of static fields, e.g. deadline=...
+
+        Returns:
+            str: Encoded call data of the replacement with 0x prefix
+
+        Raises:
+            KeyError: If tx_id isn't tracked (or has expired)
+            ValueError: If a field doesn't exist or isn't static
+            ArgumentValidationError: If a new value is invalid
+        """
+        entry = self._get(tx_id)
+        slots = []
+        for name in changes:
+            slot = entry.layout.get(name)
+            if slot is None:
+                raise ValueError(
+                    f"{entry.function.signature} has no static field {name!r} to rewrite"
+                )
+            slots.append(slot)
+        if not trusted:
+            validate_arguments(
+                [slot.type for slot in slots],
+                list(changes.values()),
+                names=list(changes),
+                bounds=entry.function.spec.bounds,
+            )
+
+        buffer = bytearray(entry.data)
+        for slot, value in zip(slots, changes.values()):
+            # Zero the word first: addresses and bytesN only write part of it
+            start = slot.offset
+            end = start + 32
+            buffer[start:end] = bytes(32)
+            slot.encoder.write(buffer, start, process_argument(slot.type, value))
+        data = bytes(buffer)
+
+        self._add(
+            new_tx_id,
+            entry._replace(
+                data=data, lineage=entry.lineage + (new_tx_id,), created=self._clock()
+            ),
+        )
+        return f"0x{data.hex()}"
+
+    def data(self, tx_id: TxId) -> bytes:
+        """Return the call data of a tracked transaction."""
+        return self._get(tx_id).data
+
+    def nonce(self, tx_id: TxId) -> Optional[int]:
+        """Return the nonce of a tracked transaction (shared by its replacements)."""
+        return self._get(tx_id).nonce
+
+    def lineage(self, tx_id: TxId) -> List[TxId]:
+        """
+        Return the chain of transactions a replacement descends from.
+
+        Returns:
+            list: Transaction IDs from the original to tx_id
+        """
+        return list(self._get(tx_id).lineage)
+
+    def evict_expired(self) -> int:
+        """Drop the transactions older than max_age, returning how many were dropped."""
+        with self._lock:
+            before = len(self._entries)
+            self._evict(self._clock())
+            return before - len(self._entries)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
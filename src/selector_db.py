@@ -0,0 +1,305 @@
+"""Memory-mapped 4-byte selector database, to identify unknown calldata.
+
+A signature list is compiled once into a binary file:
+
+    header   magic (8 bytes), format version (uint32), record count (uint32)
+    records  count x 12 bytes, sorted by selector then signature:
+             selector (4 bytes), string offset (uint32), string length
+             (uint16), padding (2 bytes)
+    pool     UTF-8 signatures, back to back
+
+At runtime the file is memory-mapped and searched in place, so a lookup is
+a ~log2(count) step binary search touching a handful of pages, and the
+database costs almost no resident memory however large it is.
+
+Command line:
+
+    python -m python_bot_utils.selector_db compile signatures.txt selectors.db
+    python -m python_bot_utils.selector_db lookup selectors.db 0xa9059cbb
+"""
+
+import argparse
+import mmap
+import os
+import struct
+import tempfile
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+from eth_utils import keccak
+
+MAGIC = b"PBUSELDB"
+FORMAT_VERSION = 1
+
+# Environment variable naming the database used by lookup_selector by default
+SELECTOR_DB_ENV = "PYTHON_BOT_UTILS_SELECTOR_DB"
+
+_HEADER = struct.Struct(">8sII")
+_RECORD = struct.Struct(">IIH2x")
+_SELECTOR = struct.Struct(">I")
+
+Selector = Union[str, bytes, int]
+
+
+def _selector_int(selector: Selector) -> int:
+    """Selector as an int, from an int, bytes or a hex string (or calldata)."""
+    if isinstance(selector, int):
+        return selector
+    if isinstance(selector, str):
+        digits = selector[2:] if selector.startswith("0x") else selector
+        selector = bytes.fromhex(digits[:8])
+    if len(selector) < 4:
+        raise ValueError(f"Selector too short: {selector!r}")
+    return int(_SELECTOR.unpack_from(selector)[0])
+
+
+def compile_selector_db(
+    signatures: Iterable[str], path: Union[str, os.PathLike]
+) -> int:
+    """
+    Compile function signatures into a selector database file.
+
+    Blank lines and lines starting with "#" are skipped, duplicates are
+    dropped and whitespace is removed ("transfer(address, uint256)" is stored
+    as "transfer(address,uint256)"). The file is written atomically.
+
+    Args:
+        signatures: Function signatures, e.g. the lines of a text file
+        path: Destination file
+
+    Returns:
+        int: Number of signatures in the database
+    """
+    unique = set()
+    for line in signatures:
+        signature = "".join(line.split())
+        if signature and not signature.startswith("#"):
+            unique.add(signature)
+
+    entries = sorted(
+        (_selector_int(keccak(text=signature)), signature) for signature in unique
+    )
+    pool = bytearray()
+    records = bytearray(_RECORD.size * len(entries))
+    for index, (selector, signature) in enumerate(entries):
+        encoded = signature.encode()
+        if len(encoded) > 0xFFFF:
+            raise ValueError(f"Signature too long: {signature[:64]}...")
+        _RECORD.pack_into(
+            records, index * _RECORD.size, selector, len(pool), len(encoded)
+        )
+        pool += encoded
+    if len(pool) > 0xFFFFFFFF:
+        raise ValueError("String pool exceeds 4 GiB")
+
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as file:
+            file.write(_HEADER.pack(MAGIC, FORMAT_VERSION, len(entries)))
+            file.write(records)
+            file.write(pool)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+    return len(entries)
+
+
+def _file_identity(status: os.stat_result) -> Tuple[int, int, int, int]:
+    return status.st_dev, status.st_ino, status.st_mtime_ns, status.st_size
+
+
+class SelectorDatabase:
+    """Read-only, memory-mapped view of a compiled selector database.
+
+    Args:
+        path: File written by compile_selector_db
+
+    Raises:
+        ValueError: If the file isn't a selector database of this version
+    """
+
+    def __init__(self, path: Union[str, os.PathLike]) -> None:
+        self.path = os.fspath(path)
+        with open(self.path, "rb") as file:
+            self._identity = _file_identity(os.fstat(file.fileno()))
+            self._map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            self._count, self._pool_start = self._check_header()
+        except ValueError:
+            self._map.close()
+            raise
+
+    def _check_header(self) -> Tuple[int, int]:
+        """Validate the header against the file size, returning count and pool start."""
+        size = len(self._map)
+        if size < _HEADER.size:
+            raise ValueError(f"Not a selector database: {self.path}")
+        magic, version, count = _HEADER.unpack_from(self._map)
+        if magic != MAGIC or version != FORMAT_VERSION:
+            raise ValueError(
+                f"Not a selector database (format {FORMAT_VERSION}): {self.path}"
+            )
+        pool_start = _HEADER.size + count * _RECORD.size
+        pool_end = pool_start
+        if count and size >= pool_start:
+            # The pool is written in record order: the last string ends it
+            _, offset, length = _RECORD.unpack_from(
+                self._map, pool_start - _RECORD.size
+            )
+            pool_end += offset + length
+        if size != pool_end:
+            raise ValueError(
+                f"Corrupt selector database ({count} records need at least "
+                f"{max(pool_start, pool_end)} bytes, file has {size}): {self.path}"
+            )
+        return count, pool_start
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __enter__(self) -> "SelectorDatabase":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._map.close()
+
+    def replaced(self) -> bool:
+        """Tell whether the file was replaced or rewritten since it was mapped."""
+        try:
+            status = os.stat(self.path)
+        except FileNotFoundError:
+            # Removed: the mapping keeps the old content alive
+            return False
+        return _file_identity(status) != self._identity
+
+    def _selector_at(self, index: int) -> int:
+        return int(
+            _SELECTOR.unpack_from(self._map, _HEADER.size + index * _RECORD.size)[0]
+        )
+
+    def _signature_at(self, index: int) -> str:
+        _, offset, length = _RECORD.unpack_from(
+            self._map, _HEADER.size + index * _RECORD.size
+        )
+        start = self._pool_start + offset
+        end = start + length
+        return self._map[start:end].decode()
+
+    def lookup(self, selector: Selector) -> List[str]:
+        """
+        Find the signatures matching a selector.
+
+        Args:
+            selector: 4-byte selector or calldata (bytes or hex string), or int
+
+        Returns:
+            list: Matching signatures, sorted (several on selector collisions)
+        """
+        target = _selector_int(selector)
+        # Leftmost record with a selector >= target
+        low, high = 0, self._count
+        while low < high:
+            middle = (low + high) // 2
+            if self._selector_at(middle) < target:
+                low = middle + 1
+            else:
+                high = middle
+        matches = []
+        while low < self._count and self._selector_at(low) == target:
+            matches.append(self._signature_at(low))
+            low += 1
+        return matches
+
+
+_databases: Dict[str, SelectorDatabase] = {}
+
+
+def open_selector_db(path: Union[str, os.PathLike]) -> SelectorDatabase:
+    """
+    Open a selector database, reusing the mapping of an already open path.
+
+    The file is stat()ed on each call, and mapped again once it has been
+    replaced (compile_selector_db replaces it atomically). The previous
+    mapping is left to the threads still reading it and closed when they
+    drop it.
+    """
+    key = os.path.abspath(path)
+    database = _databases.get(key)
+    if database is not None and not database.replaced():
+        return database
+    fresh = SelectorDatabase(key)
+    if database is not None:
+        _databases[key] = fresh
+        return fresh
+    database = _databases.setdefault(key, fresh)
+    if database is not fresh:
+        # Another thread mapped it first
+        fresh.close()
+    return database
+
+
+def lookup_selector(
+    selector: Selector, path: Optional[Union[str, os.PathLike]] = None
+) -> List[str]:
+    """
+    Identify a function from its selector or calldata.
+
+    Args:
+        selector: 4-byte selector or calldata (bytes or hex string), or int
+        path: Selector database (defaults to $PYTHON_BOT_UTILS_SELECTOR_DB)
+
+    Returns:
+        list: Matching signatures (empty if the selector is unknown)
+
+    Example:
+        >>> lookup_selector("0xa9059cbb000000000000...", "selectors.db")
+        ['many_msg_babbage(bytes1)', 'transfer(address,uint256)']
+    """
+    if path is None:
+        path = os.environ.get(SELECTOR_DB_ENV)
+        if not path:
+            raise ValueError(
+                f"No selector database given and ${SELECTOR_DB_ENV} is not set"
+            )
+    return open_selector_db(path).lookup(selector)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m python_bot_utils.selector_db",
+        description="Compile or query a 4-byte selector database.",
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+    compile_parser = commands.add_parser(
+        "compile", help="Compile a signature list (one per line)"
+    )
+    compile_parser.add_argument("signatures", nargs="+", help="Signature list files")
+    compile_parser.add_argument("output", help="Database file to write")
+    lookup_parser = commands.add_parser("lookup", help="Look up selectors")
+    lookup_parser.add_argument("database", help="Database file")
+    lookup_parser.add_argument("selectors", nargs="+", help="Selectors or calldata")
+    options = parser.parse_args(argv)
+
+    if options.command == "compile":
+
+        def lines() -> Iterable[str]:
+            for name in options.signatures:
+                with open(name, encoding="utf-8") as file:
+                    yield from file
+
+        count = compile_selector_db(lines(), options.output)
+        print(f"{count} signatures written to {options.output}")
+    else:
+        with SelectorDatabase(options.database) as database:
+            for selector in options.selectors:
+                matches = database.lookup(selector)
+                print(f"{selector[:10]}: {', '.join(matches) or '(unknown)'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""Caches that stay contention-free when encoding from many threads.
+
+On a free-threaded (no-GIL) build, a cache shared by every thread serializes
+them on its lock. per_thread_cache gives each thread its own dict instead: a
+hit is a plain dict lookup with no lock and no shared writes. It suits small,
+deterministic results (callback payloads, pool addresses) that are cheap to
+recompute once per thread.
+"""
+
+import functools
+import threading
+from collections import OrderedDict
+from typing import Callable, Generic, Hashable, Optional, TypeVar
+
+R = TypeVar("R")
+
+
+class PerThreadCache(Generic[R]):
+    """Memoized function with one bounded dict per thread.
+
+    Each thread keeps at most maxsize results and drops its least recently
+    used entry first. cache_clear() invalidates the entries of every thread.
+
+    Args:
+        function: Function of hashable positional arguments
+        maxsize: Maximum number of results cached by each thread
+    """
+
+    def __init__(self, function: Callable[..., R], maxsize: int) -> None:
+        self.function = function
+        self.maxsize = maxsize
+        self._local = threading.local()
+        # Bumped by cache_clear: threads drop their dict on their next call
+        self._generation = 0
+        functools.update_wrapper(self, function)
+
+    def _entries(self) -> "OrderedDict[Hashable, R]":
+        local = self._local
+        entries: Optional["OrderedDict[Hashable, R]"] = getattr(local, "entries", None)
+        if entries is None or local.generation != self._generation:
+            entries = local.entries = OrderedDict()
+            local.generation = self._generation
+        return entries
+
+    def __call__(self, *args: Hashable) -> R:
+        entries = self._entries()
+        try:
+            result = entries[args]
+        except KeyError:
+            pass
+        else:
+            entries.move_to_end(args)
+            return result
+        result = self.function(*args)
+        if len(entries) >= self.maxsize:
+            entries.popitem(last=False)
+        entries[args] = result
+        return result
+
+    def cache_clear(self) -> None:
+        """Drop the cached results of every thread."""
+        self._generation += 1
+
+
+def per_thread_cache(
+    maxsize: int = 1024,
+) -> Callable[[Callable[..., R]], PerThreadCache[R]]:
+    """
+    Memoize a function per thread, like functools.lru_cache(maxsize).
+
+    Args:
+        maxsize: Maximum number of results cached by each thread
+
+    Returns:
+        A decorator wrapping the function into a PerThreadCache
+    """
+
+    def decorator(function: Callable[..., R]) -> PerThreadCache[R]:
+        return PerThreadCache(function, maxsize)
+
+    return decorator
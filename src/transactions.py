@@ -0,0 +1,248 @@
+"""EIP-1559 transaction envelopes for encoded calls, signed in parallel.
+
+Signing (secp256k1 + RLP) costs far more CPU than encoding the calldata, so
+batches are split into chunks and signed across a process pool. Nonces are
+assigned locally and sequentially, gas fields come from a FeePolicy, and the
+raw signed transactions are packed into one contiguous buffer for broadcast.
+"""
+
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import (
+    Any,
+    Dict,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+from eth_account import Account
+
+from .abi_decoder import HexOrBytes, to_bytes
+
+# Number of transactions signed per worker task
+DEFAULT_CHUNK_SIZE = 64
+
+# (to, data) or (to, data, value)
+TxCall = Union[Tuple[str, HexOrBytes], Tuple[str, HexOrBytes, int]]
+
+
+class FeePolicy(NamedTuple):
+    """Gas fields applied to every transaction of a batch.
+
+    Args:
+        max_fee_per_gas: maxFeePerGas, in wei
+        max_priority_fee_per_gas: maxPriorityFeePerGas, in wei
+        gas_limit: Gas limit of transactions without a per-selector limit
+        gas_limits: Gas limit per 4 byte function selector
+    """
+
+    max_fee_per_gas: int
+    max_priority_fee_per_gas: int
+    gas_limit: int = 500_000
+    gas_limits: Optional[Dict[bytes, int]] = None
+
+    def gas_for(self, data: bytes) -> int:
+        """Gas limit of a transaction with the given calldata."""
+        if self.gas_limits:
+            return self.gas_limits.get(data[:4], self.gas_limit)
+        return self.gas_limit
+
+
+class NonceManager:
+    """Hands out sequential nonces of one sender without querying the node.
+
+    Args:
+        next_nonce: Next unused nonce, e.g. from eth_getTransactionCount
+            (pending) at startup
+    """
+
+    def __init__(self, next_nonce: int):
+        self._next_nonce = next_nonce
+        self._lock = threading.Lock()
+
+    @property
+    def next_nonce(self) -> int:
+        return self._next_nonce
+
+    def reserve(self, count: int) -> range:
+        """Reserve count consecutive nonces."""
+        if count < 0:
+            raise ValueError(f"Invalid nonce count: {count}")
+        with self._lock:
+            start = self._next_nonce
+            self._next_nonce += count
+        return range(start, start + count)
+
+    def reset(self, next_nonce: int) -> None:
+        """Resynchronize with the node, e.g. after a dropped transaction."""
+        with self._lock:
+            self._next_nonce = next_nonce
+
+
+class SignedBatch(NamedTuple):
+    """Raw signed transactions packed back to back.
+
+    Transaction i is buffer[offsets[i]:offsets[i + 1]].
+    """
+
+    buffer: bytes
+    offsets: List[int]
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def raw_transaction(self, index: int) -> bytes:
+        start = self.offsets[index]
+        end = self.offsets[index + 1]
+        return self.buffer[start:end]
+
+    def raw_transactions(self) -> Iterator[bytes]:
+        view = memoryview(self.buffer)
+        for index in range(len(self)):
+            start = self.offsets[index]
+            end = self.offsets[index + 1]
+            yield bytes(view[start:end])
+
+
+def build_transactions(
+    calls: Sequence[TxCall],
+    chain_id: int,
+    fee_policy: FeePolicy,
+    nonces: Union[NonceManager, int],
+) -> List[Dict[str, Any]]:
+    """
+    Wrap encoded calls into EIP-1559 (type 2) transaction dicts.
+
+    Args:
+        calls: (to, data) or (to, data, value) tuples; data as returned by
+            the encoders (hex string) or bytes
+        chain_id: Chain ID
+        fee_policy: Gas fields of the transactions
+        nonces: NonceManager of the sender, or the nonce of the first
+            transaction
+
+    Returns:
+        list: Transaction dicts, accepted by eth_account's sign_transaction
+
+    Example:
+        >>> nonces = NonceManager(web3.eth.get_transaction_count(sender, "pending"))
+        >>> transactions = build_transactions(
+        ...     [(position_manager, encode_collect(...)) for ...],
+        ...     chain_id=1,
+        ...     fee_policy=FeePolicy(30 * 10**9, 10**9, gas_limit=300_000),
+        ...     nonces=nonces,
+        ... )
+    """
+    # Convert every call before reserving nonces: a failure after the
+    # reservation would leave a nonce gap stalling the sender
+    payloads = [
+        (call[0], to_bytes(call[1]), call[2] if len(call) > 2 else 0) for call in calls
+    ]
+    if isinstance(nonces, NonceManager):
+        nonce_range = nonces.reserve(len(payloads))
+    else:
+        nonce_range = range(nonces, nonces + len(payloads))
+
+    transactions = []
+    for (to, data, value), nonce in zip(payloads, nonce_range):
+        transactions.append(
+            {
+                "type": 2,
+                "chainId": chain_id,
+                "nonce": nonce,
+                "to": to,
+                "value": value,
+                "data": data,
+                "gas": fee_policy.gas_for(data),
+                "maxFeePerGas": fee_policy.max_fee_per_gas,
+                "maxPriorityFeePerGas": fee_policy.max_priority_fee_per_gas,
+            }
+        )
+    return transactions
+
+
+def _sign_chunk(private_key: bytes, transactions: List[Dict[str, Any]]) -> bytes:
+    """Sign transactions and return their raw bytes with 4 byte length prefixes."""
+    parts = []
+    for transaction in transactions:
+        raw = bytes(Account.sign_transaction(transaction, private_key).raw_transaction)
+        parts.append(len(raw).to_bytes(4, "big"))
+        parts.append(raw)
+    return b"".join(parts)
+
+
+def _pack(chunks: Sequence[bytes]) -> SignedBatch:
+    """Strip the length prefixes of signed chunks into one buffer + offsets."""
+    parts: List[bytes] = []
+    offsets = [0]
+    for chunk in chunks:
+        view = memoryview(chunk)
+        position = 0
+        while position < len(chunk):
+            header_end = position + 4
+            size = int.from_bytes(view[position:header_end], "big")
+            position = header_end
+            end = position + size
+            parts.append(view[position:end].tobytes())
+            offsets.append(offsets[-1] + size)
+            position = end
+    return SignedBatch(b"".join(parts), offsets)
+
+
+def sign_transactions(
+    private_key: HexOrBytes,
+    transactions: Sequence[Dict[str, Any]],
+    processes: Optional[int] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    executor: Optional[Executor] = None,
+) -> SignedBatch:
+    """
+    Sign transactions across a process pool.
+
+    Args:
+        private_key: Private key of the sender
+        transactions: Transaction dicts (see build_transactions)
+        processes: Number of worker processes (defaults to the CPU count);
+            1 signs in the calling process
+        chunk_size: Number of transactions per worker task
+        executor: Pool to reuse across batches instead of starting one per call
+
+    Returns:
+        SignedBatch: Raw signed transactions, in input order
+    """
+    key = to_bytes(private_key)
+    transactions = list(transactions)
+    if chunk_size < 1:
+        raise ValueError(f"Invalid chunk size: {chunk_size}")
+    chunks = []
+    for start in range(0, len(transactions), chunk_size):
+        end = start + chunk_size
+        chunks.append(transactions[start:end])
+
+    if executor is None and (processes == 1 or len(chunks) <= 1):
+        return _pack([_sign_chunk(key, chunk) for chunk in chunks])
+    if executor is not None:
+        return _pack(list(executor.map(_sign_chunk, [key] * len(chunks), chunks)))
+    with ProcessPoolExecutor(max_workers=processes) as pool:
+        return _pack(list(pool.map(_sign_chunk, [key] * len(chunks), chunks)))
+
+
+def broadcast(web3: Any, batch: SignedBatch) -> List[bytes]:
+    """
+    Send the signed transactions of a batch in nonce order.
+
+    Args:
+        web3: A connected web3.Web3 instance
+        batch: Signed transactions (see sign_transactions)
+
+    Returns:
+        list: Transaction hashes
+    """
+    return [
+        bytes(web3.eth.send_raw_transaction(raw)) for raw in batch.raw_transactions()
+    ]
@@ -1,12 +1,34 @@
+from .callback import encode_mint_callback_data
+from .events import decode_pool_logs
+from .liquidity_math import get_amounts_for_liquidity, get_sqrt_ratio_at_tick
 from .pool import encode_burn as pool_encode_burn
 from .pool import encode_collect as pool_encode_collect
 from .pool import encode_mint as pool_encode_mint
+from .pool_address import compute_pool_address, compute_pool_addresses
 from .position_manager import (
     encode_burn,
     encode_collect,
     encode_decreaseLiquidity,
     encode_increaseLiquidity,
     encode_mint,
+    encode_multicall,
+)
+from .universal_router import (
+    RoutePlanner,
+    encode_execute,
+    encode_execute_no_deadline,
+    encode_v3_path,
+)
+from .valuation import Position, ValuationEngine
+from .views import (
+    decode_liquidity_batch,
+    decode_positions,
+    decode_positions_batch,
+    decode_slot0,
+    decode_slot0_batch,
+    encode_liquidity,
+    encode_positions,
+    encode_slot0,
 )
 
 # Define what gets imported with "from package import *"
@@ -17,11 +39,38 @@ __all__ = [
     "encode_collect",
     "encode_increaseLiquidity",
     "encode_decreaseLiquidity",
+    "encode_multicall",
     # Router functions
     "encode_exactInputSingle",
     # Pool functions (with prefixed names to avoid conflicts)
     "pool_encode_mint",
     "pool_encode_burn",
     "pool_encode_collect",
+    # Pool callback data
+    "encode_mint_callback_data",
+    # Pool address derivation
+    "compute_pool_address",
+    "compute_pool_addresses",
+    # Universal Router
+    "RoutePlanner",
+    "encode_execute",
+    "encode_execute_no_deadline",
+    "encode_v3_path",
+    # Position valuation
+    "get_sqrt_ratio_at_tick",
+    "get_amounts_for_liquidity",
+    "Position",
+    "ValuationEngine",
+    # Event logs
+    "decode_pool_logs",
+    # View calls and return data
+    "encode_positions",
+    "encode_slot0",
+    "encode_liquidity",
+    "decode_positions",
+    "decode_positions_batch",
+    "decode_slot0",
+    "decode_slot0_batch",
+    "decode_liquidity_batch",
 ]
 __version__ = "0.1.2"
@@ -0,0 +1,50 @@
+"""Uniswap V3 pool callback data encoder."""
+
+from ..abi_encoder import compile_types
+from ..thread_cache import per_thread_cache
+
+# abi.encode(MintCallbackData({poolKey: PoolKey(token0, token1, fee), payer}))
+_MINT_CALLBACK_ENCODER = compile_types(["((address,address,uint24),address)"])
+
+
+def encode_mint_callback_data(token0: str, token1: str, fee: int, payer: str) -> bytes:
+    """Encode the data passed to uniswapV3MintCallback by the pool mint function.
+
+    Follows the periphery MintCallbackData layout (pool key, payer). Tokens are
+    sorted like PoolAddress.getPoolKey, so the order they are given in doesn't
+    matter. The payload is cached per (token0, token1, fee, payer): minting
+    repeatedly on the same pool reuses the same bytes object.
+
+    Args:
+        token0: Address of one token of the pool
+        token1: Address of the other token of the pool
+        fee: The fee tier of the pool (e.g., 3000 for 0.3%)
+        payer: The address paying for the minted liquidity in the callback
+
+    Returns:
+        bytes: Callback data, to be passed as `data` to pool.encode_mint
+
+    Example:
+        >>> data = encode_mint_callback_data(
+        ...     token0="0xC02aaA39b223FE8D0A0e5C4F27eAD9083C756Cc2",
+        ...     token1="0xA0b86991c6218b36c1d19D4a2e9Eb0cE3606eB48",
+        ...     fee=500,
+        ...     payer="0x742d35Cc6634C0532925a3b8D03c8C0B6B1A2b68",
+        ... )
+        >>> pool.encode_mint(owner, tick_lower, tick_upper, liquidity, data=data)
+        '0x3c8a7d8d...'
+    """
+    token0, token1 = token0.lower(), token1.lower()
+    if token0 > token1:
+        token0, token1 = token1, token0
+    return _encode_mint_callback_data(token0, token1, int(fee), payer.lower())
+
+
+@per_thread_cache(maxsize=1024)
+def _encode_mint_callback_data(token0: str, token1: str, fee: int, payer: str) -> bytes:
+    return _MINT_CALLBACK_ENCODER.encode([((token0, token1, fee), payer)])
+
+
+def clear_callback_cache() -> None:
+    """Drop every cached callback payload."""
+    _encode_mint_callback_data.cache_clear()
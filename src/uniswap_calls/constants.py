@@ -0,0 +1,17 @@
+"""Uniswap V3 protocol constants."""
+
+from typing import Dict, Tuple
+
+# TickMath.MIN_TICK / TickMath.MAX_TICK
+MIN_TICK = -887272
+MAX_TICK = 887272
+
+MAX_UINT128 = 2**128 - 1
+
+# Extra validation bounds for tick arguments, keyed by the encoder field names
+TICK_BOUNDS: Dict[str, Tuple[int, int]] = {
+    "tick_lower": (MIN_TICK, MAX_TICK),
+    "tick_upper": (MIN_TICK, MAX_TICK),
+    "tickLower": (MIN_TICK, MAX_TICK),
+    "tickUpper": (MIN_TICK, MAX_TICK),
+}
@@ -0,0 +1,133 @@
+"""Batch decoder for Uniswap V3 pool event logs."""
+
+from typing import Any, Dict, List, Mapping, NamedTuple, Optional, Sequence, Tuple
+
+from web3 import Web3
+
+from ..abi_decoder import decode_word_columns, index_column, to_bytes
+
+
+class EventSpec(NamedTuple):
+    name: str
+    signature: str
+    topic0: bytes
+    # (column name, type) of the indexed parameters, in topics[1:] order
+    indexed: List[Tuple[str, str]]
+    # (column name, type) of the parameters stored in the log data
+    data: List[Tuple[str, str]]
+
+
+def _event(
+    name: str,
+    signature: str,
+    indexed: List[Tuple[str, str]],
+    data: List[Tuple[str, str]],
+) -> EventSpec:
+    return EventSpec(name, signature, bytes(Web3.keccak(text=signature)), indexed, data)
+
+
+SWAP = _event(
+    "Swap",
+    "Swap(address,address,int256,int256,uint160,uint128,int24)",
+    indexed=[("sender", "address"), ("recipient", "address")],
+    data=[
+        ("amount0", "int256"),
+        ("amount1", "int256"),
+        ("sqrt_price_x96", "uint160"),
+        ("liquidity", "uint128"),
+        ("tick", "int24"),
+    ],
+)
+
+MINT = _event(
+    "Mint",
+    "Mint(address,address,int24,int24,uint128,uint256,uint256)",
+    indexed=[("owner", "address"), ("tick_lower", "int24"), ("tick_upper", "int24")],
+    data=[
+        ("sender", "address"),
+        ("amount", "uint128"),
+        ("amount0", "uint256"),
+        ("amount1", "uint256"),
+    ],
+)
+
+BURN = _event(
+    "Burn",
+    "Burn(address,int24,int24,uint128,uint256,uint256)",
+    indexed=[("owner", "address"), ("tick_lower", "int24"), ("tick_upper", "int24")],
+    data=[("amount", "uint128"), ("amount0", "uint256"), ("amount1", "uint256")],
+)
+
+COLLECT = _event(
+    "Collect",
+    "Collect(address,address,int24,int24,uint128,uint128)",
+    indexed=[("owner", "address"), ("tick_lower", "int24"), ("tick_upper", "int24")],
+    data=[("recipient", "address"), ("amount0", "uint128"), ("amount1", "uint128")],
+)
+
+POOL_EVENTS: Dict[bytes, EventSpec] = {
+    event.topic0: event for event in (SWAP, MINT, BURN, COLLECT)
+}
+
+
+def _topics_and_data(log: Any) -> Tuple[Sequence[Any], Any, Optional[int]]:
+    """Accept web3/JSON-RPC log dicts as well as (topics, data) pairs."""
+    if isinstance(log, Mapping):
+        log_index = log.get("logIndex")
+        if isinstance(log_index, str):
+            # JSON-RPC quantities are hex strings
+            log_index = int(log_index, 16)
+        return log["topics"], log["data"], log_index
+    return log[0], log[1], None
+
+
+def decode_pool_logs(logs: Sequence[Any]) -> Dict[str, Dict[str, Any]]:
+    """Decode Swap, Mint, Burn and Collect logs of Uniswap V3 pools into columns.
+
+    Logs are grouped by topic0 in one pass, then every field of an event type
+    is sliced out of the joined 32 byte words at once. Logs with any other
+    topic0 are skipped.
+
+    Args:
+        logs: Logs as returned by eth_getLogs / web3 (mappings with "topics"
+            and "data") or (topics, data) pairs, as hex strings or bytes
+
+    Returns:
+        dict: For each event name ("Swap", "Mint", "Burn", "Collect"), a dict
+        of columns: "row" (position in logs), "log_index" (the logIndex of
+        the logs, unless one of the logs of that event has none) and one
+        column per event parameter (see abi_decoder.decode_word_columns for column types)
+
+    Example:
+        >>> columns = decode_pool_logs(web3.eth.get_logs({"address": pool}))
+        >>> columns["Swap"]["tick"]
+        array([201234, 201236, ...])
+        >>> columns["Swap"]["sqrt_price_x96"]
+        array([1771595571142957166518320255467520, ...], dtype=object)
+    """
+    grouped: Dict[bytes, Tuple[List[int], List[Any], List[bytes], List[bytes]]] = {
+        topic0: ([], [], [], []) for topic0 in POOL_EVENTS
+    }
+    for position, log in enumerate(logs):
+        topics, data, log_index = _topics_and_data(log)
+        if not topics:
+            continue
+        group = grouped.get(to_bytes(topics[0]))
+        if group is None:
+            continue
+        group[0].append(position)
+        group[1].append(log_index)
+        group[2].append(b"".join(to_bytes(topic) for topic in topics[1:]))
+        group[3].append(to_bytes(data))
+
+    columns: Dict[str, Dict[str, Any]] = {}
+    for topic0, event in POOL_EVENTS.items():
+        positions, log_indexes, topic_blobs, data_blobs = grouped[topic0]
+        event_columns: Dict[str, Any] = {"row": index_column(positions)}
+        # Each event gets the column unless one of its own logs has no logIndex
+        if None not in log_indexes:
+            event_columns["log_index"] = index_column(log_indexes)
+        event_columns.update(decode_word_columns(event.indexed, topic_blobs))
+        event_columns.update(decode_word_columns(event.data, data_blobs))
+        columns[event.name] = event_columns
+    return columns
@@ -0,0 +1,162 @@
+"""Exact integer ports of the Uniswap V3 TickMath and LiquidityAmounts libraries."""
+
+from typing import Tuple
+
+from .constants import MAX_TICK, MIN_TICK
+
+Q96 = 1 << 96
+MAX_UINT256 = (1 << 256) - 1
+
+# TickMath.MIN_SQRT_RATIO / MAX_SQRT_RATIO
+MIN_SQRT_RATIO = 4295128739
+MAX_SQRT_RATIO = 1461446703485210103287273052203988822378723970342
+
+# sqrt(1.0001) ** -(2 ** bit) as Q128.128, for bits 1..19 of |tick|
+_TICK_FACTORS = [
+    (0x2, 0xFFF97272373D413259A46990580E213A),
+    (0x4, 0xFFF2E50F5F656932EF12357CF3C7FDCC),
+    (0x8, 0xFFE5CACA7E10E4E61C3624EAA0941CD0),
+    (0x10, 0xFFCB9843D60F6159C9DB58835C926644),
+    (0x20, 0xFF973B41FA98C081472E6896DFB254C0),
+    (0x40, 0xFF2EA16466C96A3843EC78B326B52861),
+    (0x80, 0xFE5DEE046A99A2A811C461F1969C3053),
+    (0x100, 0xFCBE86C7900A88AEDCFFC83B479AA3A4),
+    (0x200, 0xF987A7253AC413176F2B074CF7815E54),
+    (0x400, 0xF3392B0822B70005940C7A398E4B70F3),
+    (0x800, 0xE7159475A2C29B7443B29C7FA6E889D9),
+    (0x1000, 0xD097F3BDFD2022B8845AD8F792AA5825),
+    (0x2000, 0xA9F746462D870FDF8A65DC1F90E061E5),
+    (0x4000, 0x70D869A156D2A1B890BB3DF62BAF32F7),
+    (0x8000, 0x31BE135F97D08FD981231505542FCFA6),
+    (0x10000, 0x9AA508B5B7A84E1C677DE54F3E99BC9),
+    (0x20000, 0x5D6AF8DEDB81196699C329225EE604),
+    (0x40000, 0x2216E584F5FA1EA926041BEDFE98),
+    (0x80000, 0x48A170391F7DC42444E8FA2),
+]
+
+
+def get_sqrt_ratio_at_tick(tick: int) -> int:
+    """
+    TickMath.getSqrtRatioAtTick: sqrt(1.0001 ** tick) * 2 ** 96, rounded up.
+
+    Args:
+        tick: Tick in [MIN_TICK, MAX_TICK]
+
+    Returns:
+        int: The sqrt price as a Q64.96
+    """
+    abs_tick = -tick if tick < 0 else tick
+    if abs_tick > MAX_TICK:
+        raise ValueError(f"Tick out of range [{MIN_TICK}, {MAX_TICK}]: {tick}")
+
+    ratio = (
+        0xFFFCB933BD6FAD37AA2D162D1A594001
+        if abs_tick & 0x1
+        else 0x100000000000000000000000000000000
+    )
+    for bit, factor in _TICK_FACTORS:
+        if abs_tick & bit:
+            ratio = (ratio * factor) >> 128
+    if tick > 0:
+        ratio = MAX_UINT256 // ratio
+
+    # Q128.128 to Q64.96, rounding up
+    return (ratio >> 32) + (1 if ratio & 0xFFFFFFFF else 0)
+
+
+def get_amount0_for_liquidity(
+    sqrt_ratio_a: int, sqrt_ratio_b: int, liquidity: int
+) -> int:
+    """LiquidityAmounts.getAmount0ForLiquidity (rounded down)."""
+    if sqrt_ratio_a > sqrt_ratio_b:
+        sqrt_ratio_a, sqrt_ratio_b = sqrt_ratio_b, sqrt_ratio_a
+    return (
+        (liquidity << 96) * (sqrt_ratio_b - sqrt_ratio_a) // sqrt_ratio_b
+    ) // sqrt_ratio_a
+
+
+def get_amount1_for_liquidity(
+    sqrt_ratio_a: int, sqrt_ratio_b: int, liquidity: int
+) -> int:
+    """LiquidityAmounts.getAmount1ForLiquidity (rounded down)."""
+    if sqrt_ratio_a > sqrt_ratio_b:
+        sqrt_ratio_a, sqrt_ratio_b = sqrt_ratio_b, sqrt_ratio_a
+    return liquidity * (sqrt_ratio_b - sqrt_ratio_a) // Q96
+
+
+def get_amounts_for_liquidity(
+    sqrt_price_x96: int, sqrt_ratio_a: int, sqrt_ratio_b: int, liquidity: int
+) -> Tuple[int, int]:
+    """
+    LiquidityAmounts.getAmountsForLiquidity: token amounts of a position.
+
+    Args:
+        sqrt_price_x96: Current pool sqrt price
+        sqrt_ratio_a: Sqrt price at one tick boundary of the position
+        sqrt_ratio_b: Sqrt price at the other tick boundary
+        liquidity: Liquidity of the position
+
+    Returns:
+        tuple: (amount0, amount1)
+    """
+    if sqrt_ratio_a > sqrt_ratio_b:
+        sqrt_ratio_a, sqrt_ratio_b = sqrt_ratio_b, sqrt_ratio_a
+    if sqrt_price_x96 <= sqrt_ratio_a:
+        return get_amount0_for_liquidity(sqrt_ratio_a, sqrt_ratio_b, liquidity), 0
+    if sqrt_price_x96 < sqrt_ratio_b:
+        return (
+            get_amount0_for_liquidity(sqrt_price_x96, sqrt_ratio_b, liquidity),
+            get_amount1_for_liquidity(sqrt_ratio_a, sqrt_price_x96, liquidity),
+        )
+    return 0, get_amount1_for_liquidity(sqrt_ratio_a, sqrt_ratio_b, liquidity)
+
+
+def get_liquidity_for_amount0(
+    sqrt_ratio_a: int, sqrt_ratio_b: int, amount0: int
+) -> int:
+    """LiquidityAmounts.getLiquidityForAmount0 (rounded down)."""
+    if sqrt_ratio_a > sqrt_ratio_b:
+        sqrt_ratio_a, sqrt_ratio_b = sqrt_ratio_b, sqrt_ratio_a
+    intermediate = sqrt_ratio_a * sqrt_ratio_b // Q96
+    return amount0 * intermediate // (sqrt_ratio_b - sqrt_ratio_a)
+
+
+def get_liquidity_for_amount1(
+    sqrt_ratio_a: int, sqrt_ratio_b: int, amount1: int
+) -> int:
+    """LiquidityAmounts.getLiquidityForAmount1 (rounded down)."""
+    if sqrt_ratio_a > sqrt_ratio_b:
+        sqrt_ratio_a, sqrt_ratio_b = sqrt_ratio_b, sqrt_ratio_a
+    return amount1 * Q96 // (sqrt_ratio_b - sqrt_ratio_a)
+
+
+def get_liquidity_for_amounts(
+    sqrt_price_x96: int,
+    sqrt_ratio_a: int,
+    sqrt_ratio_b: int,
+    amount0: int,
+    amount1: int,
+) -> int:
+    """
+    LiquidityAmounts.getLiquidityForAmounts: liquidity minted for amounts.
+
+    Args:
+        sqrt_price_x96: Current pool sqrt price
+        sqrt_ratio_a: Sqrt price at one tick boundary of the position
+        sqrt_ratio_b: Sqrt price at the other tick boundary
+        amount0: Amount of token0 available
+        amount1: Amount of token1 available
+
+    Returns:
+        int: The maximum liquidity the amounts can mint
+    """
+    if sqrt_ratio_a > sqrt_ratio_b:
+        sqrt_ratio_a, sqrt_ratio_b = sqrt_ratio_b, sqrt_ratio_a
+    if sqrt_price_x96 <= sqrt_ratio_a:
+        return get_liquidity_for_amount0(sqrt_ratio_a, sqrt_ratio_b, amount0)
+    if sqrt_price_x96 < sqrt_ratio_b:
+        return min(
+            get_liquidity_for_amount0(sqrt_price_x96, sqrt_ratio_b, amount0),
+            get_liquidity_for_amount1(sqrt_ratio_a, sqrt_price_x96, amount1),
+        )
+    return get_liquidity_for_amount1(sqrt_ratio_a, sqrt_ratio_b, amount1)
@@ -1,9 +1,48 @@
 """Uniswap V3 function encoder."""
 
-# todo: test
-from typing import cast
+from typing import Union
+
+from ..registry import Field, FunctionSpec, ProtocolSpec, register_protocol
+from .constants import TICK_BOUNDS
+
+POOL = ProtocolSpec(
+    "uniswap_v3_pool",
+    [
+        FunctionSpec(
+            "mint",
+            [
+                Field("owner", "address"),
+                Field("tick_lower", "int24"),
+                Field("tick_upper", "int24"),
+                Field("liquidity", "uint128"),
+                Field("data", "bytes"),
+            ],
+            bounds=TICK_BOUNDS,
+        ),
+        FunctionSpec(
+            "burn",
+            [
+                Field("tick_lower", "int24"),
+                Field("tick_upper", "int24"),
+                Field("liquidity", "uint128"),
+            ],
+            bounds=TICK_BOUNDS,
+        ),
+        FunctionSpec(
+            "collect",
+            [
+                Field("recipient", "address"),
+                Field("tickLower", "int24"),
+                Field("tickUpper", "int24"),
+                Field("amount0Requested", "uint128"),
+                Field("amount1Requested", "uint128"),
+            ],
+            bounds=TICK_BOUNDS,
+        ),
+    ],
+)
 
-from ..call_encoder import encode_call
+_encoders = register_protocol(POOL, __name__)
 
 
 def encode_mint(
@@ -11,7 +50,9 @@ def encode_mint(
     tick_lower: int,
     tick_upper: int,
     liquidity: int,
-    data: str,
+    data: Union[str, bytes],
+    *,
+    trusted: bool = False,
 ) -> str:
     """Encode a call to the Uniswap V3 pool mint function, avoiding the position manager.
 
@@ -22,7 +63,9 @@ def encode_mint(
         tick_lower: The lower tick of the position
         tick_upper: The upper tick of the position
         amount: The desired amount of liquidity to mint
-        data: Callback data to be passed to the callback function
+        data: Callback data to be passed to the callback function, as a hex
+            string or bytes (see callback.encode_mint_callback_data)
+        trusted: Skip argument validation
 
     Returns:
         str: Encoded call data with 0x prefix
@@ -35,24 +78,18 @@ def encode_mint(
         ...     amount=1000000000000000000,  # liquidity amount
         ...     data="0x...." # Example callback data
     """
-    # Uniswap V3 mint function signature
-    mint_signature = "mint(address,int24,int24,uint128,bytes)"
-
-    # Use the encode_call function to encode the transaction
-    return cast(
-        str,
-        encode_call(
-            abi_or_signature=mint_signature,
-            function_name="mint",
-            args=[owner, tick_lower, tick_upper, liquidity, data],
-        ),
+    return _encoders["encode_mint"](
+        owner, tick_lower, tick_upper, liquidity, data, trusted=trusted
     )
 
-    print(owner, tick_lower, tick_upper, liquidity)
-    raise NotImplementedError("The mint function encoder is not implemented yet. ")
-
 
-def encode_burn(tick_lower: int, tick_upper: int, liquidity: int) -> str:
+def encode_burn(
+    tick_lower: int,
+    tick_upper: int,
+    liquidity: int,
+    *,
+    trusted: bool = False,
+) -> str:
     """Encode a call to the Uniswap V3 pool burn function.
 
     Burns liquidity for a specific position
@@ -61,6 +98,7 @@ def encode_burn(tick_lower: int, tick_upper: int, liquidity: int) -> str:
         tick_lower: The lower tick of the position
         tick_upper: The upper tick of the position
         amount: The amount of liquidity to burn
+        trusted: Skip argument validation
 
     Returns:
         str: Encoded call data with 0x prefix
@@ -69,18 +107,7 @@ def encode_burn(tick_lower: int, tick_upper: int, liquidity: int) -> str:
         >>> encode_burn(-87272, 87272, 10000000000000000)
         '0x42966c68...'
     """
-    # Uniswap V3 burn function signature
-    burn_signature = "burn(int24,int24,uint128)"
-
-    # Use the encode_call function to encode the transaction
-    return cast(
-        str,
-        encode_call(
-            abi_or_signature=burn_signature,
-            function_name="burn",
-            args=[tick_lower, tick_upper, liquidity],
-        ),
-    )
+    return _encoders["encode_burn"](tick_lower, tick_upper, liquidity, trusted=trusted)
 
 
 def encode_collect(
@@ -89,6 +116,8 @@ def encode_collect(
     tickUpper: int,
     amount0Requested: int,
     amount1Requested: int,
+    *,
+    trusted: bool = False,
 ) -> str:
     """Encode a call to the Uniswap V3 pool collect function.
 
@@ -101,6 +130,7 @@ def encode_collect(
         tickUpper: The upper tick of the position
         amount0Requested: The maximum amount of token0 to collect
         amount1Requested: The maximum amount of token1 to collect
+        trusted: Skip argument validation
 
     Returns:
         str: Encoded call data with 0x prefix
@@ -114,15 +144,11 @@ def encode_collect(
         ... )
         '0xfc6f7865...'
     """
-    # Uniswap V3 collect function signature
-    collect_signature = "collect(address,int24,int24,uint128,uint128)"
-
-    # Use the encode_call function to encode the transaction
-    return cast(
-        str,
-        encode_call(
-            abi_or_signature=collect_signature,
-            function_name="collect",
-            args=[recipient, tickLower, tickUpper, amount0Requested, amount1Requested],
-        ),
+    return _encoders["encode_collect"](
+        recipient,
+        tickLower,
+        tickUpper,
+        amount0Requested,
+        amount1Requested,
+        trusted=trusted,
     )
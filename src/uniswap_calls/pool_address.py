@@ -0,0 +1,163 @@
+"""Uniswap V3 pool address derivation (CREATE2), without any RPC call."""
+
+import re
+from typing import List, Sequence, Tuple
+
+from web3 import Web3
+
+from ..thread_cache import per_thread_cache
+
+# UniswapV3Factory on Ethereum mainnet (and most chains deployed by Uniswap Labs)
+UNISWAP_V3_FACTORY = "0x1F98431c8aD98523631AE4a59f267346ea31F984"
+
+# PoolAddress.POOL_INIT_CODE_HASH: keccak256 of the UniswapV3Pool creation code
+POOL_INIT_CODE_HASH = (
+    "0xe34f199b19b2b4f47f68442619d555527d244f78a3297ea89325f843f87b8b54"
+)
+
+
+_HEX_RE = re.compile(r"^0x[0-9a-fA-F]*$")
+
+
+def _check_hex(value: str, size: int, name: str) -> str:
+    """Return a 0x-prefixed hex string of size bytes, lowercased."""
+    valid = isinstance(value, str) and len(value) == 2 + 2 * size
+    if not valid or not _HEX_RE.match(value):
+        raise ValueError(
+            f"Invalid {name}: expected a 0x-prefixed {size} byte hex string, "
+            f"got {value!r}"
+        )
+    return value.lower()
+
+
+def _check_fee(fee: int) -> int:
+    fee = int(fee)
+    if not 0 <= fee < 2**24:
+        raise ValueError(f"Invalid fee (uint24): {fee}")
+    return fee
+
+
+def sort_tokens(token0: str, token1: str) -> Tuple[str, str]:
+    """Return the two token addresses (lowercased) in pool order."""
+    token0 = _check_hex(token0, 20, "token address")
+    token1 = _check_hex(token1, 20, "token address")
+    if token0 > token1:
+        return token1, token0
+    return token0, token1
+
+
+def compute_pool_address(
+    factory: str,
+    token0: str,
+    token1: str,
+    fee: int,
+    init_code_hash: str = POOL_INIT_CODE_HASH,
+) -> str:
+    """Compute the address of a Uniswap V3 pool, like PoolAddress.computeAddress.
+
+    Tokens are sorted first, so the order they are given in doesn't matter.
+    Results are cached per (factory, tokens, fee, init code hash).
+
+    Args:
+        factory: The Uniswap V3 factory that deployed the pool
+        token0: Address of one token of the pool
+        token1: Address of the other token of the pool
+        fee: The fee tier of the pool (e.g., 500 for 0.05%, 3000 for 0.3%)
+        init_code_hash: keccak256 of the pool creation code (differs on
+            some forks)
+
+    Returns:
+        str: The checksummed pool address
+
+    Raises:
+        ValueError: If an address, the init code hash or the fee is malformed
+
+    Example:
+        >>> compute_pool_address(
+        ...     factory=UNISWAP_V3_FACTORY,
+        ...     token0="0xC02aaA39b223FE8D0A0e5C4F27eAD9083C756Cc2",  # WETH
+        ...     token1="0xA0b86991c6218b36c1d19D4a2e9Eb0cE3606eB48",  # USDC
+        ...     fee=500,
+        ... )
+        '0x88e6A0c2dDD26FEEb64F039a2c41296FcB3f5640'
+    """
+    token0, token1 = sort_tokens(token0, token1)
+    return _compute_pool_address(
+        _check_hex(factory, 20, "factory address"),
+        token0,
+        token1,
+        _check_fee(fee),
+        _check_hex(init_code_hash, 32, "init code hash"),
+    )
+
+
+def compute_pool_addresses(
+    factory: str,
+    pairs: Sequence[Tuple[str, str]],
+    fees: Sequence[int],
+    init_code_hash: str = POOL_INIT_CODE_HASH,
+) -> List[List[str]]:
+    """Compute the pool addresses of many token pairs over many fee tiers.
+
+    Args:
+        factory: The Uniswap V3 factory that deployed the pools
+        pairs: (token0, token1) pairs, in any token order
+        fees: Fee tiers to derive for every pair
+        init_code_hash: keccak256 of the pool creation code
+
+    Returns:
+        list: One row per pair with one checksummed address per fee tier,
+        i.e. result[i][j] is the pool of pairs[i] with fees[j]
+
+    Example:
+        >>> compute_pool_addresses(
+        ...     UNISWAP_V3_FACTORY,
+        ...     [(WETH, USDC), (WETH, DAI)],
+        ...     [500, 3000],
+        ... )
+        [['0x88e6A0c2...', '0x8ad599c3...'], ['0x60594a40...', '0xC2e9F25B...']]
+    """
+    factory = _check_hex(factory, 20, "factory address")
+    init_code_hash = _check_hex(init_code_hash, 32, "init code hash")
+    fees = [_check_fee(fee) for fee in fees]
+
+    addresses: List[List[str]] = []
+    for token0, token1 in pairs:
+        token0, token1 = sort_tokens(token0, token1)
+        addresses.append(
+            [
+                _compute_pool_address(factory, token0, token1, fee, init_code_hash)
+                for fee in fees
+            ]
+        )
+    return addresses
+
+
+@per_thread_cache(maxsize=4096)
+def _compute_pool_address(
+    factory: str, token0: str, token1: str, fee: int, init_code_hash: str
+) -> str:
+    # salt = keccak256(abi.encode(token0, token1, fee)): three static words
+    salt_preimage = b"".join(
+        [
+            bytes.fromhex(token0[2:]).rjust(32, b"\0"),
+            bytes.fromhex(token1[2:]).rjust(32, b"\0"),
+            fee.to_bytes(32, "big"),
+        ]
+    )
+    # address = keccak256(0xff ++ factory ++ salt ++ init_code_hash)[12:]
+    preimage = b"".join(
+        [
+            b"\xff",
+            bytes.fromhex(factory[2:]),
+            bytes(Web3.keccak(salt_preimage)),
+            bytes.fromhex(init_code_hash[2:]),
+        ]
+    )
+    digest = Web3.keccak(preimage)
+    return Web3.to_checksum_address(digest[12:])
+
+
+def clear_pool_address_cache() -> None:
+    """Drop every cached pool address."""
+    _compute_pool_address.cache_clear()
@@ -1,6 +1,78 @@
-from typing import cast
+from typing import Sequence, Union
+
+from ..registry import Field, FunctionSpec, ProtocolSpec, register_protocol
+from .constants import TICK_BOUNDS
+
+POSITION_MANAGER = ProtocolSpec(
+    "uniswap_v3_position_manager",
+    [
+        FunctionSpec(
+            "mint",
+            [
+                Field("token0", "address"),
+                Field("token1", "address"),
+                Field("fee", "uint24"),
+                Field("tick_lower", "int24"),
+                Field("tick_upper", "int24"),
+                Field("amount0_desired", "uint256"),
+                Field("amount1_desired", "uint256"),
+                Field("amount0_min", "uint256"),
+                Field("amount1_min", "uint256"),
+                Field("recipient", "address"),
+                Field("deadline", "uint256"),
+            ],
+            struct=True,
+            bounds=TICK_BOUNDS,
+        ),
+        FunctionSpec(
+            "burn",
+            [
+                Field("token_id", "uint256"),
+            ],
+        ),
+        FunctionSpec(
+            "increaseLiquidity",
+            [
+                Field("token_id", "uint256"),
+                Field("amount0_desired", "uint256"),
+                Field("amount1_desired", "uint256"),
+                Field("amount0_min", "uint256"),
+                Field("amount1_min", "uint256"),
+                Field("deadline", "uint256"),
+            ],
+            struct=True,
+        ),
+        FunctionSpec(
+            "decreaseLiquidity",
+            [
+                Field("token_id", "uint256"),
+                Field("liquidity", "uint128"),
+                Field("amount0_min", "uint256"),
+                Field("amount1_min", "uint256"),
+                Field("deadline", "uint256"),
+            ],
+            struct=True,
+        ),
+        FunctionSpec(
+            "collect",
+            [
+                Field("token_id", "uint256"),
+                Field("recipient", "address"),
+                Field("amount0_max", "uint128"),
+                Field("amount1_max", "uint128"),
+            ],
+            struct=True,
+        ),
+        FunctionSpec(
+            "multicall",
+            [
+                Field("data", "bytes[]"),
+            ],
+        ),
+    ],
+)
 
-from ..call_encoder import encode_call
+_encoders = register_protocol(POSITION_MANAGER, __name__)
 
 
 def encode_mint(
@@ -15,6 +87,8 @@ def encode_mint(
     amount1_min: int,
     recipient: str,
     deadline: int,
+    *,
+    trusted: bool = False,
 ) -> str:
     """Encode a call to the Uniswap V3 mint function.
 
@@ -30,6 +104,7 @@ def encode_mint(
         amount1_min: The minimum amount of token1 to spend
         recipient: The address that will receive the NFT
         deadline: The time by which the transaction must be included
+        trusted: Skip argument validation
 
     Returns:
         str: Encoded call data with 0x prefix
@@ -50,15 +125,7 @@ def encode_mint(
         ... )
         '0x88316456...'
     """
-    # Uniswap V3 mint function signature
-    mint_signature = (
-        "mint("
-        "(address,address,uint24,int24,int24,uint256,uint256,uint256,uint256,address,uint256)"
-        ")"
-    )
-
-    # Pack all parameters into a tuple (struct)
-    mint_params = (
+    return _encoders["encode_mint"](
         token0,
         token1,
         fee,
@@ -70,18 +137,15 @@ def encode_mint(
         amount1_min,
         recipient,
         deadline,
-    )
-
-    # Use the encode_call function to encode the transaction
-    return cast(
-        str,
-        encode_call(
-            abi_or_signature=mint_signature, function_name="mint", args=[mint_params]
-        ),
+        trusted=trusted,
     )
 
 
-def encode_burn(token_id: int) -> str:
+def encode_burn(
+    token_id: int,
+    *,
+    trusted: bool = False,
+) -> str:
     """Encode a call to the Uniswap V3 NonFungiblePositionManager burn function.
 
     Burns a token ID, which deletes it from the NFT contract. The token must
@@ -89,6 +153,7 @@ def encode_burn(token_id: int) -> str:
 
     Args:
         token_id: The ID of the token that is being burned
+        trusted: Skip argument validation
 
     Returns:
         str: Encoded call data with 0x prefix
@@ -97,16 +162,7 @@ def encode_burn(token_id: int) -> str:
         >>> encode_burn(token_id=12345)
         '0x42966c68...'
     """
-    # Uniswap V3 burn function signature
-    burn_signature = "burn(uint256)"
-
-    # Use the encode_call function to encode the transaction
-    return cast(
-        str,
-        encode_call(
-            abi_or_signature=burn_signature, function_name="burn", args=[token_id]
-        ),
-    )
+    return _encoders["encode_burn"](token_id, trusted=trusted)
 
 
 def encode_increaseLiquidity(
@@ -116,6 +172,8 @@ def encode_increaseLiquidity(
     amount0_min: int,
     amount1_min: int,
     deadline: int,
+    *,
+    trusted: bool = False,
 ) -> str:
     """Encode a call to the Uniswap V3 NonFungiblePositionManager increaseLiquidity function.
 
@@ -129,6 +187,7 @@ def encode_increaseLiquidity(
         amount0_min: The minimum amount of token0 to spend (slippage protection)
         amount1_min: The minimum amount of token1 to spend (slippage protection)
         deadline: The time by which the transaction must be included
+        trusted: Skip argument validation
 
     Returns:
         str: Encoded call data with 0x prefix
@@ -144,29 +203,14 @@ def encode_increaseLiquidity(
         ... )
         '0x219f5d17...'
     """
-    # Uniswap V3 increaseLiquidity function signature
-    increase_liquidity_signature = (
-        "increaseLiquidity(" "(uint256,uint256,uint256,uint256,uint256,uint256)" ")"
-    )
-
-    # Pack all parameters into a tuple (struct)
-    increase_liquidity_params = (
+    return _encoders["encode_increaseLiquidity"](
         token_id,
         amount0_desired,
         amount1_desired,
         amount0_min,
         amount1_min,
         deadline,
-    )
-
-    # Use the encode_call function to encode the transaction
-    return cast(
-        str,
-        encode_call(
-            abi_or_signature=increase_liquidity_signature,
-            function_name="increaseLiquidity",
-            args=[increase_liquidity_params],
-        ),
+        trusted=trusted,
     )
 
 
@@ -176,6 +220,8 @@ def encode_decreaseLiquidity(
     amount0_min: int,
     amount1_min: int,
     deadline: int,
+    *,
+    trusted: bool = False,
 ) -> str:
     """Encode a call to the Uniswap V3 NonFungiblePositionManager decreaseLiquidity function.
 
@@ -188,6 +234,7 @@ def encode_decreaseLiquidity(
         amount0_min: The minimum amount of token0 that should be accounted for the burned liquidity
         amount1_min: The minimum amount of token1 that should be accounted for the burned liquidity
         deadline: The time by which the transaction must be included
+        trusted: Skip argument validation
 
     Returns:
         str: Encoded call data with 0x prefix
@@ -202,28 +249,8 @@ def encode_decreaseLiquidity(
         ... )
         '0x0c49ccbe...'
     """
-    # Uniswap V3 decreaseLiquidity function signature
-    decrease_liquidity_signature = (
-        "decreaseLiquidity(" "(uint256,uint128,uint256,uint256,uint256)" ")"
-    )
-
-    # Pack all parameters into a tuple (struct)
-    decrease_liquidity_params = (
-        token_id,
-        liquidity,
-        amount0_min,
-        amount1_min,
-        deadline,
-    )
-
-    # Use the encode_call function to encode the transaction
-    return cast(
-        str,
-        encode_call(
-            abi_or_signature=decrease_liquidity_signature,
-            function_name="decreaseLiquidity",
-            args=[decrease_liquidity_params],
-        ),
+    return _encoders["encode_decreaseLiquidity"](
+        token_id, liquidity, amount0_min, amount1_min, deadline, trusted=trusted
     )
 
 
@@ -232,6 +259,8 @@ def encode_collect(
     recipient: str,
     amount0_max: int,
     amount1_max: int,
+    *,
+    trusted: bool = False,
 ) -> str:
     """Encode a call to the Uniswap V3 NonFungiblePositionManager collect function.
 
@@ -243,6 +272,7 @@ def encode_collect(
         recipient: The account that should receive the tokens
         amount0_max: The maximum amount of token0 to collect
         amount1_max: The maximum amount of token1 to collect
+        trusted: Skip argument validation
 
     Returns:
         str: Encoded call data with 0x prefix
@@ -256,23 +286,35 @@ def encode_collect(
         ... )
         '0xfc6f7865...'
     """
-    # Uniswap V3 collect function signature
-    collect_signature = "collect(" "(uint256,address,uint128,uint128)" ")"
-
-    # Pack all parameters into a tuple (struct)
-    collect_params = (
-        token_id,
-        recipient,
-        amount0_max,
-        amount1_max,
+    return _encoders["encode_collect"](
+        token_id, recipient, amount0_max, amount1_max, trusted=trusted
     )
 
-    # Use the encode_call function to encode the transaction
-    return cast(
-        str,
-        encode_call(
-            abi_or_signature=collect_signature,
-            function_name="collect",
-            args=[collect_params],
-        ),
-    )
+
+def encode_multicall(
+    data: Sequence[Union[str, bytes]],
+    *,
+    trusted: bool = False,
+) -> str:
+    """Encode a call to the Uniswap V3 NonFungiblePositionManager multicall function.
+
+    Runs several position manager calls in one transaction, e.g. a
+    decreaseLiquidity followed by a collect.
+
+    Args:
+        data: Encoded calls to the position manager (hex strings or bytes)
+        trusted: Skip argument validation
+
+    Returns:
+        str: Encoded call data with 0x prefix
+
+    Example:
+        >>> encode_multicall(
+        ...     data=[
+        ...         encode_decreaseLiquidity(12345, liquidity, 0, 0, 1640995200),
+        ...         encode_collect(12345, recipient, MAX_UINT128, MAX_UINT128),
+        ...     ]
+        ... )
+        '0xac9650d8...'
+    """
+    return _encoders["encode_multicall"](data, trusted=trusted)
@@ -1,9 +1,29 @@
-from typing import cast
-
-from ..call_encoder import encode_call
+from ..registry import Field, FunctionSpec, ProtocolSpec, register_protocol
 
 # todo: add: "exactOutputSingle","exactInput" and "exactOutput" function encoders
 
+SWAP_ROUTER = ProtocolSpec(
+    "uniswap_v3_swap_router",
+    [
+        FunctionSpec(
+            "exactInputSingle",
+            [
+                Field("token_in", "address"),
+                Field("token_out", "address"),
+                Field("fee", "uint24"),
+                Field("recipient", "address"),
+                Field("deadline", "uint256"),
+                Field("amount_in", "uint256"),
+                Field("amount_out_minimum", "uint256"),
+                Field("sqrt_price_limit_x96", "uint160", default=0),
+            ],
+            struct=True,
+        ),
+    ],
+)
+
+_encoders = register_protocol(SWAP_ROUTER, __name__)
+
 
 def encode_exactInputSingle(
     token_in: str,
@@ -13,7 +33,9 @@ def encode_exactInputSingle(
     deadline: int,
     amount_in: int,
     amount_out_minimum: int,
-    sqrt_price_limit_x96: int,
+    sqrt_price_limit_x96: int = 0,
+    *,
+    trusted: bool = False,
 ) -> str:
     """Encode a call to the Uniswap V3 SwapRouter exactInputSingle function.
 
@@ -29,6 +51,7 @@ def encode_exactInputSingle(
         amount_in: The exact amount of input tokens to be swapped
         amount_out_minimum: The minimum amount of output tokens (slippage protection)
         sqrt_price_limit_x96: The price limit in sqrt(price) * 2^96 format (0 for no limit)
+        trusted: Skip argument validation
 
     Returns:
         str: Encoded call data with 0x prefix
@@ -46,15 +69,7 @@ def encode_exactInputSingle(
         ... )
         '0x414bf389...'
     """
-    # Uniswap V3 exactInputSingle function signature
-    exact_input_single_signature = (
-        "exactInputSingle("
-        "(address,address,uint24,address,uint256,uint256,uint256,uint160)"
-        ")"
-    )
-
-    # Pack all parameters into a tuple (struct)
-    exact_input_single_params = (
+    return _encoders["encode_exactInputSingle"](
         token_in,
         token_out,
         fee,
@@ -63,14 +78,5 @@ def encode_exactInputSingle(
         amount_in,
         amount_out_minimum,
         sqrt_price_limit_x96,
-    )
-
-    # Use the encode_call function to encode the transaction
-    return cast(
-        str,
-        encode_call(
-            abi_or_signature=exact_input_single_signature,
-            function_name="exactInputSingle",
-            args=[exact_input_single_params],
-        ),
+        trusted=trusted,
     )
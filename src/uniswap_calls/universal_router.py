@@ -0,0 +1,573 @@
+"""Uniswap Universal Router command planner.
+
+UniversalRouter.execute(bytes commands, bytes[] inputs, uint256 deadline)
+runs a sequence of commands, one byte each, with one ABI-encoded input per
+command. Each command's input layout is declared below and compiled once
+into a native tuple encoder; RoutePlanner appends commands and encodes the
+whole execute call into one presized buffer.
+"""
+
+from typing import Any, Dict, List, NamedTuple, Sequence, Tuple, Union
+
+from ..abi_encoder import TupleEncoder, compile_types
+from ..call_encoder import compile_function, process_argument
+from ..registry import Field, FunctionSpec, ProtocolSpec, register_protocol
+from ..thread_cache import per_thread_cache
+from ..validation import validate_arguments
+
+# Recipient sentinels resolved by the router
+MSG_SENDER = "0x0000000000000000000000000000000000000001"
+ADDRESS_THIS = "0x0000000000000000000000000000000000000002"
+# Amount sentinel: use the router's whole balance of the token
+CONTRACT_BALANCE = 2**255
+
+
+class Command:
+    """Universal Router command bytes (Commands.sol)."""
+
+    V3_SWAP_EXACT_IN = 0x00
+    V3_SWAP_EXACT_OUT = 0x01
+    PERMIT2_TRANSFER_FROM = 0x02
+    PERMIT2_PERMIT_BATCH = 0x03
+    SWEEP = 0x04
+    TRANSFER = 0x05
+    PAY_PORTION = 0x06
+    V2_SWAP_EXACT_IN = 0x08
+    V2_SWAP_EXACT_OUT = 0x09
+    PERMIT2_PERMIT = 0x0A
+    WRAP_ETH = 0x0B
+    UNWRAP_WETH = 0x0C
+
+    # Flag: a reverting command doesn't revert the whole execute call
+    ALLOW_REVERT = 0x80
+
+
+# IAllowanceTransfer.PermitDetails / PermitSingle / PermitBatch
+_PERMIT_DETAILS = "(address,uint160,uint48,uint48)"
+PERMIT_SINGLE_TYPE = f"({_PERMIT_DETAILS},address,uint256)"
+PERMIT_BATCH_TYPE = f"({_PERMIT_DETAILS}[],address,uint256)"
+
+# Input layout of every command, as decoded by the router's Dispatcher
+COMMAND_INPUTS: Dict[int, List[Field]] = {
+    Command.V3_SWAP_EXACT_IN: [
+        Field("recipient", "address"),
+        Field("amount_in", "uint256"),
+        Field("amount_out_min", "uint256"),
+        Field("path", "bytes"),
+        Field("payer_is_user", "bool"),
+    ],
+    Command.V3_SWAP_EXACT_OUT: [
+        Field("recipient", "address"),
+        Field("amount_out", "uint256"),
+        Field("amount_in_max", "uint256"),
+        Field("path", "bytes"),
+        Field("payer_is_user", "bool"),
+    ],
+    Command.PERMIT2_TRANSFER_FROM: [
+        Field("token", "address"),
+        Field("recipient", "address"),
+        Field("amount", "uint160"),
+    ],
+    Command.PERMIT2_PERMIT_BATCH: [
+        Field("permit_batch", PERMIT_BATCH_TYPE),
+        Field("signature", "bytes"),
+    ],
+    Command.SWEEP: [
+        Field("token", "address"),
+        Field("recipient", "address"),
+        Field("amount_min", "uint256"),
+    ],
+    Command.TRANSFER: [
+        Field("token", "address"),
+        Field("recipient", "address"),
+        Field("value", "uint256"),
+    ],
+    Command.PAY_PORTION: [
+        Field("token", "address"),
+        Field("recipient", "address"),
+        Field("bips", "uint256"),
+    ],
+    Command.V2_SWAP_EXACT_IN: [
+        Field("recipient", "address"),
+        Field("amount_in", "uint256"),
+        Field("amount_out_min", "uint256"),
+        Field("path", "address[]"),
+        Field("payer_is_user", "bool"),
+    ],
+    Command.V2_SWAP_EXACT_OUT: [
+        Field("recipient", "address"),
+        Field("amount_out", "uint256"),
+        Field("amount_in_max", "uint256"),
+        Field("path", "address[]"),
+        Field("payer_is_user", "bool"),
+    ],
+    Command.PERMIT2_PERMIT: [
+        Field("permit_single", PERMIT_SINGLE_TYPE),
+        Field("signature", "bytes"),
+    ],
+    Command.WRAP_ETH: [
+        Field("recipient", "address"),
+        Field("amount_min", "uint256"),
+    ],
+    Command.UNWRAP_WETH: [
+        Field("recipient", "address"),
+        Field("amount_min", "uint256"),
+    ],
+}
+
+
+class _CommandEncoder(NamedTuple):
+    types: List[str]
+    names: List[str]
+    encoder: TupleEncoder
+
+
+# Compiled once at import
+_COMMAND_ENCODERS: Dict[int, _CommandEncoder] = {
+    command: _CommandEncoder(
+        [field.type for field in fields],
+        [field.name for field in fields],
+        compile_types([field.type for field in fields]),
+    )
+    for command, fields in COMMAND_INPUTS.items()
+}
+
+UNIVERSAL_ROUTER = ProtocolSpec(
+    "uniswap_universal_router",
+    [
+        FunctionSpec(
+            "execute",
+            [
+                Field("commands", "bytes"),
+                Field("inputs", "bytes[]"),
+                Field("deadline", "uint256"),
+            ],
+        ),
+        FunctionSpec(
+            "execute",
+            [
+                Field("commands", "bytes"),
+                Field("inputs", "bytes[]"),
+            ],
+            encoder_name="encode_execute_no_deadline",
+        ),
+    ],
+)
+
+_encoders = register_protocol(UNIVERSAL_ROUTER, __name__)
+
+# execute(bytes,bytes[],uint256), written directly by RoutePlanner
+_EXECUTE = compile_function(UNIVERSAL_ROUTER.functions[0].signature)
+
+
+def encode_execute(
+    commands: Union[str, bytes],
+    inputs: Sequence[Union[str, bytes]],
+    deadline: int,
+    *,
+    trusted: bool = False,
+) -> str:
+    """Encode a call to the Uniswap UniversalRouter execute function.
+
+    Args:
+        commands: One command byte per input (see Command)
+        inputs: ABI-encoded input of each command
+        deadline: The time by which the transaction must be included
+        trusted: Skip argument validation
+
+    Returns:
+        str: Encoded call data with 0x prefix ('0x3593564c...')
+    """
+    return _encoders["encode_execute"](commands, inputs, deadline, trusted=trusted)
+
+
+def encode_execute_no_deadline(
+    commands: Union[str, bytes],
+    inputs: Sequence[Union[str, bytes]],
+    *,
+    trusted: bool = False,
+) -> str:
+    """Encode a call to the UniversalRouter execute overload without deadline.
+
+    Args:
+        commands: One command byte per input (see Command)
+        inputs: ABI-encoded input of each command
+        trusted: Skip argument validation
+
+    Returns:
+        str: Encoded call data with 0x prefix ('0x24856bc3...')
+    """
+    return _encoders["encode_execute_no_deadline"](commands, inputs, trusted=trusted)
+
+
+def encode_v3_path(
+    tokens: Sequence[str], fees: Sequence[int], exact_output: bool = False
+) -> bytes:
+    """
+    Pack a V3 swap path: token (20 bytes), fee (3 bytes), token, fee... token.
+
+    Paths are cached, so repeated routes are only packed once per thread.
+
+    Args:
+        tokens: Token addresses from the input token to the output token
+        fees: Fee tier of each hop (len(tokens) - 1 values)
+        exact_output: Reverse the path, as expected by V3_SWAP_EXACT_OUT
+
+    Returns:
+        bytes: The packed path
+
+    Example:
+        >>> encode_v3_path([USDC, WETH], [500]).hex()
+        'a0b86991c6218b36c1d19d4a2e9eb0ce3606eb480001f4c02aaa39b2...'
+    """
+    if len(tokens) < 2 or len(fees) != len(tokens) - 1:
+        raise ValueError(
+            f"Expected len(tokens) - 1 fees, got {len(tokens)} tokens "
+            f"and {len(fees)} fees"
+        )
+    key_tokens = tuple(token.lower() for token in tokens)
+    key_fees = tuple(int(fee) for fee in fees)
+    if exact_output:
+        key_tokens, key_fees = key_tokens[::-1], key_fees[::-1]
+    return _encode_v3_path(key_tokens, key_fees)
+
+
+@per_thread_cache(maxsize=1024)
+def _encode_v3_path(tokens: Tuple[str, ...], fees: Tuple[int, ...]) -> bytes:
+    parts = []
+    for index, token in enumerate(tokens):
+        raw = bytes.fromhex(token[2:] if token.startswith("0x") else token)
+        if len(raw) != 20:
+            raise ValueError(f"Invalid address in path: {token!r}")
+        parts.append(raw)
+        if index < len(fees):
+            if not 0 <= fees[index] < 2**24:
+                raise ValueError(f"Invalid fee in path: {fees[index]}")
+            parts.append(fees[index].to_bytes(3, "big"))
+    return b"".join(parts)
+
+
+def clear_path_cache() -> None:
+    """Drop every cached packed path."""
+    _encode_v3_path.cache_clear()
+
+
+class RoutePlanner:
+    """Builds the commands and inputs of a UniversalRouter execute call.
+
+    Every method appends one command and returns the planner, so calls can be
+    chained. Inputs are validated (unless trusted) and encoded right away
+    with the command's precompiled encoder.
+
+    Example:
+        >>> calldata = (
+        ...     RoutePlanner()
+        ...     .wrap_eth(ADDRESS_THIS, amount_in)
+        ...     .v3_swap_exact_in(
+        ...         MSG_SENDER,
+        ...         amount_in,
+        ...         amount_out_min,
+        ...         encode_v3_path([WETH, USDC], [500]),
+        ...         payer_is_user=False,
+        ...     )
+        ...     .encode_execute(deadline=1748593204)
+        ... )
+        '0x3593564c...'
+    """
+
+    def __init__(self) -> None:
+        self.commands = bytearray()
+        self.inputs: List[bytes] = []
+
+    def __len__(self) -> int:
+        return len(self.commands)
+
+    def add_command(
+        self,
+        command: int,
+        *args: Any,
+        allow_revert: bool = False,
+        trusted: bool = False,
+    ) -> "RoutePlanner":
+        """
+        Append a command with its input values (in COMMAND_INPUTS order).
+
+        Args:
+            command: Command byte (see Command)
+            args: Input values of the command
+            allow_revert: Let the command revert without reverting the call
+            trusted: Skip argument validation
+
+        Returns:
+            RoutePlanner: self
+        """
+        try:
+            command_encoder = _COMMAND_ENCODERS[command]
+        except KeyError:
+            raise ValueError(f"Unsupported command: {command:#04x}") from None
+        types = command_encoder.types
+        if not trusted:
+            validate_arguments(types, args, names=command_encoder.names)
+        elif len(args) != len(types):
+            raise ValueError(
+                f"Command {command:#04x} takes {len(types)} input(s), got {len(args)}"
+            )
+        # Same conversions as encode_call (decimal strings, hex bytes...)
+        values = [process_argument(type_, value) for type_, value in zip(types, args)]
+        self.inputs.append(command_encoder.encoder.encode(values))
+        self.commands.append(
+            command | Command.ALLOW_REVERT if allow_revert else command
+        )
+        return self
+
+    def v3_swap_exact_in(
+        self,
+        recipient: str,
+        amount_in: int,
+        amount_out_min: int,
+        path: Union[str, bytes],
+        payer_is_user: bool = True,
+        allow_revert: bool = False,
+        trusted: bool = False,
+    ) -> "RoutePlanner":
+        """Swap amount_in along a packed V3 path (see encode_v3_path)."""
+        return self.add_command(
+            Command.V3_SWAP_EXACT_IN,
+            recipient,
+            amount_in,
+            amount_out_min,
+            path,
+            payer_is_user,
+            allow_revert=allow_revert,
+            trusted=trusted,
+        )
+
+    def v3_swap_exact_out(
+        self,
+        recipient: str,
+        amount_out: int,
+        amount_in_max: int,
+        path: Union[str, bytes],
+        payer_is_user: bool = True,
+        allow_revert: bool = False,
+        trusted: bool = False,
+    ) -> "RoutePlanner":
+        """Swap for amount_out along a reversed V3 path (exact_output=True)."""
+        return self.add_command(
+            Command.V3_SWAP_EXACT_OUT,
+            recipient,
+            amount_out,
+            amount_in_max,
+            path,
+            payer_is_user,
+            allow_revert=allow_revert,
+            trusted=trusted,
+        )
+
+    def v2_swap_exact_in(
+        self,
+        recipient: str,
+        amount_in: int,
+        amount_out_min: int,
+        path: Sequence[str],
+        payer_is_user: bool = True,
+        allow_revert: bool = False,
+        trusted: bool = False,
+    ) -> "RoutePlanner":
+        """Swap amount_in along a V2 path of token addresses."""
+        return self.add_command(
+            Command.V2_SWAP_EXACT_IN,
+            recipient,
+            amount_in,
+            amount_out_min,
+            list(path),
+            payer_is_user,
+            allow_revert=allow_revert,
+            trusted=trusted,
+        )
+
+    def v2_swap_exact_out(
+        self,
+        recipient: str,
+        amount_out: int,
+        amount_in_max: int,
+        path: Sequence[str],
+        payer_is_user: bool = True,
+        allow_revert: bool = False,
+        trusted: bool = False,
+    ) -> "RoutePlanner":
+        """Swap for amount_out along a V2 path of token addresses."""
+        return self.add_command(
+            Command.V2_SWAP_EXACT_OUT,
+            recipient,
+            amount_out,
+            amount_in_max,
+            list(path),
+            payer_is_user,
+            allow_revert=allow_revert,
+            trusted=trusted,
+        )
+
+    def permit2_permit(
+        self,
+        permit_single: Tuple[Any, ...],
+        signature: Union[str, bytes],
+        allow_revert: bool = False,
+        trusted: bool = False,
+    ) -> "RoutePlanner":
+        """Submit a PermitSingle ((token, amount, expiration, nonce), spender, deadline)."""
+        return self.add_command(
+            Command.PERMIT2_PERMIT,
+            permit_single,
+            signature,
+            allow_revert=allow_revert,
+            trusted=trusted,
+        )
+
+    def permit2_permit_batch(
+        self,
+        permit_batch: Tuple[Any, ...],
+        signature: Union[str, bytes],
+        allow_revert: bool = False,
+        trusted: bool = False,
+    ) -> "RoutePlanner":
+        """Submit a PermitBatch ([(token, amount, expiration, nonce)], spender, deadline)."""
+        return self.add_command(
+            Command.PERMIT2_PERMIT_BATCH,
+            permit_batch,
+            signature,
+            allow_revert=allow_revert,
+            trusted=trusted,
+        )
+
+    def permit2_transfer_from(
+        self,
+        token: str,
+        recipient: str,
+        amount: int,
+        allow_revert: bool = False,
+        trusted: bool = False,
+    ) -> "RoutePlanner":
+        """Transfer amount of token from the caller to recipient via Permit2."""
+        return self.add_command(
+            Command.PERMIT2_TRANSFER_FROM,
+            token,
+            recipient,
+            amount,
+            allow_revert=allow_revert,
+            trusted=trusted,
+        )
+
+    def wrap_eth(
+        self,
+        recipient: str,
+        amount_min: int,
+        allow_revert: bool = False,
+        trusted: bool = False,
+    ) -> "RoutePlanner":
+        """Wrap amount_min ETH (or CONTRACT_BALANCE) into WETH for recipient."""
+        return self.add_command(
+            Command.WRAP_ETH,
+            recipient,
+            amount_min,
+            allow_revert=allow_revert,
+            trusted=trusted,
+        )
+
+    def unwrap_weth(
+        self,
+        recipient: str,
+        amount_min: int,
+        allow_revert: bool = False,
+        trusted: bool = False,
+    ) -> "RoutePlanner":
+        """Unwrap the router's WETH (at least amount_min) to recipient."""
+        return self.add_command(
+            Command.UNWRAP_WETH,
+            recipient,
+            amount_min,
+            allow_revert=allow_revert,
+            trusted=trusted,
+        )
+
+    def sweep(
+        self,
+        token: str,
+        recipient: str,
+        amount_min: int,
+        allow_revert: bool = False,
+        trusted: bool = False,
+    ) -> "RoutePlanner":
+        """Send the router's balance of token (at least amount_min) to recipient."""
+        return self.add_command(
+            Command.SWEEP,
+            token,
+            recipient,
+            amount_min,
+            allow_revert=allow_revert,
+            trusted=trusted,
+        )
+
+    def transfer(
+        self,
+        token: str,
+        recipient: str,
+        value: int,
+        allow_revert: bool = False,
+        trusted: bool = False,
+    ) -> "RoutePlanner":
+        """Send value of the router's token balance to recipient."""
+        return self.add_command(
+            Command.TRANSFER,
+            token,
+            recipient,
+            value,
+            allow_revert=allow_revert,
+            trusted=trusted,
+        )
+
+    def pay_portion(
+        self,
+        token: str,
+        recipient: str,
+        bips: int,
+        allow_revert: bool = False,
+        trusted: bool = False,
+    ) -> "RoutePlanner":
+        """Send bips / 10000 of the router's token balance to recipient."""
+        return self.add_command(
+            Command.PAY_PORTION,
+            token,
+            recipient,
+            bips,
+            allow_revert=allow_revert,
+            trusted=trusted,
+        )
+
+    def encode_execute(self, deadline: int, trusted: bool = False) -> str:
+        """
+        Encode the planned commands as a UniversalRouter execute call.
+
+        The inputs were validated and encoded as they were appended, so only
+        the deadline is checked; the call is then written in one pass into a
+        buffer presized for the selector and every input.
+
+        Args:
+            deadline: The time by which the transaction must be included
+            trusted: Skip the validation of the deadline
+
+        Returns:
+            str: Encoded call data with 0x prefix
+        """
+        if not trusted:
+            validate_arguments(["uint256"], [deadline], names=["deadline"])
+        values = (
+            bytes(self.commands),
+            self.inputs,
+            process_argument("uint256", deadline),
+        )
+        encoder = _EXECUTE.encoder
+        buffer = bytearray(4 + encoder.size(values))
+        buffer[:4] = _EXECUTE.selector
+        encoder.write(buffer, 4, values)
+        return f"0x{buffer.hex()}"
@@ -0,0 +1,374 @@
+"""Incremental valuation of many positions, for rebalance triggers.
+
+A position's token amounts only depend on the price while the price is
+inside its range; below the range it holds its full token0 amount, above it
+its full token1 amount. The engine keeps the sqrt prices of every position
+boundary in a sorted index, so a price update:
+
+    - finds the boundaries crossed since the last price with two bisections,
+      and re-evaluates only the positions attached to them,
+    - recomputes the amounts of the positions in range (which move with the
+      price), leaving every other position untouched,
+    - returns a Trigger for every position whose range status changed.
+
+Triggers carry the position's fields under the position manager encoder
+parameter names, so rebalance calls are built straight from them:
+
+    >>> engine = ValuationEngine.from_columns(positions, sqrt_price_x96)
+    >>> for trigger in engine.update(new_sqrt_price_x96):
+    ...     if trigger.exited:
+    ...         encode_decreaseLiquidity(
+    ...             **trigger.decrease_liquidity_args(deadline, slippage_bps=50)
+    ...         )
+"""
+
+from bisect import bisect_left, bisect_right, insort
+from typing import Any, Dict, Iterable, List, Mapping, NamedTuple, Optional, Set, Tuple
+
+from ..abi_decoder import rows_from_columns
+from .constants import MAX_UINT128
+from .liquidity_math import (
+    get_amounts_for_liquidity,
+    get_liquidity_for_amounts,
+    get_sqrt_ratio_at_tick,
+)
+
+# Range status of a position
+BELOW_RANGE = -1
+IN_RANGE = 0
+ABOVE_RANGE = 1
+
+# Trigger kinds
+ENTERED_RANGE = "entered_range"
+EXITED_BELOW = "exited_below"
+EXITED_ABOVE = "exited_above"
+
+BPS = 10_000
+
+
+class Position(NamedTuple):
+    """A liquidity position; the pool key is only needed for mint_args."""
+
+    token_id: int
+    tick_lower: int
+    tick_upper: int
+    liquidity: int
+    token0: str = ""
+    token1: str = ""
+    fee: int = 0
+
+
+def _apply_slippage(amount: int, slippage_bps: int) -> int:
+    if not 0 <= slippage_bps <= BPS:
+        raise ValueError(f"Invalid slippage: {slippage_bps} bps")
+    return amount * (BPS - slippage_bps) // BPS
+
+
+class Trigger(NamedTuple):
+    """A range status change of a position, valued at the new price."""
+
+    kind: str
+    token_id: int
+    previous_status: int
+    status: int
+    sqrt_price_x96: int
+    amount0: int
+    amount1: int
+    position: Position
+
+    @property
+    def exited(self) -> bool:
+        return self.kind != ENTERED_RANGE
+
+    def decrease_liquidity_args(
+        self, deadline: int, slippage_bps: int = 0
+    ) -> Dict[str, Any]:
+        """
+        Arguments of encode_decreaseLiquidity removing all the liquidity.
+
+        Args:
+            deadline: Transaction deadline timestamp
+            slippage_bps: Tolerated shortfall on the amounts, in basis points
+
+        Returns:
+            dict: token_id, liquidity, amount0_min, amount1_min and deadline
+        """
+        return {
+            "token_id": self.token_id,
+            "liquidity": self.position.liquidity,
+            "amount0_min": _apply_slippage(self.amount0, slippage_bps),
+            "amount1_min": _apply_slippage(self.amount1, slippage_bps),
+            "deadline": deadline,
+        }
+
+    def collect_args(self, recipient: str) -> Dict[str, Any]:
+        """Arguments of encode_collect withdrawing everything owed."""
+        return {
+            "token_id": self.token_id,
+            "recipient": recipient,
+            "amount0_max": MAX_UINT128,
+            "amount1_max": MAX_UINT128,
+        }
+
+    def mint_args(
+        self,
+        tick_lower: int,
+        tick_upper: int,
+        recipient: str,
+        deadline: int,
+        slippage_bps: int = 0,
+    ) -> Dict[str, Any]:
+        """
+        Arguments of encode_mint redeploying the position amounts in a new range.
+
+        The minimums are the amounts the new range actually takes at the
+        trigger price, less the slippage.
+
+        Args:
+            tick_lower: Lower tick of the new range
+            tick_upper: Upper tick of the new range
+            recipient: Owner of the new position
+            deadline: Transaction deadline timestamp
+            slippage_bps: Tolerated shortfall on the amounts, in basis points
+
+        Returns:
+            dict: Keyword arguments for encode_mint
+        """
+        position = self.position
+        if not position.token0 or not position.token1:
+            raise ValueError(
+                f"Position {self.token_id} has no pool key (token0, token1, fee)"
+            )
+        sqrt_lower = get_sqrt_ratio_at_tick(tick_lower)
+        sqrt_upper = get_sqrt_ratio_at_tick(tick_upper)
+        liquidity = get_liquidity_for_amounts(
+            self.sqrt_price_x96, sqrt_lower, sqrt_upper, self.amount0, self.amount1
+        )
+        amount0, amount1 = get_amounts_for_liquidity(
+            self.sqrt_price_x96, sqrt_lower, sqrt_upper, liquidity
+        )
+        return {
+            "token0": position.token0,
+            "token1": position.token1,
+            "fee": position.fee,
+            "tick_lower": tick_lower,
+            "tick_upper": tick_upper,
+            "amount0_desired": self.amount0,
+            "amount1_desired": self.amount1,
+            "amount0_min": _apply_slippage(amount0, slippage_bps),
+            "amount1_min": _apply_slippage(amount1, slippage_bps),
+            "recipient": recipient,
+            "deadline": deadline,
+        }
+
+
+class _State:
+    __slots__ = ("position", "sqrt_lower", "sqrt_upper", "status", "amount0", "amount1")
+
+    def __init__(self, position: Position) -> None:
+        if position.tick_lower >= position.tick_upper:
+            raise ValueError(
+                f"Position {position.token_id}: tick_lower must be below tick_upper"
+            )
+        self.position = position
+        self.sqrt_lower = get_sqrt_ratio_at_tick(position.tick_lower)
+        self.sqrt_upper = get_sqrt_ratio_at_tick(position.tick_upper)
+        self.status = IN_RANGE
+        self.amount0 = 0
+        self.amount1 = 0
+
+    def status_at(self, sqrt_price_x96: int) -> int:
+        # Same convention as get_amounts_for_liquidity: all token0 at the
+        # lower boundary, all token1 at the upper one
+        if sqrt_price_x96 <= self.sqrt_lower:
+            return BELOW_RANGE
+        if sqrt_price_x96 < self.sqrt_upper:
+            return IN_RANGE
+        return ABOVE_RANGE
+
+
+class ValuationEngine:
+    """Token amounts of a set of positions, updated incrementally.
+
+    Args:
+        positions: Positions to track
+        sqrt_price_x96: Current pool sqrt price, if already known
+    """
+
+    def __init__(
+        self, positions: Iterable[Position] = (), sqrt_price_x96: Optional[int] = None
+    ) -> None:
+        self._states: Dict[int, _State] = {}
+        # Sorted boundary sqrt prices, and the positions attached to each
+        self._boundaries: List[int] = []
+        self._boundary_positions: Dict[int, Set[int]] = {}
+        self._in_range: Set[int] = set()
+        self._sqrt_price: Optional[int] = sqrt_price_x96
+        self._total0 = 0
+        self._total1 = 0
+        # Number of positions revalued by the last update
+        self.last_revalued = 0
+        for position in positions:
+            self.add_position(position)
+
+    @classmethod
+    def from_columns(
+        cls, columns: Mapping[str, Any], sqrt_price_x96: Optional[int] = None
+    ) -> "ValuationEngine":
+        """
+        Track the positions decoded by views.decode_positions_batch.
+
+        Rows of failed positions() calls (success column False) are skipped.
+
+        Args:
+            columns: Position columns, with a "token_id" column
+            sqrt_price_x96: Current pool sqrt price, if already known
+
+        Returns:
+            ValuationEngine: Engine tracking the positions
+        """
+        fields = [
+            field
+            for field in Position._fields
+            if field in columns or field not in Position._field_defaults
+        ]
+        rows = rows_from_columns(columns, fields)
+        return cls((Position(**row) for row in rows), sqrt_price_x96)
+
+    def __len__(self) -> int:
+        return len(self._states)
+
+    def __contains__(self, token_id: object) -> bool:
+        return token_id in self._states
+
+    @property
+    def sqrt_price_x96(self) -> Optional[int]:
+        return self._sqrt_price
+
+    def _attach(self, boundary: int, token_id: int) -> None:
+        attached = self._boundary_positions.get(boundary)
+        if attached is None:
+            attached = self._boundary_positions[boundary] = set()
+            insort(self._boundaries, boundary)
+        attached.add(token_id)
+
+    def _detach(self, boundary: int, token_id: int) -> None:
+        attached = self._boundary_positions[boundary]
+        attached.discard(token_id)
+        if not attached:
+            del self._boundary_positions[boundary]
+            del self._boundaries[bisect_left(self._boundaries, boundary)]
+
+    def _revalue(self, state: _State, sqrt_price_x96: int) -> int:
+        """Update the status and amounts of a position, returning the old status."""
+        previous = state.status
+        state.status = status = state.status_at(sqrt_price_x96)
+        if status == IN_RANGE:
+            self._in_range.add(state.position.token_id)
+        else:
+            self._in_range.discard(state.position.token_id)
+        amount0, amount1 = get_amounts_for_liquidity(
+            sqrt_price_x96, state.sqrt_lower, state.sqrt_upper, state.position.liquidity
+        )
+        self._total0 += amount0 - state.amount0
+        self._total1 += amount1 - state.amount1
+        state.amount0 = amount0
+        state.amount1 = amount1
+        return previous
+
+    def add_position(self, position: Position) -> None:
+        """Track a position (replacing any tracked position with the same token ID)."""
+        if position.token_id in self._states:
+            self.remove_position(position.token_id)
+        state = _State(position)
+        self._states[position.token_id] = state
+        self._attach(state.sqrt_lower, position.token_id)
+        self._attach(state.sqrt_upper, position.token_id)
+        if self._sqrt_price is not None:
+            self._revalue(state, self._sqrt_price)
+
+    def remove_position(self, token_id: int) -> Position:
+        """Stop tracking a position."""
+        state = self._states.pop(token_id)
+        self._detach(state.sqrt_lower, token_id)
+        self._detach(state.sqrt_upper, token_id)
+        self._in_range.discard(token_id)
+        self._total0 -= state.amount0
+        self._total1 -= state.amount1
+        return state.position
+
+    def update(self, sqrt_price_x96: int) -> List[Trigger]:
+        """
+        Revalue the positions at a new pool price.
+
+        Only the positions in range and those with a boundary between the
+        previous and the new price are revalued. The first price set
+        values every position and triggers nothing.
+
+        Args:
+            sqrt_price_x96: New pool sqrt price (e.g. from decode_slot0)
+
+        Returns:
+            list: Triggers for the positions whose range status changed,
+            in token ID order
+        """
+        previous_price = self._sqrt_price
+        self._sqrt_price = sqrt_price_x96
+        if previous_price is None:
+            for state in self._states.values():
+                self._revalue(state, sqrt_price_x96)
+            self.last_revalued = len(self._states)
+            return []
+        if sqrt_price_x96 == previous_price:
+            self.last_revalued = 0
+            return []
+
+        low, high = sorted((previous_price, sqrt_price_x96))
+        start = bisect_left(self._boundaries, low)
+        stop = bisect_right(self._boundaries, high)
+        candidates = set(self._in_range)
+        for boundary in self._boundaries[start:stop]:
+            candidates.update(self._boundary_positions[boundary])
+
+        triggers = []
+        for token_id in sorted(candidates):
+            state = self._states[token_id]
+            previous = self._revalue(state, sqrt_price_x96)
+            if state.status != previous:
+                if state.status == IN_RANGE:
+                    kind = ENTERED_RANGE
+                elif state.status == BELOW_RANGE:
+                    kind = EXITED_BELOW
+                else:
+                    kind = EXITED_ABOVE
+                triggers.append(
+                    Trigger(
+                        kind,
+                        token_id,
+                        previous,
+                        state.status,
+                        sqrt_price_x96,
+                        state.amount0,
+                        state.amount1,
+                        state.position,
+                    )
+                )
+        self.last_revalued = len(candidates)
+        return triggers
+
+    def amounts(self, token_id: int) -> Tuple[int, int]:
+        """Return the current (amount0, amount1) of a position."""
+        state = self._states[token_id]
+        return state.amount0, state.amount1
+
+    def status(self, token_id: int) -> int:
+        """Return the range status of a position (BELOW_RANGE, IN_RANGE or ABOVE_RANGE)."""
+        return self._states[token_id].status
+
+    def totals(self) -> Tuple[int, int]:
+        """Return the total (amount0, amount1) of all the tracked positions."""
+        return self._total0, self._total1
+
+    def in_range(self) -> List[int]:
+        """Token IDs of the positions in range, sorted."""
+        return sorted(self._in_range)
@@ -0,0 +1,242 @@
+"""Uniswap V3 view function encoders and (batch) return data decoders."""
+
+from typing import Any, Dict, List, Optional, Sequence, Tuple, cast
+
+from ..abi_decoder import HexOrBytes, decode_word_columns, to_bytes, to_python
+from ..call_encoder import encode_call
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy is optional
+    np = None  # type: ignore[assignment]
+
+# NonfungiblePositionManager.positions(uint256) return values, named after
+# the position manager encoder parameters where they overlap
+POSITIONS_FIELDS: List[Tuple[str, str]] = [
+    ("nonce", "uint96"),
+    ("operator", "address"),
+    ("token0", "address"),
+    ("token1", "address"),
+    ("fee", "uint24"),
+    ("tick_lower", "int24"),
+    ("tick_upper", "int24"),
+    ("liquidity", "uint128"),
+    ("fee_growth_inside0_last_x128", "uint256"),
+    ("fee_growth_inside1_last_x128", "uint256"),
+    ("tokens_owed0", "uint128"),
+    ("tokens_owed1", "uint128"),
+]
+
+# UniswapV3Pool.slot0() return values
+SLOT0_FIELDS: List[Tuple[str, str]] = [
+    ("sqrt_price_x96", "uint160"),
+    ("tick", "int24"),
+    ("observation_index", "uint16"),
+    ("observation_cardinality", "uint16"),
+    ("observation_cardinality_next", "uint16"),
+    ("fee_protocol", "uint8"),
+    ("unlocked", "bool"),
+]
+
+# UniswapV3Pool.liquidity() return value
+LIQUIDITY_FIELDS: List[Tuple[str, str]] = [("liquidity", "uint128")]
+
+
+def encode_positions(token_id: int) -> str:
+    """Encode a call to the Uniswap V3 NonfungiblePositionManager positions function.
+
+    Args:
+        token_id: The ID of the position NFT
+
+    Returns:
+        str: Encoded call data with 0x prefix
+
+    Example:
+        >>> encode_positions(token_id=12345)
+        '0x99fbab88...'
+    """
+    return cast(
+        str,
+        encode_call(
+            abi_or_signature="positions(uint256)",
+            function_name="positions",
+            args=[token_id],
+        ),
+    )
+
+
+def encode_slot0() -> str:
+    """Encode a call to the Uniswap V3 pool slot0 function.
+
+    Returns:
+        str: Encoded call data with 0x prefix ('0x3850c7bd')
+    """
+    return cast(
+        str, encode_call(abi_or_signature="slot0()", function_name="slot0", args=[])
+    )
+
+
+def encode_liquidity() -> str:
+    """Encode a call to the Uniswap V3 pool liquidity function.
+
+    Returns:
+        str: Encoded call data with 0x prefix ('0x1a686502')
+    """
+    return cast(
+        str,
+        encode_call(abi_or_signature="liquidity()", function_name="liquidity", args=[]),
+    )
+
+
+def _decode_one(
+    fields: List[Tuple[str, str]], return_data: HexOrBytes
+) -> Dict[str, Any]:
+    columns = decode_word_columns(fields, [to_bytes(return_data)])
+    return {name: to_python(column[0]) for name, column in columns.items()}
+
+
+def _decode_batch(
+    fields: List[Tuple[str, str]],
+    return_data: Sequence[HexOrBytes],
+    ids: Optional[Sequence[Any]],
+    id_name: str,
+    success: Optional[Sequence[bool]] = None,
+) -> Dict[str, Any]:
+    columns: Dict[str, Any] = {}
+    if ids is not None:
+        if len(ids) != len(return_data):
+            raise ValueError(
+                f"Expected {len(return_data)} {id_name} values, got {len(ids)}"
+            )
+        columns[id_name] = ids
+    if success is not None and len(success) != len(return_data):
+        raise ValueError(
+            f"Expected {len(return_data)} success flags, got {len(success)}"
+        )
+
+    # Failed calls (flagged, or with empty return data as Multicall3 reports
+    # them) decode as zero rows, masked by the "success" column
+    size = 32 * len(fields)
+    blobs = [to_bytes(blob) for blob in return_data]
+    valid = [
+        len(blob) > 0 and (success is None or bool(success[index]))
+        for index, blob in enumerate(blobs)
+    ]
+    blobs = [blob if ok else bytes(size) for blob, ok in zip(blobs, valid)]
+    columns.update(decode_word_columns(fields, blobs))
+    columns["success"] = np.asarray(valid, dtype=bool) if np is not None else valid
+    return columns
+
+
+def decode_positions(return_data: HexOrBytes) -> Dict[str, Any]:
+    """
+    Decode the return data of NonfungiblePositionManager.positions.
+
+    Args:
+        return_data: Raw return data (hex string or bytes)
+
+    Returns:
+        dict: Position fields (see POSITIONS_FIELDS)
+    """
+    return _decode_one(POSITIONS_FIELDS, return_data)
+
+
+def decode_positions_batch(
+    return_data: Sequence[HexOrBytes],
+    token_ids: Optional[Sequence[int]] = None,
+    success: Optional[Sequence[bool]] = None,
+) -> Dict[str, Any]:
+    """
+    Decode many positions() return blobs into columns.
+
+    Columns are named after the position manager encoder parameters
+    (token_id, liquidity, tick_lower...), so rows can be fed back to them with
+    abi_decoder.rows_from_columns, which skips the rows of failed calls.
+
+    Args:
+        return_data: One return blob per position
+        token_ids: The queried token IDs, added as a "token_id" column
+        success: Optional success flag per blob (e.g. from aggregate3)
+
+    Returns:
+        dict: One column per field of POSITIONS_FIELDS (plus "token_id"),
+        and a "success" bool column; rows of failed calls (flagged, or with
+        empty return data) are all zeros
+
+    Example:
+        >>> positions = decode_positions_batch(
+        ...     blobs, token_ids=token_ids, success=successes
+        ... )
+        >>> # No liquidity=0 calls for the positions that failed to load
+        >>> calls = [
+        ...     encode_decreaseLiquidity(**kwargs)
+        ...     for kwargs in rows_from_columns(
+        ...         positions,
+        ...         ["token_id", "liquidity"],
+        ...         amount0_min=0,
+        ...         amount1_min=0,
+        ...         deadline=1640995200,
+        ...     )
+        ... ]
+    """
+    return _decode_batch(POSITIONS_FIELDS, return_data, token_ids, "token_id", success)
+
+
+def decode_slot0(return_data: HexOrBytes) -> Dict[str, Any]:
+    """
+    Decode the return data of UniswapV3Pool.slot0.
+
+    Args:
+        return_data: Raw return data (hex string or bytes)
+
+    Returns:
+        dict: slot0 fields (see SLOT0_FIELDS)
+    """
+    return _decode_one(SLOT0_FIELDS, return_data)
+
+
+def decode_slot0_batch(
+    return_data: Sequence[HexOrBytes],
+    pools: Optional[Sequence[str]] = None,
+    success: Optional[Sequence[bool]] = None,
+) -> Dict[str, Any]:
+    """
+    Decode many slot0() return blobs into columns.
+
+    Args:
+        return_data: One return blob per pool
+        pools: The queried pool addresses, added as a "pool" column
+        success: Optional success flag per blob (e.g. from aggregate3)
+
+    Returns:
+        dict: One column per field of SLOT0_FIELDS (plus "pool"), and a
+        "success" bool column; rows of failed calls are all zeros
+
+    Example:
+        >>> results = execute_aggregate3(web3, [(pool, encode_slot0()) for ...])
+        >>> slot0 = decode_slot0_batch(
+        ...     [result.return_data for result in results],
+        ...     success=[result.success for result in results],
+        ... )
+    """
+    return _decode_batch(SLOT0_FIELDS, return_data, pools, "pool", success)
+
+
+def decode_liquidity_batch(
+    return_data: Sequence[HexOrBytes],
+    pools: Optional[Sequence[str]] = None,
+    success: Optional[Sequence[bool]] = None,
+) -> Dict[str, Any]:
+    """
+    Decode many liquidity() return blobs into a column.
+
+    Args:
+        return_data: One return blob per pool
+        pools: The queried pool addresses, added as a "pool" column
+        success: Optional success flag per blob (e.g. from aggregate3)
+
+    Returns:
+        dict: "liquidity" column (plus "pool"), and a "success" bool column;
+        rows of failed calls are zero
+    """
+    return _decode_batch(LIQUIDITY_FIELDS, return_data, pools, "pool", success)
@@ -0,0 +1,385 @@
+"""Up-front validation of call arguments, driven by the parsed ABI types.
+
+Checks run column by column over a whole batch, so every offending row is
+reported in a single ArgumentValidationError instead of failing on the first
+bad value deep inside the ABI encoder. Integer columns given as NumPy arrays
+are range-checked with vectorized comparisons.
+"""
+
+import re
+from typing import Any, Dict, List, Mapping, NamedTuple, Optional, Sequence, Tuple
+
+from .abi_types import (
+    int_bounds,
+    is_tuple_type,
+    parse_array_type,
+    parse_function_signature,
+    parse_tuple_type,
+)
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy is optional
+    np = None  # type: ignore[assignment]
+
+_ADDRESS_RE = re.compile(r"^0x[0-9a-fA-F]{40}$")
+_HEX_RE = re.compile(r"^0x([0-9a-fA-F]{2})*$")
+_DECIMAL_RE = re.compile(r"^-?[0-9]+$")
+_BYTES_N_RE = re.compile(r"^bytes(\d+)$")
+
+# Maximum number of errors spelled out in the exception message
+_MAX_REPORTED = 20
+
+
+class FieldError(NamedTuple):
+    row: int
+    field: str
+    value: Any
+    reason: str
+
+
+class ArgumentValidationError(ValueError):
+    """Raised when one or more call arguments are invalid.
+
+    Attributes:
+        errors: Every offending (row, field, value, reason), in row order
+    """
+
+    def __init__(self, errors: List[FieldError]) -> None:
+        self.errors = errors
+        lines = [
+            f"  row {error.row}, {error.field}: {error.reason} (got {error.value!r})"
+            for error in errors[:_MAX_REPORTED]
+        ]
+        if len(errors) > _MAX_REPORTED:
+            lines.append(f"  ... and {len(errors) - _MAX_REPORTED} more")
+        super().__init__(f"{len(errors)} invalid argument(s):\n" + "\n".join(lines))
+
+
+def resolve_param_types(signature_or_types: Any) -> List[str]:
+    """Return the parameter types of a function signature or a list of types."""
+    if isinstance(signature_or_types, str):
+        return parse_function_signature(signature_or_types)[1]
+    return list(signature_or_types)
+
+
+def flatten_types(param_types: Sequence[str]) -> List[str]:
+    """
+    Flatten (possibly nested) tuple types into their leaf types.
+
+    Args:
+        param_types: Parameter types, e.g. ["(address,int24)", "uint128"]
+
+    Returns:
+        list: Leaf types in encoding order, e.g. ["address", "int24", "uint128"]
+    """
+    leaves: List[str] = []
+    for type_ in param_types:
+        if is_tuple_type(type_):
+            leaves.extend(flatten_types(parse_tuple_type(type_)))
+        elif parse_array_type(type_) is not None:
+            raise ValueError(f"Array type {type_} can't be validated as a column")
+        else:
+            leaves.append(type_)
+    return leaves
+
+
+def validate_arguments(
+    signature_or_types: Any,
+    args: Sequence[Any],
+    names: Optional[Sequence[str]] = None,
+    bounds: Optional[Mapping[str, Tuple[int, int]]] = None,
+) -> None:
+    """
+    Validate the arguments of a single call.
+
+    Args:
+        signature_or_types: Function signature or list of parameter types
+        args: Arguments as they would be passed to encode_call
+        names: Optional field names, one per leaf (struct fields are flattened)
+        bounds: Optional extra (min, max) ranges keyed by field name,
+            intersected with the range of the field's integer type
+
+    Raises:
+        ArgumentValidationError: If any argument is invalid
+    """
+    validate_batch(signature_or_types, [args], names=names, bounds=bounds)
+
+
+def validate_batch(
+    signature_or_types: Any,
+    rows: Sequence[Sequence[Any]],
+    names: Optional[Sequence[str]] = None,
+    bounds: Optional[Mapping[str, Tuple[int, int]]] = None,
+) -> None:
+    """
+    Validate many calls to the same function at once.
+
+    Args:
+        signature_or_types: Function signature or list of parameter types
+        rows: One argument list per call
+        names: Optional field names, one per leaf (struct fields are flattened)
+        bounds: Optional extra (min, max) ranges keyed by field name
+
+    Raises:
+        ArgumentValidationError: Listing every offending row and field
+
+    Example:
+        >>> validate_batch(
+        ...     "burn(int24,int24,uint128)",
+        ...     [[-100, 100, 10], [-100, 100, -1], [-100, 100, 2**128]],
+        ...     names=["tick_lower", "tick_upper", "liquidity"],
+        ... )  # raises, reporting both row 1 and row 2 for "liquidity"
+    """
+    param_types = resolve_param_types(signature_or_types)
+    errors: List[FieldError] = []
+
+    # Group leaf values by field so that each column is checked in one go
+    columns: Dict[str, Tuple[str, List[int], List[Any]]] = {}
+    for row_index, args in enumerate(rows):
+        if len(args) != len(param_types):
+            errors.append(
+                FieldError(
+                    row_index,
+                    "args",
+                    args,
+                    f"expected {len(param_types)} argument(s), got {len(args)}",
+                )
+            )
+            continue
+        name_iter = iter(names) if names is not None else None
+        for position, (type_, value) in enumerate(zip(param_types, args)):
+            _collect_leaves(
+                type_,
+                value,
+                f"args[{position}]",
+                name_iter,
+                row_index,
+                columns,
+                errors,
+            )
+
+    for field, (type_, row_indexes, values) in columns.items():
+        field_bounds = bounds.get(field) if bounds is not None else None
+        for index, reason in _check_column(type_, values, field_bounds):
+            errors.append(FieldError(row_indexes[index], field, values[index], reason))
+
+    if errors:
+        errors.sort(key=lambda error: error.row)
+        raise ArgumentValidationError(errors)
+
+
+def validate_columns(
+    signature_or_types: Any,
+    columns: Sequence[Any],
+    names: Optional[Sequence[str]] = None,
+    bounds: Optional[Mapping[str, Tuple[int, int]]] = None,
+) -> None:
+    """
+    Validate a batch given as one column per leaf field.
+
+    This is the fast path for batches produced by vectorized code: integer
+    columns passed as NumPy arrays are range-checked without a Python loop.
+
+    Args:
+        signature_or_types: Function signature or list of parameter types
+        columns: One sequence or NumPy array per leaf field (see flatten_types)
+        names: Optional field names, one per leaf
+        bounds: Optional extra (min, max) ranges keyed by field name
+
+    Raises:
+        ArgumentValidationError: Listing every offending row and field
+    """
+    leaf_types = flatten_types(resolve_param_types(signature_or_types))
+    if len(columns) != len(leaf_types):
+        raise ValueError(f"Expected {len(leaf_types)} columns, got {len(columns)}")
+    if names is not None and len(names) != len(leaf_types):
+        raise ValueError(f"Expected {len(leaf_types)} names, got {len(names)}")
+
+    errors: List[FieldError] = []
+    for position, (type_, column) in enumerate(zip(leaf_types, columns)):
+        field = names[position] if names is not None else f"leaf[{position}]"
+        field_bounds = bounds.get(field) if bounds is not None else None
+        for index, reason in _check_column(type_, column, field_bounds):
+            errors.append(FieldError(index, field, column[index], reason))
+
+    if errors:
+        errors.sort(key=lambda error: error.row)
+        raise ArgumentValidationError(errors)
+
+
+def _collect_leaves(
+    type_: str,
+    value: Any,
+    path: str,
+    name_iter: Any,
+    row_index: int,
+    columns: Dict[str, Tuple[str, List[int], List[Any]]],
+    errors: List[FieldError],
+) -> None:
+    """Append the leaf values of one argument to their field columns."""
+    if is_tuple_type(type_):
+        field_types = parse_tuple_type(type_)
+        if not isinstance(value, (tuple, list)) or len(value) != len(field_types):
+            errors.append(
+                FieldError(
+                    row_index,
+                    path,
+                    value,
+                    f"expected tuple of {len(field_types)} field(s) for {type_}",
+                )
+            )
+            return
+        for position, (field_type, field_value) in enumerate(zip(field_types, value)):
+            _collect_leaves(
+                field_type,
+                field_value,
+                f"{path}[{position}]",
+                name_iter,
+                row_index,
+                columns,
+                errors,
+            )
+        return
+
+    field = next(name_iter, path) if name_iter is not None else path
+    array = parse_array_type(type_)
+    if array is not None:
+        element_type, length = array
+        if not isinstance(value, (list, tuple)) or (
+            length is not None and len(value) != length
+        ):
+            expected = f"{length} element(s)" if length is not None else "a list"
+            errors.append(FieldError(row_index, field, value, f"expected {expected}"))
+            return
+        for position, item in enumerate(value):
+            _collect_leaves(
+                element_type,
+                item,
+                f"{field}[{position}]",
+                None,
+                row_index,
+                columns,
+                errors,
+            )
+        return
+
+    column = columns.setdefault(field, (type_, [], []))
+    column[1].append(row_index)
+    column[2].append(value)
+
+
+def _check_column(
+    type_: str, values: Any, bounds: Optional[Tuple[int, int]]
+) -> List[Tuple[int, str]]:
+    """Return (index, reason) for every invalid value of a column."""
+    int_range = int_bounds(type_)
+    if int_range is not None:
+        low, high = int_range
+        if bounds is not None:
+            low, high = max(low, bounds[0]), min(high, bounds[1])
+        return _check_integers(values, low, high)
+
+    if type_ == "address":
+        return [
+            (index, "expected a 20 byte address")
+            for index, value in enumerate(values)
+            if not _is_address(value)
+        ]
+
+    if type_ == "bool":
+        return [
+            (index, "expected a bool")
+            for index, value in enumerate(values)
+            if not isinstance(value, bool)
+        ]
+
+    if type_ == "string":
+        return [
+            (index, "expected a str")
+            for index, value in enumerate(values)
+            if not isinstance(value, str)
+        ]
+
+    bytes_match = _BYTES_N_RE.match(type_)
+    if type_ == "bytes" or bytes_match:
+        max_size = int(bytes_match.group(1)) if bytes_match else None
+        issues = []
+        for index, value in enumerate(values):
+            if isinstance(value, str) and _HEX_RE.match(value):
+                size = len(value) // 2 - 1
+            elif isinstance(value, (bytes, bytearray)):
+                size = len(value)
+            else:
+                issues.append((index, "expected bytes or a 0x-prefixed hex string"))
+                continue
+            if max_size is not None and size > max_size:
+                issues.append((index, f"expected at most {max_size} byte(s)"))
+        return issues
+
+    # Unknown types are left to the encoder
+    return []
+
+
+def _check_integers(values: Any, low: int, high: int) -> List[Tuple[int, str]]:
+    """Range-check an integer column, vectorized when it is a NumPy array."""
+    reason = f"out of range [{low}, {high}]"
+
+    if np is not None and isinstance(values, np.ndarray) and values.dtype.kind in "iu":
+        info = np.iinfo(values.dtype)
+        if low <= info.min and high >= info.max:
+            return []
+        if low > info.max or high < info.min:
+            return [(index, reason) for index in range(len(values))]
+        mask = (values < max(low, info.min)) | (values > min(high, info.max))
+        return [(int(index), reason) for index in np.flatnonzero(mask)]
+
+    issues: List[Tuple[int, str]] = []
+    checked: List[int] = []
+    integers: List[int] = []
+    for index, value in enumerate(values):
+        integer = _as_integer(value)
+        if integer is None:
+            issues.append((index, "expected an integer"))
+        else:
+            checked.append(index)
+            integers.append(integer)
+
+    if np is not None and len(checked) > 1:
+        column = np.empty(len(checked), dtype=object)
+        column[:] = integers
+        mask = (column < low) | (column > high)
+        issues.extend((checked[int(i)], reason) for i in np.flatnonzero(mask))
+    else:
+        issues.extend(
+            (index, reason)
+            for index, integer in zip(checked, integers)
+            if not low <= integer <= high
+        )
+
+    issues.sort()
+    return issues
+
+
+def _is_address(value: Any) -> bool:
+    """Return True for 0x-prefixed hex addresses and 20 byte strings."""
+    if isinstance(value, str):
+        return _ADDRESS_RE.match(value) is not None
+    return isinstance(value, (bytes, bytearray)) and len(value) == 20
+
+
+def _as_integer(value: Any) -> Optional[int]:
+    """Return the value of an integer argument, or None if it isn't one.
+
+    Python and NumPy integers are accepted, as well as decimal strings (which
+    call_encoder.process_argument converts); bools and floats are not.
+    """
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, int):
+        return value
+    if np is not None and isinstance(value, np.integer):
+        return int(value)
+    if isinstance(value, str) and _DECIMAL_RE.match(value):
+        return int(value)
+    return None
@@ -0,0 +1,175 @@
+"""Persistent warm-start cache of compiled encoders.
+
+Short-lived workers pay for parsing signatures and hashing selectors before
+their first call. The state derived by encode_call can be saved to a versioned
+file once and loaded at startup instead.
+
+The file is plain JSON (signature, selector and parameter types of each
+entry), so loading it never runs code; encoders are rebuilt from the
+parameter types with compile_types. Selectors are not rehashed, so still
+keep the file where only your own processes can write it.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Union
+
+from . import abi_encoder, abi_types, call_encoder
+from .abi_encoder import compile_types
+from .abi_types import parse_function_signature
+from .call_encoder import (
+    CompiledFunction,
+    add_compiled_functions,
+    compile_function,
+    get_compiled_functions,
+)
+
+# Bump when the layout of the cache file changes
+CACHE_FORMAT_VERSION = 2
+
+PathLike = Union[str, "os.PathLike[str]"]
+
+
+def _library_version() -> str:
+    # Imported lazily: the package __init__ may still be running
+    from . import __version__
+
+    return str(__version__)
+
+
+def _code_fingerprint() -> str:
+    """Hash of the modules the cached state is derived with."""
+    digest = hashlib.sha256()
+    for module in (abi_types, abi_encoder, call_encoder):
+        digest.update(Path(str(module.__file__)).read_bytes())
+    return digest.hexdigest()
+
+
+def _header() -> Dict[str, Any]:
+    return {
+        "format": CACHE_FORMAT_VERSION,
+        "library_version": _library_version(),
+        "fingerprint": _code_fingerprint(),
+    }
+
+
+def save_encoder_cache(path: PathLike) -> int:
+    """
+    Save every signature compiled so far to a cache file.
+
+    The file is written atomically, so concurrent workers never read a
+    partial cache.
+
+    Args:
+        path: Destination file
+
+    Returns:
+        int: Number of compiled signatures saved
+    """
+    compiled_functions = get_compiled_functions()
+    payload = {
+        "header": _header(),
+        "functions": {
+            compiled.signature: {
+                "selector": f"0x{compiled.selector.hex()}",
+                "param_types": compiled.param_types,
+            }
+            for compiled in compiled_functions
+        },
+    }
+
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as file:
+            json.dump(payload, file, separators=(",", ":"))
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+    return len(compiled_functions)
+
+
+def load_encoder_cache(path: PathLike) -> int:
+    """
+    Load compiled signatures from a cache file written by save_encoder_cache.
+
+    A missing, corrupt or stale file (other cache format, library version or
+    encoder code) is ignored: encode_call then compiles signatures lazily as
+    usual.
+
+    Args:
+        path: Cache file
+
+    Returns:
+        int: Number of compiled signatures loaded (0 if the cache was unusable)
+    """
+    try:
+        with open(path, encoding="utf-8") as file:
+            payload = json.load(file)
+    except (OSError, ValueError):
+        # Missing, truncated or not JSON (UnicodeDecodeError is a ValueError)
+        return 0
+
+    if not isinstance(payload, dict) or payload.get("header") != _header():
+        return 0
+    functions = payload.get("functions")
+    if not isinstance(functions, dict):
+        return 0
+
+    compiled_functions: List[CompiledFunction] = []
+    for signature, entry in functions.items():
+        compiled = _rebuild(signature, entry)
+        if compiled is not None:
+            compiled_functions.append(compiled)
+    add_compiled_functions(compiled_functions)
+    return len(compiled_functions)
+
+
+def _rebuild(signature: str, entry: Any) -> Optional[CompiledFunction]:
+    """Rebuild a cache entry, or None if it doesn't match its own signature."""
+    try:
+        name, param_types = parse_function_signature(signature)
+        selector = bytes.fromhex(entry["selector"][2:])
+        if entry["param_types"] != param_types or len(selector) != 4:
+            return None
+        return CompiledFunction(
+            signature, name, selector, param_types, compile_types(param_types)
+        )
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+def warm_start(path: PathLike, signatures: Sequence[str] = ()) -> int:
+    """
+    Load the cache file, compile missing signatures and save it if it changed.
+
+    Intended to be called once at worker startup.
+
+    Args:
+        path: Cache file (created if missing or stale)
+        signatures: Signatures the worker is known to use
+
+    Returns:
+        int: Number of compiled signatures available after warm-up
+
+    Example:
+        >>> warm_start(
+        ...     "~/.cache/python_bot_utils/encoders.json",
+        ...     signatures=["burn(uint256)", "collect((uint256,address,uint128,uint128))"],
+        ... )
+        2
+    """
+    path = os.path.expanduser(path)
+    loaded = load_encoder_cache(path)
+    for signature in signatures:
+        compile_function(signature)
+
+    compiled = len(get_compiled_functions())
+    if compiled > loaded:
+        save_encoder_cache(path)
+    return compiled
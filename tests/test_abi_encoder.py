@@ -0,0 +1,121 @@
+"""Property-based tests: the native encoder must match eth_abi byte for byte."""
+
+from decimal import Decimal
+from typing import Any, Tuple
+
+import eth_abi
+import pytest
+from hypothesis import given, settings
+from hypothesis import strategies as st
+
+from abi_encoder import encode_abi
+from call_encoder import encode_call
+from uniswap_calls.pool import encode_mint
+
+TypeAndValues = Tuple[str, st.SearchStrategy[Any]]
+
+
+def _int_type(signed: bool, bits: int) -> TypeAndValues:
+    if signed:
+        values = st.integers(-(2 ** (bits - 1)), 2 ** (bits - 1) - 1)
+        return f"int{bits}", values
+    return f"uint{bits}", st.integers(0, 2**bits - 1)
+
+
+def _fixed_bytes_type(size: int) -> TypeAndValues:
+    return f"bytes{size}", st.binary(min_size=size, max_size=size)
+
+
+_bits = st.integers(1, 32).map(lambda n: n * 8)
+
+leaf_types: st.SearchStrategy[TypeAndValues] = st.one_of(
+    st.builds(_int_type, st.booleans(), _bits),
+    st.just(
+        ("address", st.binary(min_size=20, max_size=20).map(lambda b: "0x" + b.hex()))
+    ),
+    st.just(("bool", st.booleans())),
+    st.builds(_fixed_bytes_type, st.integers(1, 32)),
+    st.just(("bytes", st.binary(max_size=80))),
+    st.just(("string", st.text(max_size=40))),
+)
+
+
+def _dynamic_array(inner: TypeAndValues) -> TypeAndValues:
+    type_, values = inner
+    return f"{type_}[]", st.lists(values, max_size=4)
+
+
+def _fixed_array(inner: TypeAndValues, length: int) -> TypeAndValues:
+    type_, values = inner
+    return f"{type_}[{length}]", st.lists(values, min_size=length, max_size=length)
+
+
+def _tuple(components: Any) -> TypeAndValues:
+    types = ",".join(type_ for type_, _ in components)
+    return f"({types})", st.tuples(*(values for _, values in components))
+
+
+abi_types: st.SearchStrategy[TypeAndValues] = st.recursive(
+    leaf_types,
+    lambda children: st.one_of(
+        st.builds(_dynamic_array, children),
+        st.builds(_fixed_array, children, st.integers(1, 3)),
+        st.lists(children, min_size=1, max_size=4).map(_tuple),
+    ),
+    max_leaves=8,
+)
+
+
+@settings(max_examples=300, deadline=None)
+@given(st.lists(abi_types, min_size=1, max_size=4), st.data())
+def test_encode_abi_matches_eth_abi(params: Any, data: Any) -> None:
+    types = [type_ for type_, _ in params]
+    values = [data.draw(strategy) for _, strategy in params]
+
+    assert encode_abi(types, values) == eth_abi.encode(types, values)
+
+
+def test_pool_encode_mint_with_callback_data() -> None:
+    owner = "0x9a33c2fe2515b87ee5c36819d82126e1e66273c6"
+    data = "0x" + "ab" * 40
+
+    encoded_call: str = encode_mint(
+        owner=owner,
+        tick_lower=-600,
+        tick_upper=600,
+        liquidity=10**18,
+        data=data,
+    )
+
+    expected_params = eth_abi.encode(
+        ["address", "int24", "int24", "uint128", "bytes"],
+        [owner, -600, 600, 10**18, bytes.fromhex(data[2:])],
+    )
+    assert encoded_call == "0x3c8a7d8d" + expected_params.hex()
+
+
+def test_trusted_encoding_rejects_non_integers_and_odd_hex() -> None:
+    for value in (True, 1.5):
+        with pytest.raises(TypeError):
+            encode_abi(["uint256"], [value])
+        with pytest.raises(TypeError):
+            encode_call("f(uint256)", "f", [value], trusted=True)
+
+    with pytest.raises(ValueError):
+        encode_call("f(bytes)", "f", ["0x123"], trusted=True)
+    with pytest.raises(ValueError):
+        encode_call("f(bytes)", "f", ["0x123"])
+
+
+def test_types_follow_eth_abi() -> None:
+    # Static types without a native encoder are delegated to eth_abi
+    value = Decimal("1.5")
+    assert encode_abi(["fixed128x18", "uint256[]"], [value, [1]]) == eth_abi.encode(
+        ["fixed128x18", "uint256[]"], [value, [1]]
+    )
+    expected = eth_abi.encode(["fixed128x18"], [1]).hex()
+    assert encode_call("f(fixed128x18)", "f", [1])[10:] == expected
+
+    for type_ in ("uint7", "int0", "uint264", "foo"):
+        with pytest.raises(ValueError):
+            encode_abi([type_], [1])
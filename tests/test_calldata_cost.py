@@ -0,0 +1,97 @@
+"""Tests for the calldata gas cost estimator and encoding variant chooser."""
+
+import pytest
+
+from calldata_cost import (
+    L2CostModel,
+    choose_encodings,
+    estimate_calldata_costs,
+    l1_calldata_gas,
+)
+from uniswap_calls.position_manager import (
+    encode_collect,
+    encode_decreaseLiquidity,
+    encode_multicall,
+)
+
+RECIPIENT: str = "0x9a33c2fe2515b87ee5c36819d82126e1e66273c6"
+MAX_UINT128: int = 2**128 - 1
+
+
+def _naive_zero_runs(blob: bytes) -> int:
+    return sum(
+        1
+        for index, byte in enumerate(blob)
+        if byte == 0 and (index == 0 or blob[index - 1] != 0)
+    )
+
+
+def test_estimate_calldata_costs() -> None:
+    calls = [b"\x00\x00\x01\x00", b"", "0x0000", b"\x01\x02\x00\x03", b"\x00"]
+
+    costs = estimate_calldata_costs(calls, L2CostModel(zero_run_bytes=2))
+
+    assert list(costs["size"]) == [4, 0, 2, 4, 1]
+    assert list(costs["zero_bytes"]) == [3, 0, 2, 1, 1]
+    # "0x0000" and b"\x00" are separate runs although adjacent in the buffer
+    assert list(costs["zero_runs"]) == [2, 0, 1, 1, 1]
+    assert list(costs["l1_gas"]) == [28, 0, 8, 52, 4]
+    assert list(costs["l1_gas"]) == [l1_calldata_gas(call) for call in calls]
+    assert list(costs["l2_bytes"]) == [5, 0, 2, 5, 2]
+    assert list(costs["l2_gas"]) == [80, 0, 32, 80, 32]
+
+
+def test_zero_runs_of_encoded_calls() -> None:
+    calls = [
+        encode_collect(token_id, RECIPIENT, MAX_UINT128, 10**token_id)
+        for token_id in range(1, 30)
+    ]
+
+    costs = estimate_calldata_costs(calls)
+
+    assert list(costs["zero_runs"]) == [
+        _naive_zero_runs(bytes.fromhex(call[2:])) for call in calls
+    ]
+
+
+def test_choose_encodings_reports_savings() -> None:
+    decrease = encode_decreaseLiquidity(7, 10**18, 0, 0, 1748593204)
+    collect = encode_collect(7, RECIPIENT, MAX_UINT128, MAX_UINT128)
+    multicall = encode_multicall([decrease, collect])
+    intents = [
+        {"separate": [decrease, collect], "multicall": [multicall]},
+        {"separate": [collect], "multicall": [encode_multicall([collect])]},
+    ]
+
+    batch = choose_encodings(intents)
+
+    first, second = batch.choices
+    assert first.name == "multicall"
+    assert first.calls == [bytes.fromhex(multicall[2:])]
+    separate_gas = l1_calldata_gas(decrease) + l1_calldata_gas(collect)
+    assert first.calldata_gas == l1_calldata_gas(multicall)
+    assert first.transaction_gas == 21_000
+    assert first.calldata_gas_saved == separate_gas - first.calldata_gas
+    assert first.transaction_gas_saved == 21_000
+    # Fewer transactions, but the bytes[] offsets and padding add calldata
+    sizes = [len(call) // 2 - 1 for call in (decrease, collect, multicall)]
+    assert first.bytes_saved == sizes[0] + sizes[1] - sizes[2] < 0
+    # Wrapping a single call only adds bytes
+    assert (second.name, second.calldata_gas_saved, second.bytes_saved) == (
+        "separate",
+        0,
+        0,
+    )
+    assert batch.calldata_gas_saved == first.calldata_gas_saved
+    assert batch.transaction_gas_saved == 21_000
+    assert batch.bytes_saved == first.bytes_saved
+
+    l2_batch = choose_encodings(intents, baseline="multicall", l2_model=L2CostModel())
+    assert l2_batch.choices[1].name == "separate"
+    assert l2_batch.choices[1].bytes_saved > 0
+    # L2 data gas and transaction gas are reported apart, never summed
+    l2_costs = estimate_calldata_costs([collect], L2CostModel())
+    assert l2_batch.choices[1].calldata_gas == l2_costs["l2_gas"][0]
+    assert l2_batch.choices[1].transaction_gas == 21_000
+    with pytest.raises(ValueError):
+        choose_encodings(intents, baseline="pool")
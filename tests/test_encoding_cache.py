@@ -0,0 +1,128 @@
+"""Tests for the memoizing encoder."""
+
+import pytest
+
+from call_encoder import encode_call
+from encoding_cache import (
+    EncodingCache,
+    encode_call_batch,
+    map_dedup,
+    normalize_argument,
+)
+from registry import Field, FunctionSpec, ProtocolSpec, register_protocol
+from uniswap_calls.position_manager import encode_collect
+from validation import ArgumentValidationError
+
+MAX_UINT128: int = 2**128 - 1
+RECIPIENT: str = "0x9a33c2fe2515b87ee5c36819d82126e1e66273c6"
+COLLECT_SIGNATURE: str = "collect((uint256,address,uint128,uint128))"
+
+
+def test_encode_call_hits() -> None:
+    cache = EncodingCache()
+    args = [(1, RECIPIENT, MAX_UINT128, MAX_UINT128)]
+
+    first = cache.encode_call(COLLECT_SIGNATURE, "collect", args)
+    # A list instead of a tuple and a checksummed address: same entry
+    second = cache.encode_call(
+        COLLECT_SIGNATURE,
+        "collect",
+        [[1, "0x9A33c2Fe2515b87eE5c36819d82126e1E66273c6", MAX_UINT128, MAX_UINT128]],
+    )
+
+    assert first == second == encode_call(COLLECT_SIGNATURE, "collect", args)
+    stats = cache.stats()
+    assert (stats.hits, stats.misses, stats.entries) == (1, 1, 1)
+    assert stats.hit_rate == 0.5
+
+
+def test_wrap_helper_and_eviction() -> None:
+    encoded_size = len(encode_collect(1, RECIPIENT, MAX_UINT128, MAX_UINT128))
+    cache = EncodingCache(max_bytes=2 * encoded_size)
+    collect = cache.wrap(encode_collect)
+
+    for token_id in (1, 2, 1, 3):
+        assert collect(
+            token_id=token_id,
+            recipient=RECIPIENT,
+            amount0_max=MAX_UINT128,
+            amount1_max=MAX_UINT128,
+        ) == encode_collect(token_id, RECIPIENT, MAX_UINT128, MAX_UINT128)
+
+    stats = cache.stats()
+    assert (stats.hits, stats.misses, stats.evictions) == (1, 3, 1)
+    assert (stats.entries, stats.size_bytes) == (2, 2 * encoded_size)
+
+
+def test_batch_dedupe() -> None:
+    rows = [[(token_id % 3, RECIPIENT, 1, 1)] for token_id in range(10)]
+    calls = []
+
+    def encode(args: list) -> str:
+        calls.append(args)
+        return encode_call(COLLECT_SIGNATURE, "collect", args)
+
+    assert map_dedup(encode, rows) == [
+        encode_call(COLLECT_SIGNATURE, "collect", args) for args in rows
+    ]
+    assert len(calls) == 3
+
+    cache = EncodingCache()
+    assert encode_call_batch(COLLECT_SIGNATURE, "collect", rows, cache=cache) == [
+        encode_call(COLLECT_SIGNATURE, "collect", args) for args in rows
+    ]
+    assert cache.stats().misses == 3
+
+
+def test_keys_keep_argument_types_and_trust() -> None:
+    assert len({normalize_argument(value) for value in (1, True, 1.0)}) == 3
+    cache = EncodingCache()
+    assert cache.encode_call("burn(uint256)", "burn", [1]).endswith("01")
+
+    # True == 1, but a bool isn't a uint: no cached result for it
+    with pytest.raises(ArgumentValidationError):
+        cache.encode_call("burn(uint256)", "burn", [True])
+    with pytest.raises(ArgumentValidationError):
+        cache.encode_call("burn(uint256)", "burn", [1.0])
+
+    # A call encoded without validation isn't served to a validated one
+    cache.encode_call("burn(uint8)", "burn", [255], trusted=True)
+    cache.encode_call("burn(uint8)", "burn", [255])
+    assert cache.stats().hits == 0
+
+
+def test_strings_are_never_case_folded() -> None:
+    upper, lower = "0x" + "AB" * 20, "0x" + "ab" * 20
+    rows = [[upper], [lower]]
+
+    assert encode_call_batch("setName(string)", "setName", rows) == [
+        encode_call("setName(string)", "setName", row) for row in rows
+    ]
+    cache = EncodingCache()
+    set_name = cache.wrap(
+        lambda name: encode_call("setName(string)", "setName", [name])
+    )
+    assert set_name(upper) != set_name(lower)
+
+    # Typed rows still dedupe two spellings of an address
+    calls: list = []
+    encoded = map_dedup(calls.append, rows, ["address"])
+    assert len(calls) == 1 and len(encoded) == 2
+
+
+def test_wrap_keys_on_the_encoder() -> None:
+    encoders = [
+        register_protocol(
+            ProtocolSpec(
+                f"test_cache_fork_{type_}",
+                [FunctionSpec("exactInputSingle", [Field("fee", type_)], struct=True)],
+            )
+        )["encode_exactInputSingle"]
+        for type_ in ("uint24", "int24")
+    ]
+    cache = EncodingCache()
+
+    uint_fork, int_fork = (cache.wrap(encoder) for encoder in encoders)
+
+    assert uint_fork(500) == encoders[0](500)
+    assert int_fork(500) == encoders[1](500) != uint_fork(500)
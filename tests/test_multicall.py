@@ -0,0 +1,92 @@
+"""Tests for the Multicall3 aggregate3 / tryAggregate encoders and decoders."""
+
+from types import SimpleNamespace
+from typing import Any, Dict, List
+
+import eth_abi
+import pytest
+
+from multicall import (
+    MULTICALL3_ADDRESS,
+    CallResult,
+    decode_aggregate3,
+    encode_aggregate3,
+    encode_aggregate3_batches,
+    encode_try_aggregate,
+    execute_aggregate3,
+)
+from uniswap_calls.views import decode_slot0_batch, encode_slot0
+
+POOL0: str = "0x88e6A0c2dDD26FEEb64F039a2c41296FcB3f5640"
+POOL1: str = "0x8ad599c3A0ff1De082011EFDDc58f1908eb6e6D8"
+SLOT0_TYPES = ["uint160", "int24", "uint16", "uint16", "uint16", "uint8", "bool"]
+
+
+def _slot0_blob(tick: int) -> bytes:
+    return eth_abi.encode(SLOT0_TYPES, [2**96, tick, 1, 2, 3, 0, True])
+
+
+def _results_blob(results: List[Any]) -> bytes:
+    return eth_abi.encode(["(bool,bytes)[]"], [results])
+
+
+def test_encode_aggregate3() -> None:
+    calls = [(POOL0, encode_slot0()), (POOL1, bytes.fromhex("3850c7bd"), False)]
+
+    encoded = encode_aggregate3(calls)
+
+    assert encoded[:10] == "0x82ad56cb"
+    (decoded,) = eth_abi.decode(["(address,bool,bytes)[]"], bytes.fromhex(encoded[10:]))
+    assert decoded == (
+        (POOL0.lower(), True, bytes.fromhex("3850c7bd")),
+        (POOL1.lower(), False, bytes.fromhex("3850c7bd")),
+    )
+
+
+def test_encode_try_aggregate() -> None:
+    encoded = encode_try_aggregate([(POOL0, encode_slot0())], require_success=True)
+
+    assert encoded[:10] == "0xbce38bd7"
+    assert eth_abi.decode(
+        ["bool", "(address,bytes)[]"], bytes.fromhex(encoded[10:])
+    ) == (True, ((POOL0.lower(), bytes.fromhex("3850c7bd")),))
+
+
+def test_decode_aggregate3() -> None:
+    blob = _results_blob([(True, _slot0_blob(-5)), (False, b"\x08\xc3"), (True, b"")])
+
+    results = decode_aggregate3("0x" + blob.hex())
+
+    assert results == [
+        CallResult(True, _slot0_blob(-5)),
+        CallResult(False, b"\x08\xc3"),
+        CallResult(True, b""),
+    ]
+    assert decode_aggregate3(_results_blob([])) == []
+    with pytest.raises(ValueError):
+        decode_aggregate3(blob[:-32])
+
+
+def test_execute_aggregate3_batches_calls() -> None:
+    requests: List[Dict[str, Any]] = []
+
+    def call(transaction: Dict[str, Any], block_identifier: Any) -> bytes:
+        requests.append(transaction)
+        (calls,) = eth_abi.decode(
+            ["(address,bool,bytes)[]"], bytes.fromhex(transaction["data"][10:])
+        )
+        ticks = {POOL0.lower(): -5, POOL1.lower(): 7}
+        return _results_blob([(True, _slot0_blob(ticks[call[0]])) for call in calls])
+
+    web3 = SimpleNamespace(eth=SimpleNamespace(call=call))
+    calls = [(pool, encode_slot0()) for pool in [POOL0, POOL1, POOL1]]
+
+    results = execute_aggregate3(web3, calls, batch_size=2)
+
+    assert len(requests) == 2
+    assert all(request["to"] == MULTICALL3_ADDRESS for request in requests)
+    assert requests[0]["data"] == encode_aggregate3_batches(calls, batch_size=2)[0]
+    slot0 = decode_slot0_batch([result.return_data for result in results])
+    assert list(slot0["tick"]) == [-5, 7, 7]
+    with pytest.raises(ValueError):
+        encode_aggregate3_batches(calls, batch_size=0)
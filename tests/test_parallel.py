@@ -0,0 +1,61 @@
+"""Tests for thread-pool batch encoding and the thread-safe caches."""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from call_encoder import encode_call
+from encoding_cache import EncodingCache
+from parallel import encode_call_batch_threaded, map_threaded
+from thread_cache import per_thread_cache
+from uniswap_calls.position_manager import encode_burn
+
+RECIPIENT: str = "0x9a33c2fe2515b87ee5c36819d82126e1e66273c6"
+COLLECT_SIGNATURE: str = "collect((uint256,address,uint128,uint128))"
+
+
+def test_encode_call_batch_threaded_matches_serial() -> None:
+    rows = [[(token_id % 50, RECIPIENT, token_id, 1)] for token_id in range(400)]
+    expected = [encode_call(COLLECT_SIGNATURE, "collect", args) for args in rows]
+    cache = EncodingCache(shards=4)
+
+    encoded = encode_call_batch_threaded(
+        COLLECT_SIGNATURE, "collect", rows, max_workers=4, chunk_size=16
+    )
+    assert encoded == expected
+    with ThreadPoolExecutor(4) as executor:
+        for _ in range(2):
+            encoded = encode_call_batch_threaded(
+                COLLECT_SIGNATURE,
+                "collect",
+                rows,
+                chunk_size=7,
+                cache=cache,
+                executor=executor,
+            )
+            assert encoded == expected
+    stats = cache.stats()
+    assert (stats.misses, stats.hits, stats.entries) == (400, 400, 400)
+    assert map_threaded(encode_burn, range(10), chunk_size=3) == [
+        encode_burn(token_id) for token_id in range(10)
+    ]
+
+
+def test_per_thread_cache() -> None:
+    calls = []
+
+    @per_thread_cache(maxsize=2)
+    def square(value: int) -> int:
+        calls.append((threading.get_ident(), value))
+        return value * value
+
+    assert [square(value) for value in (1, 2, 1, 3, 1, 2)] == [1, 4, 1, 9, 1, 4]
+    # LRU: the hit on 1 made 2 the least recently used entry when 3 was cached
+    assert [value for _, value in calls] == [1, 2, 3, 2]
+
+    with ThreadPoolExecutor(1) as executor:
+        assert executor.submit(square, 2).result() == 4
+    assert len(calls) == 5
+
+    square.cache_clear()
+    assert square(3) == 9
+    assert len(calls) == 6
@@ -0,0 +1,154 @@
+"""Tests for the declarative protocol registry."""
+
+import inspect
+
+import pytest
+
+from call_encoder import encode_call
+from registry import (
+    Field,
+    FunctionSpec,
+    ProtocolSpec,
+    get_overloads,
+    get_registered_function,
+    register_protocol,
+)
+from uniswap_calls import pool, position_manager, router, universal_router
+from uniswap_calls.router import encode_exactInputSingle
+from uniswap_calls.universal_router import encode_execute, encode_execute_no_deadline
+from validation import ArgumentValidationError
+
+TOKEN0: str = "0x1c7d4b196cb0c7b01d743fbc6116a902379c7238"
+TOKEN1: str = "0xfff9976782d46cc05630d1f6ebab18b2324d6b14"
+
+FORK_ROUTER = ProtocolSpec(
+    "test_fork_router",
+    [
+        FunctionSpec(
+            "exactInputSingle",
+            [
+                Field("token_in", "address"),
+                Field("token_out", "address"),
+                Field("tick_spacing", "int24"),
+                Field("recipient", "address"),
+                Field("deadline", "uint256"),
+                Field("amount_in", "uint256"),
+                Field("amount_out_minimum", "uint256", default=0),
+                Field("sqrt_price_limit_x96", "uint160", default=0),
+            ],
+            struct=True,
+            doc="Encode a call to the fork router exactInputSingle function.",
+        ),
+        FunctionSpec(
+            "sweepToken",
+            [Field("token", "address"), Field("amount_minimum", "uint256")],
+            encoder_name="encode_sweep",
+            bounds={"amount_minimum": (1, 2**256 - 1)},
+        ),
+    ],
+)
+
+
+def test_register_protocol() -> None:
+    encoders = register_protocol(FORK_ROUTER, "fork_router")
+    swap = encoders["encode_exactInputSingle"]
+
+    expected = encode_call(
+        "exactInputSingle((address,address,int24,address,uint256,uint256,uint256,uint160))",
+        "exactInputSingle",
+        [(TOKEN0, TOKEN1, -60, TOKEN1, 1748593204, 10**18, 0, 0)],
+    )
+    assert swap(TOKEN0, TOKEN1, -60, TOKEN1, 1748593204, 10**18) == expected
+    by_name = swap(
+        amount_in=10**18,
+        deadline=1748593204,
+        recipient=TOKEN1,
+        tick_spacing=-60,
+        token_out=TOKEN1,
+        token_in=TOKEN0,
+    )
+    assert by_name == expected
+    assert swap.__name__ == "encode_exactInputSingle"
+    assert swap.__module__ == "fork_router"
+    assert swap.__doc__.startswith("Encode a call to the fork router")
+    parameters = inspect.signature(swap).parameters
+    assert parameters["amount_out_minimum"].default == 0
+    assert parameters["trusted"].kind is inspect.Parameter.KEYWORD_ONLY
+
+    registered = get_registered_function("test_fork_router", "sweepToken")
+    assert registered.signature == "sweepToken(address,uint256)"
+    assert registered.encode is encoders["encode_sweep"]
+    with pytest.raises(ArgumentValidationError, match="amount_minimum"):
+        encoders["encode_sweep"](TOKEN0, 0)
+    with pytest.raises(TypeError, match="missing required arguments: amount_in"):
+        swap(TOKEN0, TOKEN1, -60, TOKEN1, 1748593204)
+    with pytest.raises(TypeError, match="unexpected keyword argument 'fee'"):
+        swap(TOKEN0, TOKEN1, -60, TOKEN1, 1748593204, 1, fee=500)
+    with pytest.raises(KeyError):
+        get_registered_function("test_fork_router", "exactOutputSingle")
+
+
+def test_uniswap_encoders_are_registered() -> None:
+    registered = get_registered_function("uniswap_v3_swap_router", "exactInputSingle")
+
+    args = (TOKEN0, TOKEN1, 500, TOKEN1, 1748593204, 10**18, 0)
+    assert registered.encode(*args) == encode_exactInputSingle(*args)
+    # The public encoders keep their typed signatures
+    assert list(inspect.signature(encode_exactInputSingle).parameters)[-1] == "trusted"
+    assert encode_exactInputSingle.__annotations__["fee"] is int
+    assert registered.spec.fields[0].name == "token_in"
+
+
+def test_overloads_are_registered_by_signature() -> None:
+    overloads = get_overloads("uniswap_universal_router", "execute")
+    assert [overload.signature for overload in overloads] == [
+        "execute(bytes,bytes[],uint256)",
+        "execute(bytes,bytes[])",
+    ]
+
+    commands, inputs = b"\x0b", [b"\x01" * 64]
+    assert encode_execute(commands, inputs, 1748593204).startswith("0x3593564c")
+    assert encode_execute_no_deadline(commands, inputs).startswith("0x24856bc3")
+    no_deadline = get_registered_function(
+        "uniswap_universal_router", "execute(bytes,bytes[])"
+    )
+    assert no_deadline.encode(commands, inputs) == encode_execute_no_deadline(
+        commands, inputs
+    )
+    with pytest.raises(ValueError, match="overloaded"):
+        get_registered_function("uniswap_universal_router", "execute")
+    with pytest.raises(KeyError):
+        get_registered_function("uniswap_universal_router", "execute(bytes)")
+
+    with pytest.raises(ValueError, match="distinct encoder_name"):
+        register_protocol(
+            ProtocolSpec(
+                "test_overloads",
+                [
+                    FunctionSpec("multicall", [Field("data", "bytes[]")]),
+                    FunctionSpec(
+                        "multicall",
+                        [Field("deadline", "uint256"), Field("data", "bytes[]")],
+                    ),
+                ],
+            )
+        )
+
+
+@pytest.mark.parametrize(
+    "module, protocol",
+    [
+        (position_manager, position_manager.POSITION_MANAGER),
+        (pool, pool.POOL),
+        (router, router.SWAP_ROUTER),
+        (universal_router, universal_router.UNIVERSAL_ROUTER),
+    ],
+)
+def test_typed_encoders_match_their_specs(
+    module: object, protocol: ProtocolSpec
+) -> None:
+    # The typed public encoders repeat the spec fields: keep them in sync
+    for spec in protocol.functions:
+        registered = get_registered_function(protocol.name, spec.signature)
+        wrapper = getattr(module, spec.python_name)
+        assert inspect.signature(wrapper) == inspect.signature(registered.encode)
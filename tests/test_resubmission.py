@@ -0,0 +1,161 @@
+"""Tests for the resubmission cache of stuck transactions."""
+
+import pytest
+
+from registry import (
+    Field,
+    FunctionSpec,
+    ProtocolSpec,
+    get_registered_function,
+    register_protocol,
+)
+from resubmission import ResubmissionCache, field_layout
+from uniswap_calls.position_manager import encode_mint
+from uniswap_calls.router import encode_exactInputSingle
+from validation import ArgumentValidationError
+
+USDC: str = "0xA0b86991c6218b36c1d19D4a2e9Eb0cE3606eB48"
+WETH: str = "0xC02aaA39b223FE8D0A0e5C4F27eAD9083C756Cc2"
+RECIPIENT: str = "0x9A33c2FE2515B87ee5C36819d82126E1e66273c6"
+
+SWAP = {
+    "token_in": USDC,
+    "token_out": WETH,
+    "fee": 500,
+    "recipient": RECIPIENT,
+    "deadline": 1640995200,
+    "amount_in": 10**9,
+    "amount_out_minimum": 3 * 10**17,
+}
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_resubmit_rewrites_changed_words() -> None:
+    cache = ResubmissionCache()
+    data = cache.encode(
+        "0xa1", "uniswap_v3_swap_router", "exactInputSingle", nonce=7, **SWAP
+    )
+    assert data == encode_exactInputSingle(**SWAP)
+
+    replacement = cache.resubmit(
+        "0xa1", "0xa2", deadline=1640995260, amount_out_minimum=31 * 10**16
+    )
+    expected = encode_exactInputSingle(
+        **{**SWAP, "deadline": 1640995260, "amount_out_minimum": 31 * 10**16}
+    )
+    assert replacement == expected
+
+    # Replacing a replacement, including an address word
+    again = cache.resubmit("0xa2", "0xa3", recipient=USDC)
+    assert again == encode_exactInputSingle(
+        **{
+            **SWAP,
+            "deadline": 1640995260,
+            "amount_out_minimum": 31 * 10**16,
+            "recipient": USDC,
+        }
+    )
+    assert cache.lineage("0xa3") == ["0xa1", "0xa2", "0xa3"]
+    # Decimal strings are converted as by the encoders
+    assert cache.resubmit("0xa3", "0xa4", deadline="1640995260") == again
+    assert cache.nonce("0xa3") == 7
+    assert cache.data("0xa1") == bytes.fromhex(data[2:])
+
+
+def test_track_encoded_mint() -> None:
+    kwargs = {
+        "token0": USDC,
+        "token1": WETH,
+        "fee": 500,
+        "tick_lower": -600,
+        "tick_upper": 600,
+        "amount0_desired": 10**9,
+        "amount1_desired": 10**18,
+        "amount0_min": 0,
+        "amount1_min": 0,
+        "recipient": RECIPIENT,
+        "deadline": 1640995200,
+    }
+    cache = ResubmissionCache()
+    cache.track(1, "uniswap_v3_position_manager", "mint", encode_mint(**kwargs))
+
+    replacement = cache.resubmit(1, 2, tick_lower=-1200, amount0_min=10**8)
+    assert replacement == encode_mint(
+        **{**kwargs, "tick_lower": -1200, "amount0_min": 10**8}
+    )
+
+    with pytest.raises(ArgumentValidationError):
+        cache.resubmit(1, 3, tick_lower=-887273)
+    with pytest.raises(ArgumentValidationError):
+        cache.resubmit(1, 3, deadline=-1)
+    with pytest.raises(ValueError):
+        cache.resubmit(1, 3, nonexistent=1)
+    with pytest.raises(ValueError):
+        cache.track(4, "uniswap_v3_position_manager", "burn", encode_mint(**kwargs))
+    assert 3 not in cache
+
+
+def test_dynamic_struct_layout() -> None:
+    protocol = ProtocolSpec(
+        "test_resubmission_dynamic",
+        [
+            FunctionSpec(
+                "swap",
+                [
+                    Field("path", "bytes"),
+                    Field("recipient", "address"),
+                    Field("deadline", "uint256"),
+                    Field("flag", "bool"),
+                ],
+                struct=True,
+            )
+        ],
+    )
+    encode_swap = register_protocol(protocol)["encode_swap"]
+    layout = field_layout(get_registered_function(protocol.name, "swap"))
+    assert sorted(layout) == ["deadline", "flag", "recipient"]
+    assert layout["recipient"].offset == 4 + 32 + 32
+
+    cache = ResubmissionCache()
+    cache.encode(
+        "t",
+        protocol.name,
+        "swap",
+        path=b"\x01" * 43,
+        recipient=RECIPIENT,
+        deadline=1,
+        flag=True,
+    )
+    assert cache.resubmit("t", "u", deadline=2, flag=False) == encode_swap(
+        b"\x01" * 43, RECIPIENT, 2, False
+    )
+
+
+def test_age_and_size_eviction() -> None:
+    clock = _Clock()
+    cache = ResubmissionCache(max_age=60, max_entries=3, clock=clock)
+    cache.encode("a", "uniswap_v3_swap_router", "exactInputSingle", **SWAP)
+    clock.now = 30
+    cache.resubmit("a", "b", deadline=1640995260)
+
+    clock.now = 61
+    assert cache.evict_expired() == 1
+    assert "a" not in cache
+    # The lineage outlives the evicted original
+    assert cache.lineage("b") == ["a", "b"]
+
+    clock.now = 100
+    with pytest.raises(KeyError):
+        cache.resubmit("b", "c", deadline=1640995320)
+
+    for tx_id in "defg":
+        cache.encode(tx_id, "uniswap_v3_swap_router", "exactInputSingle", **SWAP)
+    assert len(cache) == 3 and "d" not in cache
+    assert cache.evictions == 3
@@ -0,0 +1,95 @@
+"""Tests for the memory-mapped selector database."""
+
+from pathlib import Path
+
+import pytest
+
+from selector_db import (
+    SelectorDatabase,
+    compile_selector_db,
+    lookup_selector,
+    main,
+    open_selector_db,
+)
+from uniswap_calls.position_manager import encode_collect
+
+SIGNATURES = [
+    "# ERC20",
+    "transfer(address, uint256)",
+    "transfer(address,uint256)",
+    "many_msg_babbage(bytes1)",
+    "approve(address,uint256)",
+    "",
+    "collect((uint256,address,uint128,uint128))",
+    "execute(bytes,bytes[],uint256)",
+]
+
+
+def test_compile_and_lookup(tmp_path: Path) -> None:
+    path = tmp_path / "selectors.db"
+
+    assert compile_selector_db(SIGNATURES, path) == 5
+
+    with SelectorDatabase(path) as database:
+        assert len(database) == 5
+        # A known selector collision: both signatures are returned
+        assert database.lookup("0xa9059cbb") == [
+            "many_msg_babbage(bytes1)",
+            "transfer(address,uint256)",
+        ]
+        assert database.lookup(0x3593564C) == ["execute(bytes,bytes[],uint256)"]
+        assert database.lookup(bytes.fromhex("095ea7b3")) == [
+            "approve(address,uint256)"
+        ]
+        assert database.lookup("0x00000000") == []
+        assert database.lookup("0xffffffff") == []
+
+    calldata = encode_collect(1, "0x9a33c2fe2515b87ee5c36819d82126e1e66273c6", 1, 1)
+    assert lookup_selector(calldata, path) == [
+        "collect((uint256,address,uint128,uint128))"
+    ]
+
+
+def test_lookup_selector_default_path(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    signatures = tmp_path / "signatures.txt"
+    signatures.write_text("\n".join(SIGNATURES))
+    path = tmp_path / "cli.db"
+    main(["compile", str(signatures), str(path)])
+
+    monkeypatch.setenv("PYTHON_BOT_UTILS_SELECTOR_DB", str(path))
+    assert lookup_selector("095ea7b3") == ["approve(address,uint256)"]
+
+    path.write_bytes(b"not a selector database")
+    with pytest.raises(ValueError):
+        SelectorDatabase(path)
+
+
+def test_open_selector_db_reloads_replaced_file(tmp_path: Path) -> None:
+    path = tmp_path / "selectors.db"
+    compile_selector_db(["approve(address,uint256)"], path)
+    database = open_selector_db(path)
+    assert open_selector_db(path) is database
+    assert lookup_selector("0xa9059cbb", path) == []
+
+    compile_selector_db(SIGNATURES, path)
+    assert database.replaced()
+    assert lookup_selector("0xa9059cbb", path) == [
+        "many_msg_babbage(bytes1)",
+        "transfer(address,uint256)",
+    ]
+    assert len(open_selector_db(path)) == 5
+    # The old mapping stays readable
+    assert database.lookup("0x095ea7b3") == ["approve(address,uint256)"]
+
+
+def test_truncated_database(tmp_path: Path) -> None:
+    path = tmp_path / "selectors.db"
+    compile_selector_db(SIGNATURES, path)
+    content = path.read_bytes()
+
+    for size in (len(content) - 1, 40):
+        path.write_bytes(content[:size])
+        with pytest.raises(ValueError, match="Corrupt selector database"):
+            SelectorDatabase(path)
@@ -0,0 +1,90 @@
+"""Tests for the EIP-1559 transaction builder and batch signer."""
+
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from eth_account import Account
+
+from transactions import (
+    FeePolicy,
+    NonceManager,
+    build_transactions,
+    sign_transactions,
+)
+from uniswap_calls.position_manager import encode_collect
+
+PRIVATE_KEY: str = "0x" + "11" * 32
+POSITION_MANAGER: str = "0xC36442b4a4522E871399CD717aBDD847Ab11FE88"
+RECIPIENT: str = "0x9A33c2FE2515B87ee5C36819d82126E1e66273c6"
+
+
+def _calls(count: int) -> list:
+    return [
+        (
+            POSITION_MANAGER,
+            encode_collect(token_id, RECIPIENT, 2**128 - 1, 2**128 - 1),
+        )
+        for token_id in range(count)
+    ]
+
+
+def test_build_transactions() -> None:
+    nonces = NonceManager(41)
+    collect_selector = bytes.fromhex("fc6f7865")
+    policy = FeePolicy(
+        30 * 10**9, 10**9, gas_limit=500_000, gas_limits={collect_selector: 150_000}
+    )
+
+    transactions = build_transactions(
+        _calls(2) + [(RECIPIENT, b"", 10**18)], 1, policy, nonces
+    )
+
+    assert [tx["nonce"] for tx in transactions] == [41, 42, 43]
+    assert nonces.next_nonce == 44
+    assert [tx["gas"] for tx in transactions] == [150_000, 150_000, 500_000]
+    assert transactions[0]["data"][:4] == collect_selector
+    assert transactions[2]["value"] == 10**18
+    assert transactions[2]["maxFeePerGas"] == 30 * 10**9
+
+
+def test_sign_transactions_matches_serial_signing() -> None:
+    transactions = build_transactions(
+        _calls(5), chain_id=1, fee_policy=FeePolicy(10**10, 10**9), nonces=0
+    )
+    expected = [
+        bytes(Account.sign_transaction(tx, PRIVATE_KEY).raw_transaction)
+        for tx in transactions
+    ]
+
+    with ThreadPoolExecutor(2) as executor:
+        batch = sign_transactions(
+            PRIVATE_KEY, transactions, chunk_size=2, executor=executor
+        )
+
+    assert len(batch) == 5
+    assert list(batch.raw_transactions()) == expected
+    assert batch.buffer == b"".join(expected)
+    assert batch.raw_transaction(3) == expected[3]
+    assert sign_transactions(PRIVATE_KEY, transactions, processes=1) == batch
+
+
+def test_sign_transactions_process_pool() -> None:
+    transactions = build_transactions(
+        _calls(5), chain_id=1, fee_policy=FeePolicy(10**10, 10**9), nonces=0
+    )
+
+    # Default path: a ProcessPoolExecutor started for the call
+    batch = sign_transactions(PRIVATE_KEY, transactions, processes=2, chunk_size=2)
+
+    assert batch == sign_transactions(PRIVATE_KEY, transactions, processes=1)
+
+
+def test_build_transactions_keeps_nonces_on_bad_call() -> None:
+    nonces = NonceManager(7)
+
+    with pytest.raises(ValueError):
+        build_transactions(
+            _calls(2) + [(RECIPIENT, "0xzz")], 1, FeePolicy(10**10, 10**9), nonces
+        )
+
+    assert nonces.next_nonce == 7
@@ -0,0 +1,97 @@
+"""Tests for the up-front argument validation."""
+
+import numpy as np
+import pytest
+
+from call_encoder import encode_call
+from uniswap_calls.pool import encode_burn
+from uniswap_calls.position_manager import encode_decreaseLiquidity
+from validation import ArgumentValidationError, validate_batch, validate_columns
+
+BURN_SIGNATURE = "burn(int24,int24,uint128)"
+BURN_FIELDS = ["tick_lower", "tick_upper", "liquidity"]
+
+
+def test_validate_batch_reports_every_offending_row() -> None:
+    rows = [
+        [-100, 100, 10],
+        [-100, 100, -1],
+        [-(2**23) - 1, 100, 10],
+        [-100, 100, 2**128],
+    ]
+
+    with pytest.raises(ArgumentValidationError) as excinfo:
+        validate_batch(BURN_SIGNATURE, rows, names=BURN_FIELDS)
+
+    assert [(error.row, error.field) for error in excinfo.value.errors] == [
+        (1, "liquidity"),
+        (2, "tick_lower"),
+        (3, "liquidity"),
+    ]
+
+
+def test_validate_columns_numpy() -> None:
+    tick_lower = np.array([-100, -900000, -100], dtype=np.int64)
+    tick_upper = np.array([100, 100, 900000], dtype=np.int64)
+    liquidity = np.array([1, 2, 3], dtype=np.uint64)
+    bounds = {"tick_lower": (-887272, 887272), "tick_upper": (-887272, 887272)}
+
+    with pytest.raises(ArgumentValidationError) as excinfo:
+        validate_columns(
+            BURN_SIGNATURE,
+            [tick_lower, tick_upper, liquidity],
+            names=BURN_FIELDS,
+            bounds=bounds,
+        )
+
+    assert [(error.row, error.field) for error in excinfo.value.errors] == [
+        (1, "tick_lower"),
+        (2, "tick_upper"),
+    ]
+
+
+def test_encoder_reports_field_names() -> None:
+    with pytest.raises(ArgumentValidationError) as excinfo:
+        encode_burn(tick_lower=-887273, tick_upper=887272, liquidity=1)
+
+    assert [error.field for error in excinfo.value.errors] == ["tick_lower"]
+
+    with pytest.raises(ArgumentValidationError) as excinfo:
+        encode_decreaseLiquidity(
+            token_id=1, liquidity=2**128, amount0_min=0, amount1_min=0, deadline=-1
+        )
+
+    assert [error.field for error in excinfo.value.errors] == [
+        "liquidity",
+        "deadline",
+    ]
+
+
+def test_trusted_mode_skips_validation() -> None:
+    # Within the int24 range but outside the Uniswap tick range: only the
+    # validation stage knows about it
+    encoded_call = encode_burn(
+        tick_lower=-887273, tick_upper=887272, liquidity=1, trusted=True
+    )
+
+    assert encoded_call.startswith("0xa34123a7")
+
+
+def test_encode_call_validates_raw_arguments() -> None:
+    signature = "transfer(address,uint256)"
+
+    with pytest.raises(ArgumentValidationError) as excinfo:
+        encode_call(signature, "transfer", ["0xbad", 2**300])
+
+    assert [error.field for error in excinfo.value.errors] == ["args[0]", "args[1]"]
+
+    with pytest.raises(ArgumentValidationError):
+        encode_call(signature, "transfer", ["0x" + "11" * 20, "twelve"])
+    with pytest.raises(ArgumentValidationError):
+        encode_call(signature, "transfer", ["0x" + "11" * 20, 1, 2])
+    with pytest.raises(ValueError):
+        encode_call(signature, "transfer", ["0x" + "11" * 20, 1, 2], trusted=True)
+
+    # Decimal strings are still accepted for integers
+    encoded_call = encode_call(signature, "transfer", ["0x" + "11" * 20, "12"])
+    assert encoded_call == encode_call(signature, "transfer", ["0x" + "11" * 20, 12])
@@ -0,0 +1,62 @@
+"""Tests for the persistent warm-start cache of compiled encoders."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+import call_encoder
+import warm_cache
+from call_encoder import encode_call
+
+BURN_SIGNATURE: str = "burn(uint256)"
+COLLECT_SIGNATURE: str = "collect((uint256,address,uint128,uint128))"
+
+
+@pytest.fixture
+def empty_compiled_functions(monkeypatch: pytest.MonkeyPatch) -> dict:
+    compiled_functions: dict = {}
+    monkeypatch.setattr(call_encoder, "_compiled_functions", compiled_functions)
+    return compiled_functions
+
+
+def test_save_and_load(tmp_path: Path, empty_compiled_functions: dict) -> None:
+    cache_file = tmp_path / "encoders.json"
+    expected_call = encode_call(BURN_SIGNATURE, "burn", [198395])
+
+    assert warm_cache.save_encoder_cache(cache_file) == 1
+    empty_compiled_functions.clear()
+
+    assert warm_cache.load_encoder_cache(cache_file) == 1
+    assert BURN_SIGNATURE in empty_compiled_functions
+    assert encode_call(BURN_SIGNATURE, "burn", [198395]) == expected_call
+    entry = json.loads(cache_file.read_text())["functions"][BURN_SIGNATURE]
+    assert entry == {"selector": "0x42966c68", "param_types": ["uint256"]}
+
+
+def test_stale_or_corrupt_cache_is_ignored(
+    tmp_path: Path, empty_compiled_functions: dict, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    cache_file = tmp_path / "encoders.json"
+    assert warm_cache.warm_start(cache_file, [BURN_SIGNATURE, COLLECT_SIGNATURE]) == 2
+    content = cache_file.read_text()
+    empty_compiled_functions.clear()
+
+    # An entry that doesn't match its own signature is dropped
+    payload = json.loads(content)
+    payload["functions"][BURN_SIGNATURE]["param_types"] = ["uint128"]
+    cache_file.write_text(json.dumps(payload))
+    assert warm_cache.load_encoder_cache(cache_file) == 1
+    assert list(empty_compiled_functions) == [COLLECT_SIGNATURE]
+    empty_compiled_functions.clear()
+
+    cache_file.write_text(content)
+    monkeypatch.setattr(warm_cache, "_library_version", lambda: "999.0.0")
+    assert warm_cache.load_encoder_cache(cache_file) == 0
+
+    cache_file.write_text(content[:20])
+    assert warm_cache.load_encoder_cache(cache_file) == 0
+    cache_file.write_bytes(b"\x80\x04\x95")
+    assert warm_cache.load_encoder_cache(cache_file) == 0
+    assert warm_cache.load_encoder_cache(tmp_path / "missing.json") == 0
+    assert empty_compiled_functions == {}
@@ -0,0 +1,53 @@
+"""Tests for the Uniswap V3 pool address derivation."""
+
+import pytest
+
+from uniswap_calls.pool_address import (
+    UNISWAP_V3_FACTORY,
+    compute_pool_address,
+    compute_pool_addresses,
+)
+
+WETH: str = "0xC02aaA39b223FE8D0A0e5C4F27eAD9083C756Cc2"
+USDC: str = "0xA0b86991c6218b36c1d19D4a2e9Eb0cE3606eB48"
+DAI: str = "0x6B175474E89094C44Da98b954EedeAC495271d0F"
+
+
+def test_compute_pool_address() -> None:
+    """USDC/WETH 0.05% pool on Ethereum mainnet."""
+    expected_address: str = "0x88e6A0c2dDD26FEEb64F039a2c41296FcB3f5640"
+
+    assert compute_pool_address(UNISWAP_V3_FACTORY, USDC, WETH, 500) == expected_address
+    # Token order doesn't matter
+    assert compute_pool_address(UNISWAP_V3_FACTORY, WETH, USDC, 500) == expected_address
+
+
+def test_compute_pool_addresses() -> None:
+    addresses = compute_pool_addresses(
+        UNISWAP_V3_FACTORY, [(WETH, USDC), (DAI, WETH)], [500, 3000]
+    )
+
+    assert addresses == [
+        [
+            "0x88e6A0c2dDD26FEEb64F039a2c41296FcB3f5640",
+            "0x8ad599c3A0ff1De082011EFDDc58f1908eb6e6D8",
+        ],
+        [
+            "0x60594a405d53811d3BC4766596EFD80fd545A270",
+            "0xC2e9F25Be6257c210d7Adf0D4Cd6E3E881ba25f8",
+        ],
+    ]
+
+
+def test_malformed_inputs_raise() -> None:
+    for token in (WETH[2:], "0x1234", WETH + "00", "0x" + "zz" * 20):
+        with pytest.raises(ValueError):
+            compute_pool_address(UNISWAP_V3_FACTORY, token, USDC, 500)
+    with pytest.raises(ValueError):
+        compute_pool_address(UNISWAP_V3_FACTORY[2:], WETH, USDC, 500)
+    with pytest.raises(ValueError):
+        compute_pool_address(UNISWAP_V3_FACTORY, WETH, USDC, 500, "0x1234")
+    with pytest.raises(ValueError):
+        compute_pool_addresses(UNISWAP_V3_FACTORY, [(WETH, "0x1234")], [500])
+    with pytest.raises(ValueError):
+        compute_pool_address(UNISWAP_V3_FACTORY, WETH, USDC, 2**24)
@@ -0,0 +1,81 @@
+"""Tests for the Uniswap V3 pool event log decoder."""
+
+import eth_abi
+
+from uniswap_calls.events import BURN, SWAP, decode_pool_logs
+
+OWNER: str = "0x9a33c2fe2515b87ee5c36819d82126e1e66273c6"
+ROUTER: str = "0xe592427a0aece92de3edee1f18e0157c05861564"
+
+
+def _topic(type_: str, value: object) -> str:
+    return "0x" + eth_abi.encode([type_], [value]).hex()
+
+
+def _swap_log(amount0: int, sqrt_price_x96: int, tick: int) -> dict:
+    data = eth_abi.encode(
+        ["int256", "int256", "uint160", "uint128", "int24"],
+        [amount0, -amount0 * 2, sqrt_price_x96, 10**20, tick],
+    )
+    return {
+        "topics": [SWAP.topic0, _topic("address", ROUTER), _topic("address", OWNER)],
+        "data": "0x" + data.hex(),
+    }
+
+
+def test_decode_pool_logs() -> None:
+    assert SWAP.topic0.hex() == (
+        "c42079f94a6350d7e6235f29174924f928cc2ac818eb64fed8004e115fbcca67"
+    )
+
+    burn_data = eth_abi.encode(["uint128", "uint256", "uint256"], [5000, 7, 8])
+    logs = [
+        {**_swap_log(10**18, 2**96, -5), "logIndex": 0},
+        # Unknown event: skipped
+        {"topics": ["0x" + "00" * 32], "data": "0x"},
+        (
+            [
+                BURN.topic0,
+                _topic("address", OWNER),
+                _topic("int24", -887220),
+                _topic("int24", 887220),
+            ],
+            burn_data,
+        ),
+        {**_swap_log(-3, 2**160 - 1, 887271), "logIndex": 3},
+    ]
+
+    columns = decode_pool_logs(logs)
+
+    swaps = columns["Swap"]
+    assert list(swaps["row"]) == [0, 3]
+    assert "log_index" in swaps and list(swaps["log_index"]) == [0, 3]
+    assert list(swaps["tick"]) == [-5, 887271]
+    assert list(swaps["amount0"]) == [10**18, -3]
+    assert list(swaps["amount1"]) == [-2 * 10**18, 6]
+    assert list(swaps["sqrt_price_x96"]) == [2**96, 2**160 - 1]
+    assert list(swaps["recipient"]) == [OWNER, OWNER]
+
+    burns = columns["Burn"]
+    assert list(burns["row"]) == [2]
+    # The burn is a (topics, data) pair without logIndex
+    assert "log_index" not in burns
+    assert list(burns["tick_lower"]) == [-887220]
+    assert list(burns["tick_upper"]) == [887220]
+    assert list(burns["amount"]) == [5000]
+
+    assert len(columns["Mint"]["row"]) == 0
+    assert len(columns["Collect"]["amount0"]) == 0
+
+
+def test_decode_pool_logs_log_index() -> None:
+    logs = [
+        {**_swap_log(1, 2**96, 0), "logIndex": "0x1a"},
+        {"topics": ["0x" + "00" * 32], "data": "0x"},
+        {**_swap_log(2, 2**96, 1), "logIndex": 31},
+    ]
+
+    swaps = decode_pool_logs(logs)["Swap"]
+
+    assert list(swaps["row"]) == [0, 2]
+    assert list(swaps["log_index"]) == [26, 31]
@@ -0,0 +1,43 @@
+"""Tests for the Uniswap V3 mint callback data encoder."""
+
+import eth_abi
+
+from uniswap_calls.callback import encode_mint_callback_data
+from uniswap_calls.pool import encode_mint
+
+USDC: str = "0xA0b86991c6218b36c1d19D4a2e9Eb0cE3606eB48"
+WETH: str = "0xC02aaA39b223FE8D0A0e5C4F27eAD9083C756Cc2"
+PAYER: str = "0x9a33c2fe2515b87ee5c36819d82126e1e66273c6"
+
+
+def test_encode_mint_callback_data() -> None:
+    """MintCallbackData({poolKey: PoolKey(token0, token1, fee), payer})."""
+    data: bytes = encode_mint_callback_data(
+        token0=WETH, token1=USDC, fee=500, payer=PAYER
+    )
+
+    # Tokens are sorted like PoolAddress.getPoolKey
+    expected_data: bytes = eth_abi.encode(
+        ["((address,address,uint24),address)"], [((USDC, WETH, 500), PAYER)]
+    )
+    assert data == expected_data, f"Expected {expected_data!r}, got {data!r}"
+
+    # Same pool key and payer: the cached payload is reused
+    assert encode_mint_callback_data(USDC.lower(), WETH, 500, PAYER.upper()) is data
+
+
+def test_pool_encode_mint_with_callback_data() -> None:
+    data: bytes = encode_mint_callback_data(USDC, WETH, 500, PAYER)
+
+    encoded_call: str = encode_mint(
+        owner=PAYER, tick_lower=-600, tick_upper=600, liquidity=10**18, data=data
+    )
+
+    assert encoded_call == encode_mint(
+        owner=PAYER,
+        tick_lower=-600,
+        tick_upper=600,
+        liquidity=10**18,
+        data="0x" + data.hex(),
+    )
+    assert encoded_call.endswith(data.hex())
@@ -0,0 +1,60 @@
+"""Tests for the Uniswap V3 pool function encoders."""
+
+import eth_abi
+import pytest
+from eth_utils import keccak
+
+from uniswap_calls.pool import encode_burn, encode_collect, encode_mint
+from validation import ArgumentValidationError
+
+OWNER: str = "0x742d35cc6634c0532925a3b8d03c8c0b6b1a2b68"
+
+
+def _expected(signature: str, types: list, args: list) -> str:
+    selector = keccak(text=signature)[:4]
+    return f"0x{(selector + eth_abi.encode(types, args)).hex()}"
+
+
+def test_encode_pool_mint() -> None:
+    data = bytes.fromhex("00" * 31 + "01")
+    expected = _expected(
+        "mint(address,int24,int24,uint128,bytes)",
+        ["address", "int24", "int24", "uint128", "bytes"],
+        [OWNER, -887220, 887220, 10**18, data],
+    )
+
+    assert encode_mint(OWNER, -887220, 887220, 10**18, data) == expected
+    assert expected.startswith("0x3c8a7d8d")
+    # Callback data is also accepted as a hex string
+    assert encode_mint(OWNER, -887220, 887220, 10**18, f"0x{data.hex()}") == expected
+
+
+def test_encode_pool_burn() -> None:
+    expected = _expected(
+        "burn(int24,int24,uint128)", ["int24", "int24", "uint128"], [-600, 600, 12345]
+    )
+
+    assert encode_burn(-600, 600, 12345) == expected
+    assert expected.startswith("0xa34123a7")
+    with pytest.raises(ArgumentValidationError):
+        encode_burn(-887273, 600, 12345)
+
+
+def test_encode_pool_collect() -> None:
+    max_uint128 = 2**128 - 1
+    expected = _expected(
+        "collect(address,int24,int24,uint128,uint128)",
+        ["address", "int24", "int24", "uint128", "uint128"],
+        [OWNER, -60, 60, max_uint128, 0],
+    )
+
+    encoded = encode_collect(
+        recipient=OWNER,
+        tickLower=-60,
+        tickUpper=60,
+        amount0Requested=max_uint128,
+        amount1Requested=0,
+    )
+
+    assert encoded == expected
+    assert expected.startswith("0x4f1eb3d8")
@@ -0,0 +1,108 @@
+"""Tests for the Universal Router command planner."""
+
+import eth_abi
+import pytest
+
+from uniswap_calls.universal_router import (
+    ADDRESS_THIS,
+    CONTRACT_BALANCE,
+    MSG_SENDER,
+    PERMIT_SINGLE_TYPE,
+    Command,
+    RoutePlanner,
+    encode_execute,
+    encode_v3_path,
+)
+from validation import ArgumentValidationError
+
+USDC: str = "0xA0b86991c6218b36c1d19D4a2e9Eb0cE3606eB48"
+WETH: str = "0xC02aaA39b223FE8D0A0e5C4F27eAD9083C756Cc2"
+DAI: str = "0x6B175474E89094C44Da98b954EedeAC495271d0F"
+ROUTER: str = "0x3fc91a3afd70395cd496c647d5a6cc9d4b2b7fad"
+
+
+def test_encode_v3_path() -> None:
+    path = encode_v3_path([USDC, WETH, DAI], [500, 3000])
+
+    assert path.hex() == (
+        "a0b86991c6218b36c1d19d4a2e9eb0ce3606eb48"
+        "0001f4"
+        "c02aaa39b223fe8d0a0e5c4f27ead9083c756cc2"
+        "000bb8"
+        "6b175474e89094c44da98b954eedeac495271d0f"
+    )
+    # Cached: the same route gives the same bytes object
+    assert encode_v3_path([USDC.lower(), WETH, DAI], [500, 3000]) is path
+    assert encode_v3_path([DAI, WETH, USDC], [3000, 500]) == encode_v3_path(
+        [USDC, WETH, DAI], [500, 3000], exact_output=True
+    )
+    with pytest.raises(ValueError):
+        encode_v3_path([USDC, WETH], [500, 3000])
+
+
+def test_route_planner_encode_execute() -> None:
+    path = encode_v3_path([WETH, USDC], [500])
+    permit = ((USDC, 2**160 - 1, 1748600000, 0), ROUTER, 1748593204)
+    planner = (
+        RoutePlanner()
+        .permit2_permit(permit, b"\x01" * 65)
+        .wrap_eth(ADDRESS_THIS, 10**18)
+        .v3_swap_exact_in(MSG_SENDER, 10**18, 2500 * 10**6, path, payer_is_user=False)
+        .v2_swap_exact_out(MSG_SENDER, 10**18, 2**256 - 1, [USDC, DAI])
+        .sweep(USDC, MSG_SENDER, 0, allow_revert=True)
+        .unwrap_weth(MSG_SENDER, CONTRACT_BALANCE)
+    )
+
+    calldata = planner.encode_execute(deadline=1748593204)
+
+    assert calldata[:10] == "0x3593564c"
+    commands, inputs, deadline = eth_abi.decode(
+        ["bytes", "bytes[]", "uint256"], bytes.fromhex(calldata[10:])
+    )
+    assert commands == bytes([0x0A, 0x0B, 0x00, 0x09, 0x84, 0x0C])
+    assert deadline == 1748593204
+    assert list(inputs) == [
+        eth_abi.encode([PERMIT_SINGLE_TYPE, "bytes"], [permit, b"\x01" * 65]),
+        eth_abi.encode(["address", "uint256"], [ADDRESS_THIS, 10**18]),
+        eth_abi.encode(
+            ["address", "uint256", "uint256", "bytes", "bool"],
+            [MSG_SENDER, 10**18, 2500 * 10**6, path, False],
+        ),
+        eth_abi.encode(
+            ["address", "uint256", "uint256", "address[]", "bool"],
+            [MSG_SENDER, 10**18, 2**256 - 1, [USDC, DAI], True],
+        ),
+        eth_abi.encode(["address", "address", "uint256"], [USDC, MSG_SENDER, 0]),
+        eth_abi.encode(["address", "uint256"], [MSG_SENDER, CONTRACT_BALANCE]),
+    ]
+
+
+def test_route_planner_validates_inputs() -> None:
+    planner = RoutePlanner()
+
+    with pytest.raises(ArgumentValidationError, match="amount"):
+        planner.permit2_transfer_from(USDC, ROUTER, 2**160)
+    with pytest.raises(ValueError, match="Unsupported command"):
+        planner.add_command(0x07, USDC)
+    planner.add_command(Command.PAY_PORTION, USDC, ROUTER, 25)
+    assert len(planner) == 1
+
+    with pytest.raises(ArgumentValidationError, match="deadline"):
+        planner.encode_execute(deadline=-1)
+    inputs = [eth_abi.encode(["address", "address", "uint256"], [USDC, ROUTER, 25])]
+    assert planner.encode_execute(1748593204) == encode_execute(
+        bytes([Command.PAY_PORTION]), inputs, 1748593204
+    )
+
+
+def test_route_planner_converts_inputs() -> None:
+    # Decimal strings pass validation, so they are converted like in encode_call
+    planner = RoutePlanner().wrap_eth(ADDRESS_THIS, "100")
+    expected = RoutePlanner().wrap_eth(ADDRESS_THIS, 100)
+
+    assert planner.inputs == expected.inputs
+    assert planner.encode_execute("1748593204") == expected.encode_execute(1748593204)
+    with pytest.raises(ValueError, match="takes 2 input"):
+        RoutePlanner().wrap_eth(ADDRESS_THIS, 1).add_command(
+            Command.WRAP_ETH, ADDRESS_THIS, trusted=True
+        )
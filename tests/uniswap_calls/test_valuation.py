@@ -0,0 +1,186 @@
+"""Tests for the liquidity math and the incremental position valuation engine."""
+
+import random
+
+import pytest
+
+from uniswap_calls.liquidity_math import (
+    MAX_SQRT_RATIO,
+    MIN_SQRT_RATIO,
+    Q96,
+    get_amounts_for_liquidity,
+    get_liquidity_for_amounts,
+    get_sqrt_ratio_at_tick,
+)
+from uniswap_calls.position_manager import encode_decreaseLiquidity, encode_mint
+from uniswap_calls.valuation import (
+    ABOVE_RANGE,
+    BELOW_RANGE,
+    ENTERED_RANGE,
+    EXITED_ABOVE,
+    EXITED_BELOW,
+    IN_RANGE,
+    Position,
+    ValuationEngine,
+)
+
+TOKEN0: str = "0x1c7d4b196cb0c7b01d743fbc6116a902379c7238"
+TOKEN1: str = "0xfff9976782d46cc05630d1f6ebab18b2324d6b14"
+RECIPIENT: str = "0x0000000000000000000000000000000000000001"
+
+
+def test_get_sqrt_ratio_at_tick() -> None:
+    assert get_sqrt_ratio_at_tick(-887272) == MIN_SQRT_RATIO
+    assert get_sqrt_ratio_at_tick(887272) == MAX_SQRT_RATIO
+    assert get_sqrt_ratio_at_tick(0) == Q96
+    assert get_sqrt_ratio_at_tick(1) == 79232123823359799118286999568
+    assert get_sqrt_ratio_at_tick(-1) == 79224201403219477170569942574
+    with pytest.raises(ValueError):
+        get_sqrt_ratio_at_tick(887273)
+
+
+def test_amounts_round_trip() -> None:
+    sqrt_lower = get_sqrt_ratio_at_tick(-600)
+    sqrt_upper = get_sqrt_ratio_at_tick(600)
+
+    amount0, amount1 = get_amounts_for_liquidity(Q96, sqrt_lower, sqrt_upper, 10**18)
+    liquidity = get_liquidity_for_amounts(Q96, sqrt_lower, sqrt_upper, amount0, amount1)
+
+    assert amount0 > 0 and amount1 > 0
+    # The Solidity rounding (down) is kept
+    assert 10**18 - 100 <= liquidity <= 10**18
+    assert get_amounts_for_liquidity(sqrt_lower, sqrt_lower, sqrt_upper, 10**18)[1] == 0
+    assert get_amounts_for_liquidity(sqrt_upper, sqrt_lower, sqrt_upper, 10**18)[0] == 0
+
+
+def _positions(count: int, seed: int = 7) -> list:
+    rng = random.Random(seed)
+    positions = []
+    for token_id in range(1, count + 1):
+        tick_lower = rng.randrange(-3000, 3000, 60)
+        width = rng.randrange(60, 1200, 60)
+        liquidity = rng.randrange(10**15, 10**19)
+        positions.append(
+            Position(
+                token_id,
+                tick_lower,
+                tick_lower + width,
+                liquidity,
+                TOKEN0,
+                TOKEN1,
+                3000,
+            )
+        )
+    return positions
+
+
+def test_incremental_matches_full_revaluation() -> None:
+    positions = _positions(300)
+    engine = ValuationEngine(positions, Q96)
+    rng = random.Random(11)
+    tick = 0
+
+    for _ in range(200):
+        tick += rng.randrange(-150, 151)
+        price = get_sqrt_ratio_at_tick(tick) + rng.randrange(0, 1000)
+        triggers = engine.update(price)
+
+        expected = {
+            position.token_id: get_amounts_for_liquidity(
+                price,
+                get_sqrt_ratio_at_tick(position.tick_lower),
+                get_sqrt_ratio_at_tick(position.tick_upper),
+                position.liquidity,
+            )
+            for position in positions
+        }
+        for token_id, amounts in expected.items():
+            assert engine.amounts(token_id) == amounts
+        assert engine.totals() == (
+            sum(amount0 for amount0, _ in expected.values()),
+            sum(amount1 for _, amount1 in expected.values()),
+        )
+        assert engine.last_revalued < len(positions)
+        for trigger in triggers:
+            assert trigger.status == engine.status(trigger.token_id)
+            assert trigger.status != trigger.previous_status
+
+
+def test_triggers() -> None:
+    engine = ValuationEngine(
+        [Position(1, -60, 60, 10**18), Position(2, 600, 1200, 10**18)]
+    )
+
+    assert engine.update(Q96) == []
+    assert engine.in_range() == [1]
+
+    triggers = engine.update(get_sqrt_ratio_at_tick(900))
+    assert [(t.token_id, t.kind) for t in triggers] == [
+        (1, EXITED_ABOVE),
+        (2, ENTERED_RANGE),
+    ]
+    assert triggers[0].previous_status == IN_RANGE
+    assert triggers[0].amount0 == 0 and triggers[0].exited
+    assert not triggers[1].exited
+
+    # Moving inside the segment revalues the position in range only
+    assert engine.update(get_sqrt_ratio_at_tick(950)) == []
+    assert engine.last_revalued == 1
+
+    triggers = engine.update(get_sqrt_ratio_at_tick(-100))
+    assert [(t.token_id, t.kind) for t in triggers] == [
+        (1, EXITED_BELOW),
+        (2, EXITED_BELOW),
+    ]
+    assert engine.status(1) == BELOW_RANGE
+    assert engine.update(get_sqrt_ratio_at_tick(2000))[0].status == ABOVE_RANGE
+
+
+def test_add_and_remove_positions() -> None:
+    engine = ValuationEngine(sqrt_price_x96=Q96)
+    engine.add_position(Position(1, -60, 60, 10**18))
+    engine.add_position(Position(2, -60, 120, 10**18))
+
+    assert len(engine) == 2
+    total0, total1 = engine.totals()
+    assert total0 == engine.amounts(1)[0] + engine.amounts(2)[0]
+
+    engine.remove_position(2)
+    assert 2 not in engine
+    assert engine.totals() == engine.amounts(1)
+    # The shared lower boundary stays indexed for the remaining position
+    assert engine.update(get_sqrt_ratio_at_tick(-61))[0].kind == EXITED_BELOW
+
+    with pytest.raises(ValueError):
+        engine.add_position(Position(3, 60, 60, 1))
+
+
+def test_trigger_args_encode() -> None:
+    columns = {
+        "token_id": [1],
+        "tick_lower": [-60],
+        "tick_upper": [60],
+        "liquidity": [10**18],
+        "token0": [TOKEN0],
+        "token1": [TOKEN1],
+        "fee": [3000],
+        "nonce": [0],
+    }
+    engine = ValuationEngine.from_columns(columns, Q96)
+    (trigger,) = engine.update(get_sqrt_ratio_at_tick(100))
+
+    decrease = trigger.decrease_liquidity_args(deadline=1640995200, slippage_bps=50)
+    assert decrease["liquidity"] == 10**18
+    assert decrease["amount0_min"] == 0
+    assert decrease["amount1_min"] == trigger.amount1 * 9950 // 10000
+    assert encode_decreaseLiquidity(**decrease).startswith("0x0c49ccbe")
+
+    # The position holds token1 only, so the new range sits below the price
+    mint = trigger.mint_args(-180, 60, RECIPIENT, deadline=1640995200, slippage_bps=50)
+    assert mint["amount1_desired"] == trigger.amount1
+    assert mint["amount0_min"] == 0
+    assert 0 < mint["amount1_min"] <= trigger.amount1
+    assert encode_mint(**mint).startswith("0x88316456")
+
+    with pytest.raises(ValueError):
+        trigger.decrease_liquidity_args(deadline=0, slippage_bps=10_001)
@@ -0,0 +1,124 @@
+"""Tests for the Uniswap V3 view function encoders and return data decoders."""
+
+import eth_abi
+
+from abi_decoder import rows_from_columns
+from uniswap_calls.position_manager import encode_decreaseLiquidity
+from uniswap_calls.valuation import ValuationEngine
+from uniswap_calls.views import (
+    decode_positions,
+    decode_positions_batch,
+    decode_slot0,
+    decode_slot0_batch,
+    encode_positions,
+    encode_slot0,
+)
+
+TOKEN0: str = "0x1c7d4b196cb0c7b01d743fbc6116a902379c7238"
+TOKEN1: str = "0xfff9976782d46cc05630d1f6ebab18b2324d6b14"
+POSITIONS_TYPES = [
+    "uint96",
+    "address",
+    "address",
+    "address",
+    "uint24",
+    "int24",
+    "int24",
+    "uint128",
+    "uint256",
+    "uint256",
+    "uint128",
+    "uint128",
+]
+SLOT0_TYPES = ["uint160", "int24", "uint16", "uint16", "uint16", "uint8", "bool"]
+
+
+def _positions_blob(tick_lower: int, liquidity: int) -> bytes:
+    values = [0, "0x" + "00" * 20, TOKEN0, TOKEN1, 100, tick_lower, tick_lower + 60]
+    values += [liquidity, 2**255, 1, 2, 3]
+    return eth_abi.encode(POSITIONS_TYPES, values)
+
+
+def test_encode_view_calls() -> None:
+    assert encode_positions(token_id=198395) == (
+        "0x99fbab8800000000000000000000000000000000000000000000000000000000000306fb"
+    )
+    assert encode_slot0() == "0x3850c7bd"
+
+
+def test_decode_positions() -> None:
+    position = decode_positions("0x" + _positions_blob(-120, 10**18).hex())
+
+    assert position["token0"] == TOKEN0
+    assert position["token1"] == TOKEN1
+    assert (position["tick_lower"], position["tick_upper"]) == (-120, -60)
+    assert position["liquidity"] == 10**18
+    assert position["fee_growth_inside0_last_x128"] == 2**255
+
+
+def test_decode_positions_batch_feeds_encoders() -> None:
+    blobs = [_positions_blob(-887220, 2**128 - 1), _positions_blob(600, 5)]
+
+    positions = decode_positions_batch(blobs, token_ids=[7, 8])
+
+    assert list(positions["tick_lower"]) == [-887220, 600]
+    assert list(positions["liquidity"]) == [2**128 - 1, 5]
+    calls = [
+        encode_decreaseLiquidity(**kwargs)
+        for kwargs in rows_from_columns(
+            positions,
+            ["token_id", "liquidity"],
+            amount0_min=0,
+            amount1_min=0,
+            deadline=1748593204,
+        )
+    ]
+    assert calls == [
+        encode_decreaseLiquidity(7, 2**128 - 1, 0, 0, 1748593204),
+        encode_decreaseLiquidity(8, 5, 0, 0, 1748593204),
+    ]
+
+    # Failed reads are skipped rather than turned into liquidity=0 calls
+    positions = decode_positions_batch(
+        blobs + [b""], token_ids=[7, 8, 9], success=[True, False, True]
+    )
+    rows = list(rows_from_columns(positions, ["token_id", "liquidity"]))
+    assert rows == [{"token_id": 7, "liquidity": 2**128 - 1}]
+
+
+def test_decode_slot0() -> None:
+    blob = eth_abi.encode(SLOT0_TYPES, [2**96, -201234, 1, 2, 3, 0, True])
+
+    assert decode_slot0(blob) == {
+        "sqrt_price_x96": 2**96,
+        "tick": -201234,
+        "observation_index": 1,
+        "observation_cardinality": 2,
+        "observation_cardinality_next": 3,
+        "fee_protocol": 0,
+        "unlocked": True,
+    }
+    slot0 = decode_slot0_batch([blob, blob], pools=["0xpool0", "0xpool1"])
+    assert list(slot0["tick"]) == [-201234, -201234]
+    assert slot0["pool"] == ["0xpool0", "0xpool1"]
+
+
+def test_batch_decoders_mask_failed_calls() -> None:
+    blob = eth_abi.encode(SLOT0_TYPES, [2**96, -201234, 1, 2, 3, 0, True])
+
+    # Multicall3 reports failed calls with empty return data
+    slot0 = decode_slot0_batch([blob, b"", blob])
+    assert list(slot0["success"]) == [True, False, True]
+    assert list(slot0["tick"]) == [-201234, 0, -201234]
+
+    slot0 = decode_slot0_batch([blob, blob], success=[True, False])
+    assert list(slot0["success"]) == [True, False]
+    assert list(slot0["sqrt_price_x96"]) == [2**96, 0]
+
+    positions = decode_positions_batch(
+        [_positions_blob(-120, 5), b"\x08\xc3\x79\xa2"],
+        token_ids=[1, 2],
+        success=[True, False],
+    )
+    assert list(positions["success"]) == [True, False]
+    assert len(ValuationEngine.from_columns(positions, 2**96)) == 1